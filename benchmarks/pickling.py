@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""Compares the size and round-trip time of pickling models with
+`Model.__reduce__` against the default pickling of the instance
+`__dict__`, which includes the `_data` dict keyed by the fields.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python benchmarks/pickling.py
+
+"""
+
+import timeit
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from booby import fields, models
+
+NUMBER = 2000
+
+
+class Token(models.Model):
+    key = fields.String()
+    secret = fields.String()
+
+
+class User(models.Model):
+    login = fields.String(required=True)
+    name = fields.String()
+    email = fields.Email()
+    role = fields.String(choices=['admin', 'user'])
+    karma = fields.Integer(default=0)
+    token = fields.Embedded(Token)
+    tokens = fields.Collection(Token)
+
+
+class LegacyToken(Token):
+    __reduce__ = object.__reduce__
+
+
+class LegacyUser(User):
+    __reduce__ = object.__reduce__
+
+    token = fields.Embedded(LegacyToken)
+    tokens = fields.Collection(LegacyToken)
+
+
+def build(user_class, token_class):
+    return user_class(
+        login='jack', name='Jack', email='jack@example.com', role='user',
+        token=token_class(key='a', secret='b'),
+        tokens=[token_class(key=str(i), secret=str(i)) for i in range(5)])
+
+
+def measure(name, instance):
+    protocol = pickle.HIGHEST_PROTOCOL
+    size = len(pickle.dumps(instance, protocol))
+    seconds = timeit.timeit(
+        lambda: pickle.loads(pickle.dumps(instance, protocol)), number=NUMBER)
+
+    print('{:<10} {:>8} bytes {:>10.1f} us/round-trip'.format(
+        name, size, seconds / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    measure('default', build(LegacyUser, LegacyToken))
+    measure('reduce', build(User, Token))
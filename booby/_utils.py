@@ -17,3 +17,53 @@
 
 def repr_options(options):
     return ', '.join('{}={!r}'.format(k, v) for k, v in options.items())
+
+
+def defining_class(cls, name):
+    """Returns the class in the `cls` MRO defining the attribute `name`,
+    or :keyword:`None` if none does.
+
+    """
+
+    for klass in getattr(cls, '__mro__', (cls,)):
+        if name in vars(klass):
+            return klass
+
+    return None
+
+
+def validates_many(obj):
+    """Returns `True` if the `validate_many` method of the given validator
+    or field `obj` can be used instead of calling it for each value: it is
+    defined in the same class as its `validate` and `__call__` methods, or
+    in a subclass of them.
+
+    """
+
+    return _batches(obj, 'validate_many', ('validate', '__call__'))
+
+
+def encodes_many(obj):
+    """Returns `True` if the `encode_many` method of the given encoder
+    `obj` can be used instead of calling it for each value, like
+    :func:`validates_many`.
+
+    """
+
+    return _batches(obj, 'encode_many', ('encode', '__call__'))
+
+
+def _batches(obj, batch, singles):
+    cls = type(obj)
+    owner = defining_class(cls, batch)
+
+    if owner is None:
+        return False
+
+    for name in singles:
+        other = defining_class(cls, name)
+
+        if other is not None and not issubclass(owner, other):
+            return False
+
+    return True
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`arrays` module contains the :class:`ModelArray`, a columnar
+container for large collections of flat models, backed by
+`NumPy <http://www.numpy.org>`_ arrays.
+
+NumPy is an optional dependency of Booby and has to be installed to use
+this module.
+
+Example::
+
+    class Sample(Model):
+        sensor = fields.String()
+        value = fields.Float()
+
+    samples = ModelArray(Sample, [Sample(sensor='a', value=1.5), ...])
+
+    high = samples[samples['value'] > 1.0].sort('value')
+    mean = high.aggregate('value', 'mean')
+    first = high[0]
+
+"""
+
+import collections
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from booby import fields
+
+# Values are stored in native columns only if they are exactly of these
+# types, so `bool` values in `Integer` columns and columns mixing text
+# and byte strings aren't converted.
+_KINDS = (
+    (fields.Boolean, (bool,), 'bool'),
+    (fields.Integer, (int, long), 'int64'),
+    (fields.Float, (float,), 'float64'),
+    (fields.String, (unicode,), 'U'),
+    (fields.String, (bytes,), 'S')
+)
+
+_AGGREGATES = ('sum', 'mean', 'min', 'max', 'std', 'median')
+
+
+class ModelArray(object):
+    """A sequence of instances of a single `model` class stored column by
+    column, each field as a NumPy array.
+
+    `Boolean`, `Integer`, `Float` and `String` fields are stored in
+    arrays of their native NumPy type, of text or byte strings for
+    `String` fields. `Enum` fields are stored as the index of each value
+    in the field `choices`, in an unsigned integer array, so their
+    columns are compared with indexes::
+
+        done = tasks['status'] == Task.status.indexes['done']
+
+    Columns of any other field, or with `None` or mistyped values, are
+    stored as `object` arrays, like `String` columns mixing text and byte
+    strings and `Integer` columns with `bool` values, so values are
+    returned with the type they were given.
+
+    Indexing the array with an integer materializes a new `model`
+    instance, with a field name returns the field column and with a
+    slice, a boolean mask or an array of indices returns a new
+    :class:`ModelArray`.
+
+    :param model: The :class:`models.Model` subclass of the items.
+    :param items: An iterable of `model` instances or mappings of field
+        values.
+
+    """
+
+    def __init__(self, model, items=()):
+        if numpy is None:
+            raise ImportError('ModelArray requires numpy to be installed')
+
+        items = [model(**item) if isinstance(item, collections.Mapping)
+                 else item for item in items]
+
+        self.model = model
+        self._length = len(items)
+        self._columns = dict(
+            (name, _column(field, [getattr(item, name) for item in items]))
+            for name, field in model._fields.items())
+
+    @classmethod
+    def from_collection(cls, instance, name):
+        """Returns a :class:`ModelArray` with the models in the
+        :class:`fields.Collection` field `name` of the given `instance`.
+
+        """
+
+        return cls(instance._fields[name].model, getattr(instance, name))
+
+    @classmethod
+    def _from_columns(cls, model, columns):
+        array = cls.__new__(cls)
+        array.model = model
+        array._columns = columns
+        array._length = len(next(iter(columns.values()))) if columns else 0
+
+        return array
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._materialize(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, basestring):
+            return self._columns[key]
+
+        if isinstance(key, (int, long, numpy.integer)):
+            if key < 0:
+                key += self._length
+
+            if not 0 <= key < self._length:
+                raise IndexError('ModelArray index out of range')
+
+            return self._materialize(key)
+
+        return self._from_columns(self.model, dict(
+            (name, column[key]) for name, column in self._columns.items()))
+
+    def __repr__(self):
+        cls = type(self)
+
+        return '<{}.{}({}, length={})>'.format(
+            cls.__module__, cls.__name__, self.model.__name__, self._length)
+
+    def _materialize(self, i):
+        return self.model(**dict(
+            (name, _value(self.model._fields[name], column, i))
+            for name, column in self._columns.items()))
+
+    def filter(self, mask):
+        """Returns a new :class:`ModelArray` with the items where the given
+        boolean `mask` is `True`. The `mask` is usually built from
+        vectorized comparisons of the columns::
+
+            adults = people.filter((people['age'] >= 18) & people['active'])
+
+        """
+
+        return self[numpy.asarray(mask, dtype=bool)]
+
+    def sort(self, by, reverse=False):
+        """Returns a new :class:`ModelArray` sorted by the given field
+        name or list of field names. The sort is stable.
+
+        """
+
+        if isinstance(by, basestring):
+            order = numpy.argsort(self._columns[by], kind='mergesort')
+        else:
+            order = numpy.lexsort(
+                [self._columns[name] for name in reversed(by)])
+
+        if reverse:
+            order = order[::-1]
+
+        return self[order]
+
+    def aggregate(self, name, function):
+        """Returns the result of applying the given `function` to the
+        `name` field column. The `function` can be any callable receiving
+        a NumPy array or the name of one of the builtin aggregations:
+        `sum`, `mean`, `min`, `max`, `std` or `median`.
+
+        """
+
+        column = self._columns[name]
+
+        if isinstance(function, basestring):
+            if function not in _AGGREGATES:
+                raise ValueError('unknown aggregate {!r}'.format(function))
+
+            function = getattr(numpy, function)
+
+        result = function(column)
+
+        if isinstance(result, numpy.generic):
+            return result.item()
+
+        return result
+
+    def to_models(self):
+        """Returns a `list` with a `model` instance for each item. The
+        list can be assigned to a :class:`fields.Collection` field.
+
+        """
+
+        return list(self)
+
+
+def _column(field, values):
+    if type(field) is fields.Enum:
+        return _enum_column(field, values)
+
+    for types, dtype in _kinds_for(field):
+        if all(type(value) in types for value in values):
+            if dtype in ('U', 'S') and any(
+                    value[-1:] in (u'\0', b'\0') for value in values):
+                # NumPy strips trailing NUL characters from strings
+                break
+
+            try:
+                return numpy.array(values, dtype=dtype)
+            except OverflowError:
+                break
+
+    return _objects(values)
+
+
+def _objects(values):
+    column = numpy.empty(len(values), dtype=object)
+
+    for i, value in enumerate(values):
+        column[i] = value
+
+    return column
+
+
+def _enum_column(field, values):
+    indexes = field.indexes
+
+    try:
+        result = [indexes[value] for value in values]
+    except (KeyError, TypeError):
+        return _objects(values)
+
+    return numpy.array(result, dtype=_index_dtype(len(field.choices)))
+
+
+def _index_dtype(size):
+    if size <= 1 << 8:
+        return 'uint8'
+
+    if size <= 1 << 16:
+        return 'uint16'
+
+    return 'uint32'
+
+
+def _value(field, column, i):
+    value = column.item(i)
+
+    if column.dtype.kind == 'u' and type(field) is fields.Enum:
+        return field.choices[value]
+
+    return value
+
+
+def _kinds_for(field):
+    return [(types, dtype) for field_class, types, dtype in _KINDS
+            if type(field) is field_class]
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`batch` module contains the functions used to work with
+large sets of records of a single :class:`models.Model` class.
+
+Records can also be processed in parallel, in a pool of processes, with
+:func:`process_many`. It requires the :mod:`concurrent.futures` module,
+available in the `futures` package for Python 2.
+
+"""
+
+import itertools
+import collections
+import multiprocessing
+
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
+from booby import compiler, errors, _utils
+
+ON_ERROR = ('raise', 'skip', 'collect')
+
+
+def decode_many(model, raws, on_error='raise', failures=None,
+                validate=False):
+    """Returns a generator of `model` instances decoded from the given
+    iterable of `raw` mappings. Records are decoded one at a time, as the
+    generator is consumed, so memory usage doesn't depend on the number
+    of records.
+
+    :param model: The :class:`models.Model` subclass to decode records to.
+    :param raws: An iterable of `raw` mappings.
+    :param on_error: What to do when a record raises a
+        :class:`errors.BoobyError`. If `raise` the error is propagated, if
+        `skip` the record is discarded and if `collect` the record is
+        discarded and an `(index, raw, error)` tuple appended to
+        `failures`. Records that aren't mappings or whose values the
+        builtin field decoders can't handle raise
+        :class:`errors.DecodeError`. Errors raised by custom decoders are
+        propagated.
+    :param failures: A `list` where failing records are collected.
+    :param validate: If `True` each instance is also validated.
+
+    """
+
+    _check_on_error(on_error, failures)
+
+    return _decode_many(model, raws, on_error, failures, validate)
+
+
+def _check_on_error(on_error, failures):
+    if on_error not in ON_ERROR:
+        raise ValueError('on_error should be one of {}, not {!r}'.format(
+            ON_ERROR, on_error))
+
+    if on_error == 'collect' and failures is None:
+        raise ValueError("on_error 'collect' requires a failures list")
+
+
+def _decode_many(model, raws, on_error, failures, validate):
+    build = _builder_for(model)
+
+    for index, raw in enumerate(raws):
+        try:
+            instance = _decode_record(build, raw)
+
+            if validate:
+                instance.validate()
+        except errors.BoobyError as err:
+            if on_error == 'raise':
+                raise
+
+            if on_error == 'collect':
+                failures.append((index, raw, err))
+
+            continue
+
+        yield instance
+
+
+def _decode_record(decode, raw):
+    # Malformed records fail with a `DecodeError`, so they can be skipped
+    # or collected like any other failing record. The builtin decoders
+    # raise it too for values they can't handle, while errors raised by
+    # custom decoders are propagated.
+    if not isinstance(raw, collections.Mapping):
+        raise errors.DecodeError(
+            'record should be a mapping, not {}'.format(type(raw).__name__))
+
+    return decode(raw)
+
+
+def _builder_for(model):
+    plan = compiler.plan_for(model)
+
+    if plan is not None:
+        return plan.build
+
+    return lambda raw: model(**model.decode(raw))
+
+
+def process_many(model, raws, validate=False, encode=False, workers=None,
+                 chunk_size=1000, ordered=True, max_in_flight=None,
+                 on_error='raise', failures=None, executor=None):
+    """Returns a generator of the results of decoding, and optionally
+    validating and encoding again, the given iterable of `raw` mappings in
+    a pool of processes.
+
+    Records are sent to the workers in chunks of `chunk_size` and at most
+    `max_in_flight` chunks, by default twice the number of workers, are
+    pending at a time, so memory usage stays bounded however many
+    records are consumed. Each worker compiles the `model` plan once and
+    reuses it for all its chunks.
+
+    The `model` class has to be importable by the workers, so it must be
+    defined at the top level of a module.
+
+    :param model: The :class:`models.Model` subclass to decode records to.
+    :param raws: An iterable of `raw` mappings.
+    :param validate: If `True` each decoded record is also validated.
+    :param encode: If `True` the results are the records encoded again
+        with :func:`models.Model.encode` instead of `model` instances.
+    :param workers: The number of processes. Defaults to the number
+        of CPUs.
+    :param ordered: If `False` results are returned as chunks complete,
+        instead of in the order of `raws`.
+    :param on_error: What to do when a record raises a
+        :class:`errors.BoobyError`, see :func:`decode_many`. Collected
+        `failures` keep the index of the record in `raws`.
+    :param executor: A :mod:`concurrent.futures` executor to use instead
+        of a new process pool.
+
+    """
+
+    _check_on_error(on_error, failures)
+
+    if executor is None and futures is None:
+        raise ImportError(
+            'process_many requires the concurrent.futures module, '
+            'install the futures package')
+
+    workers = workers or multiprocessing.cpu_count()
+
+    return _process_many(
+        model, raws, validate, encode, workers, chunk_size, ordered,
+        max_in_flight or 2 * workers, on_error, failures, executor)
+
+
+def _process_many(model, raws, validate, encode, workers, chunk_size,
+                  ordered, max_in_flight, on_error, failures, executor):
+    if executor is None:
+        with futures.ProcessPoolExecutor(workers) as executor:
+            for result in _process_many(
+                    model, raws, validate, encode, workers, chunk_size,
+                    ordered, max_in_flight, on_error, failures, executor):
+                yield result
+
+        return
+
+    chunks = _chunks(raws, chunk_size)
+    build = model.from_dict
+
+    def submit(chunk):
+        start, records = chunk
+        return executor.submit(
+            _process_chunk, model, start, records, validate, encode)
+
+    submitted = collections.deque(
+        submit(chunk) for chunk in itertools.islice(chunks, max_in_flight))
+
+    while submitted:
+        if ordered:
+            future = submitted.popleft()
+        else:
+            future = _first_done(submitted)
+            submitted.remove(future)
+
+        results = future.result()
+
+        chunk = next(chunks, None)
+
+        if chunk is not None:
+            submitted.append(submit(chunk))
+
+        for index, result, raw, err in results:
+            if err is None:
+                yield result if encode else build(result)
+            elif on_error == 'raise':
+                raise err
+            elif on_error == 'collect':
+                failures.append((index, raw, err))
+
+
+def _chunks(raws, chunk_size):
+    raws = iter(raws)
+
+    for start in itertools.count(0, chunk_size):
+        chunk = list(itertools.islice(raws, chunk_size))
+
+        if not chunk:
+            return
+
+        yield start, chunk
+
+
+def _first_done(submitted):
+    for future in submitted:
+        if future.done():
+            return future
+
+    done, _ = futures.wait(submitted, return_when=futures.FIRST_COMPLETED)
+
+    return next(iter(done))
+
+
+def _process_chunk(model, start, raws, validate, encode):
+    # Runs in the workers. Returns an `(index, result, raw, error)` tuple
+    # per record, with the decoded `dict` or the encoded record as result
+    # and the raw record only if it failed.
+
+    results = []
+
+    for index, raw in enumerate(raws, start):
+        try:
+            result = _decode_record(model.decode, raw)
+
+            if validate or encode:
+                instance = model.from_dict(result)
+
+                if validate:
+                    instance.validate()
+
+                if encode:
+                    result = instance.encode()
+        except errors.BoobyError as err:
+            results.append((index, None, raw, err))
+        else:
+            results.append((index, result, None, None))
+
+    return results
+
+
+def validate_many(model, instances):
+    """Validates the given `model` instances field by field, running each
+    field validators over the whole column of values at once. Unlike
+    :func:`models.Model.validate` all the failing fields of every record
+    are reported.
+
+    If the `model` overrides :func:`models.Model.validate` it's called for
+    each record whose fields are valid, reporting its error under `None`.
+
+    Returns a :class:`BatchValidation` with the results.
+
+    :param model: The :class:`models.Model` subclass of the instances.
+    :param instances: An iterable of `model` instances.
+
+    """
+
+    instances = list(instances)
+    failures = {}
+    plan = compiler.plan_for(model)
+
+    for name, field in model._fields.items():
+        if plan is None:
+            column = [getattr(instance, name) for instance in instances]
+        else:
+            read = plan._readers[name]
+            column = [read(instance) for instance in instances]
+
+        for i, message in _column_validator(field)(column).items():
+            failures.setdefault(i, {})[name] = message
+
+    if compiler.overrides_validate(model):
+        for i, instance in enumerate(instances):
+            if i not in failures:
+                try:
+                    instance.validate()
+                except errors.ValidationError as err:
+                    failures[i] = {None: str(err)}
+
+    return BatchValidation(
+        [i not in failures for i in range(len(instances))], failures)
+
+
+class BatchValidation(object):
+    """The result of validating a batch of records with
+    :func:`validate_many`.
+
+    :ivar valid: A `list` with a boolean per record, `True` if the record
+        is valid.
+    :ivar errors: A `dict` mapping the positions of the invalid records
+        to `dicts` of field names and error messages. Errors raised by
+        the model `validate` method are under `None`.
+
+    """
+
+    def __init__(self, valid, errors):
+        self.valid = valid
+        self.errors = errors
+
+    @property
+    def is_valid(self):
+        """`True` if all the records are valid."""
+
+        return not self.errors
+
+    def __len__(self):
+        return len(self.valid)
+
+
+def _column_validator(field):
+    if _utils.validates_many(field):
+        return field.validate_many
+
+    return lambda values: _validate_each(field.validate, values)
+
+
+def _validate_each(validate, values):
+    result = {}
+
+    for i, value in enumerate(values):
+        try:
+            validate(value)
+        except errors.ValidationError as err:
+            result[i] = str(err)
+
+    return result
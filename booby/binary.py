@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`binary` module serializes models in a compact binary format
+driven by the model fields, for services that share the same model
+definitions::
+
+    data = binary.dumps(user)
+    user = binary.loads(User, data)
+
+Fields are written by position, in the compiled plan order, so no field
+names are sent. Each record starts with a varint bitmask of the fields
+that aren't :keyword:`None`, followed by their values, so fields set to
+:keyword:`None` are decoded as :keyword:`None` too:
+
+* `Integer` fields as zigzag varints.
+* `Float` fields as 8 bytes IEEE 754 doubles.
+* `Boolean` fields as a single byte.
+* `String` and `Email` fields as a varint length and UTF-8 bytes.
+* `Enum` fields as the varint index of their value.
+* `Embedded` fields as a nested record and `Collection` fields as a
+  varint count and that many nested records.
+* Any other field as its encoded value, see :func:`models.Model.encode`,
+  serialized as JSON and written as a string.
+
+Every document starts with a header with a fingerprint of the model
+schema, the names and kinds of its fields and those of the models it
+embeds, so readers with a different schema fail with a
+:class:`errors.DecodeError` instead of misreading the data.
+
+Unlike :func:`models.Model.encode`, `read_only` fields are included.
+
+"""
+
+import json
+import struct
+import hashlib
+import weakref
+
+from booby import compiler, errors, fields
+
+MAGIC = b'BBY'
+VERSION = 1
+
+_RECORD = 0
+_MANY = 1
+
+_HEADER_SIZE = len(MAGIC) + 2 + 8
+
+_DOUBLE = struct.Struct('<d')
+
+_INTEGER = 'i'
+_FLOAT = 'f'
+_BOOLEAN = 'b'
+_STRING = 's'
+_MODEL = 'm'
+_COLLECTION = 'c'
+_ENUM = 'e'
+_JSON = 'j'
+
+_NATIVE_KINDS = {
+    fields.Integer: _INTEGER,
+    fields.Float: _FLOAT,
+    fields.Boolean: _BOOLEAN,
+    fields.String: _STRING,
+    fields.Email: _STRING,
+    fields.Enum: _ENUM
+}
+
+# The codec of each model, built the first time it is serialized.
+_CODECS = weakref.WeakKeyDictionary()
+
+
+def dumps(instance):
+    """Returns the given model `instance` serialized as `bytes`.
+
+    :raises: :class:`errors.EncodeError` if a field value doesn't match
+        the field type or can't be serialized as JSON.
+
+    """
+
+    codec = _codec_for(type(instance))
+    out = bytearray(codec.header(_RECORD))
+    codec.write(instance, out)
+
+    return bytes(out)
+
+
+def loads(model, data):
+    """Returns a new instance of the given `model` class with the record
+    serialized in `data` with :func:`dumps`.
+
+    :raises: :class:`errors.DecodeError` if `data` is malformed or was
+        written with a different `model` schema.
+
+    """
+
+    codec = _codec_for(model)
+
+    return _read(codec, data, _RECORD, codec.read)
+
+
+def dumps_many(model, instances):
+    """Returns the given iterable of `model` instances serialized as
+    `bytes`, sharing a single header.
+
+    """
+
+    codec = _codec_for(model)
+    body = bytearray()
+    count = 0
+
+    for instance in instances:
+        codec.write(instance, body)
+        count += 1
+
+    out = bytearray(codec.header(_MANY))
+    _write_varint(count, out)
+    out += body
+
+    return bytes(out)
+
+
+def loads_many(model, data):
+    """Returns a `list` with the `model` instances serialized in `data`
+    with :func:`dumps_many`.
+
+    """
+
+    codec = _codec_for(model)
+
+    def read_many(buf, pos):
+        count, pos = _read_varint(buf, pos)
+        result = []
+
+        for _ in range(count):
+            instance, pos = codec.read(buf, pos)
+            result.append(instance)
+
+        return result, pos
+
+    return _read(codec, data, _MANY, read_many)
+
+
+def fingerprint(model):
+    """Returns the 8 bytes fingerprint of the given `model` schema written
+    in the header of its documents.
+
+    """
+
+    return _codec_for(model).fingerprint
+
+
+def _read(codec, data, kind, read):
+    buf = bytearray(data)
+
+    if bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise errors.DecodeError('not a booby binary document')
+
+    if len(buf) < _HEADER_SIZE:
+        raise errors.DecodeError('truncated header')
+
+    if bytes(buf[:_HEADER_SIZE]) != codec.header(kind):
+        if buf[len(MAGIC)] != VERSION:
+            raise errors.DecodeError(
+                'unsupported version {}'.format(buf[len(MAGIC)]))
+
+        if buf[len(MAGIC) + 1] != kind:
+            raise errors.DecodeError('expected a {}'.format(
+                'record' if kind == _RECORD else 'list of records'))
+
+        raise errors.DecodeError(
+            "schema mismatch for '{}'".format(codec.model.__name__))
+
+    try:
+        result, pos = read(buf, _HEADER_SIZE)
+    except (IndexError, ValueError, struct.error, UnicodeDecodeError) as err:
+        raise errors.DecodeError('truncated or malformed data: {}'.format(err))
+
+    if pos != len(buf):
+        raise errors.DecodeError('{} unexpected trailing bytes'.format(
+            len(buf) - pos))
+
+    return result
+
+
+def _codec_for(model):
+    try:
+        return _CODECS[model]
+    except KeyError:
+        return _CODECS.setdefault(model, _Codec(model))
+
+
+class _Codec(object):
+    def __init__(self, model):
+        plan = compiler.ensure_plan(model)
+
+        self.model = model
+        self.plan = plan
+        self.fields = tuple((f.read,) + _codecs_for(f) for f in plan.fields)
+        self.all = (1 << len(self.fields)) - 1
+        self.fingerprint = hashlib.sha1(
+            _schema(model).encode('utf-8')).digest()[:8]
+
+        self._headers = dict(
+            (kind, MAGIC + bytes(bytearray([VERSION, kind])) +
+             self.fingerprint)
+            for kind in (_RECORD, _MANY))
+
+    def header(self, kind):
+        return self._headers[kind]
+
+    def write(self, instance, out):
+        mask = 0
+        values = []
+
+        for i, (read, write, _) in enumerate(self.fields):
+            value = read(instance)
+
+            if value is not None:
+                mask |= 1 << i
+                values.append((write, value))
+
+        _write_varint(mask, out)
+
+        for write, value in values:
+            write(value, out)
+
+    def read(self, buf, pos):
+        # Fields missing from the mask are set to `None`, so they aren't
+        # decoded as their default.
+        mask, pos = _read_varint(buf, pos)
+        values = []
+
+        if mask >> len(self.fields):
+            raise errors.DecodeError(
+                "unknown fields in '{}' record".format(self.model.__name__))
+
+        for i, (_, _, read) in enumerate(self.fields):
+            if mask >> i & 1:
+                value, pos = read(buf, pos)
+            else:
+                value = None
+
+            values.append(value)
+
+        return self.plan.load(self.all, values), pos
+
+
+def _schema(model, stack=()):
+    # Models embedding themselves are referenced by their depth, so
+    # recursive schemas have a finite description.
+    if model in stack:
+        return '@{}'.format(stack.index(model))
+
+    stack += (model,)
+    parts = []
+
+    for f in compiler.ensure_plan(model).fields:
+        kind = _kind_of(f)
+
+        if kind in (_MODEL, _COLLECTION):
+            kind += _schema(f.field.model, stack)
+        elif kind == _ENUM:
+            kind += repr(f.field.choices)
+
+        parts.append('{}:{}'.format(f.name, kind))
+
+    return '{' + ','.join(parts) + '}'
+
+
+def _kind_of(field_plan):
+    if field_plan.kind == compiler.MODEL:
+        return _MODEL
+
+    if field_plan.kind == compiler.COLLECTION:
+        return _COLLECTION
+
+    if field_plan.encode is not None or (
+            field_plan.decode is not None and
+            field_plan.decode is not _intern_table(field_plan)):
+        return _JSON
+
+    return _NATIVE_KINDS.get(type(field_plan.field), _JSON)
+
+
+def _codecs_for(field_plan):
+    kind = _kind_of(field_plan)
+    name = field_plan.name
+
+    if kind == _INTEGER:
+        return _checked(_write_integer, (int, long), name,
+                        'an integer', bool), _read_integer
+    if kind == _FLOAT:
+        return _checked(_write_float, (float, int, long), name,
+                        'a float', bool), _read_float
+    if kind == _BOOLEAN:
+        return _checked(_write_boolean, bool, name,
+                        'a boolean'), _read_boolean
+    if kind == _STRING:
+        return _checked(_write_string, basestring, name,
+                        'a string'), _interned(_read_string, field_plan)
+    if kind == _MODEL:
+        return _model_codecs(field_plan.field.model, name)
+    if kind == _COLLECTION:
+        return _collection_codecs(field_plan.field.model, name)
+    if kind == _ENUM:
+        return _enum_codecs(field_plan.field, name)
+
+    return _json_codecs(field_plan)
+
+
+def _checked(write, types, name, description, excluded=()):
+    # `bool` values are integers too, so numeric fields exclude them.
+    def checked_write(value, out):
+        if not isinstance(value, types) or isinstance(value, excluded):
+            raise errors.EncodeError(
+                '{} should be {}'.format(name, description))
+
+        write(value, out)
+
+    return checked_write
+
+
+def _model_codecs(model, name):
+    # Nested codecs are looked up on use, so models embedding themselves
+    # don't recurse while being built.
+    def write(value, out):
+        if not isinstance(value, model):
+            raise errors.EncodeError("{} should be an instance of '{}'".format(
+                name, model.__name__))
+
+        _codec_for(model).write(value, out)
+
+    def read(buf, pos):
+        return _codec_for(model).read(buf, pos)
+
+    return write, read
+
+
+def _collection_codecs(model, name):
+    write_item, read_item = _model_codecs(model, name)
+
+    def write(value, out):
+        if not isinstance(value, (list, tuple)):
+            raise errors.EncodeError('{} should be a list'.format(name))
+
+        _write_varint(len(value), out)
+
+        for item in value:
+            write_item(item, out)
+
+    def read(buf, pos):
+        count, pos = _read_varint(buf, pos)
+        result = []
+
+        for _ in range(count):
+            item, pos = read_item(buf, pos)
+            result.append(item)
+
+        return result, pos
+
+    return write, read
+
+
+def _enum_codecs(field, name):
+    indexes = field.indexes
+    choices = field.choices
+
+    def write(value, out):
+        try:
+            index = indexes[value]
+        except (KeyError, TypeError):
+            raise errors.EncodeError('{} should be in {}'.format(
+                name, list(choices)))
+
+        _write_varint(index, out)
+
+    def read(buf, pos):
+        index, pos = _read_varint(buf, pos)
+
+        if index >= len(choices):
+            raise IndexError('enum index out of range')
+
+        # Fields storing indexes get the index as their stored value
+        return (index if field.store_index else choices[index]), pos
+
+    return write, read
+
+
+def _intern_table(field_plan):
+    return getattr(field_plan.field, 'intern_table', None)
+
+
+def _interned(read, field_plan):
+    table = _intern_table(field_plan)
+
+    if table is None:
+        return read
+
+    def interned_read(buf, pos):
+        value, pos = read(buf, pos)
+
+        return table.intern(value), pos
+
+    return interned_read
+
+
+def _json_codecs(field_plan):
+    name = field_plan.name
+    encode = field_plan.encode
+    decode = field_plan.decode
+
+    def write(value, out):
+        if encode is not None:
+            value = encode(value)
+
+        try:
+            value = json.dumps(value)
+        except (TypeError, ValueError) as err:
+            raise errors.EncodeError('{} should be serializable: {}'.format(
+                name, err))
+
+        _write_string(value, out)
+
+    def read(buf, pos):
+        value, pos = _read_string(buf, pos)
+        value = json.loads(value)
+
+        if decode is not None:
+            value = decode(value)
+
+        return value, pos
+
+    return write, read
+
+
+def _write_varint(value, out):
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+
+def _read_varint(buf, pos):
+    result = 0
+    shift = 0
+
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            return result, pos
+
+        shift += 7
+
+
+def _write_integer(value, out):
+    _write_varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+
+
+def _read_integer(buf, pos):
+    value, pos = _read_varint(buf, pos)
+
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def _write_float(value, out):
+    out += _DOUBLE.pack(value)
+
+
+def _read_float(buf, pos):
+    return _DOUBLE.unpack_from(buf, pos)[0], pos + _DOUBLE.size
+
+
+def _write_boolean(value, out):
+    out.append(1 if value else 0)
+
+
+def _read_boolean(buf, pos):
+    return buf[pos] != 0, pos + 1
+
+
+def _write_string(value, out):
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+
+    _write_varint(len(value), out)
+    out += value
+
+
+def _read_string(buf, pos):
+    size, pos = _read_varint(buf, pos)
+    end = pos + size
+
+    if end > len(buf):
+        raise IndexError('string out of range')
+
+    return buf[pos:end].decode('utf-8'), end
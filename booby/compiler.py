@@ -0,0 +1,1028 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`compiler` module builds a per-model `plan` with everything
+the :class:`models.Model` encoding, decoding and validation needs resolved
+ahead of time: wire names, `read_only` flags and flattened
+encoder/decoder/validator chains.
+
+Plans are built lazily, the first time a model class is encoded, decoded
+or validated, and cached in the class. Field options are read only once,
+so changes made to a field after its model has been used are not seen.
+
+Compilation can be turned off globally, to step through the generic
+per-field code while debugging, setting::
+
+    from booby import compiler
+
+    compiler.enabled = False
+
+"""
+
+import weakref
+import datetime
+import operator
+
+from booby import errors, _utils
+
+enabled = True
+
+VALUE = 'value'
+MODEL = 'model'
+COLLECTION = 'collection'
+
+# Marks the fields of a valid subtree that were unset, see `validate`.
+_UNSET = object()
+
+# Whether the validators of each field reject `None`, see `rejects_none`.
+_REJECTS_NONE = weakref.WeakKeyDictionary()
+
+_IMMUTABLE_TYPES = frozenset([
+    type(None), bool, int, long, float, str, unicode,
+    datetime.datetime, datetime.date, datetime.time
+])
+
+
+def plan_for(model):
+    """Returns the compiled :class:`ModelPlan` for the given `model`
+    class or :keyword:`None` if compilation is disabled.
+
+    """
+
+    if not enabled:
+        return None
+
+    try:
+        return model.__dict__['_plan']
+    except KeyError:
+        plan = ModelPlan(model)
+        model._plan = plan
+        return plan
+
+
+def ensure_plan(model):
+    """Returns the plan for the given `model` class like :func:`plan_for`,
+    but builds an uncached plan if compilation is disabled.
+
+    """
+
+    return plan_for(model) or ModelPlan(model)
+
+
+def reset(model):
+    """Discards the cached plan for the given `model` class, so it will
+    be compiled again on its next use.
+
+    """
+
+    if '_plan' in model.__dict__:
+        del model._plan
+
+
+class FieldPlan(object):
+    """The resolved options of a single `field` within a model."""
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+        self.wire_name = field.options.get('name', name)
+        self.read_only = field.options.get('read_only', False)
+
+        self.kind = _kind_of(field)
+        self.encode = _encoder_for(field, self.kind)
+        self.decode = _decoder_for(field)
+        self.validate = _validator_for(field)
+        self.decode_lazy = _lazy_decoder_for(self)
+
+
+class ModelPlan(object):
+    """The compiled codec functions for a :class:`models.Model` subclass.
+
+    Fields are kept sorted by name, so the plan order is stable between
+    processes and interpreter runs.
+
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.fields = tuple(
+            FieldPlan(name, model._fields[name])
+            for name in sorted(model._fields))
+
+        self._targets = dict(
+            (f.name, _target_for(model, f.name, f.field)) for f in self.fields)
+        self._keys = frozenset(self._targets)
+
+        for f in self.fields:
+            f.read = _reader_for(model, f.name, f.field, self._targets[f.name])
+
+        self._readers = dict((f.name, f.read) for f in self.fields)
+
+        self._encoders = tuple(
+            (f.read, f.field, f.wire_name, f.encode)
+            for f in self.fields if not f.read_only)
+
+        self._decoders = tuple(
+            (f.name, f.wire_name, f.decode) for f in self.fields)
+
+        self._wire_decoders = dict(
+            (decoder[1], decoder) for decoder in self._decoders)
+
+        if len(self._wire_decoders) != len(self._decoders):
+            self._wire_decoders = None
+
+        self._validators = tuple(
+            (f.name, f.field, f.validate, f.read)
+            for f in self.fields if f.validate is not None)
+
+        self._lazy_decoders = dict(
+            (f.field, (f.wire_name, f.decode_lazy)) for f in self.fields)
+
+        self._custom_init = _overrides_init(model)
+        self._custom_update = _overrides_update(model)
+        self._custom_encode = _overrides_encode(model)
+        self._custom_validate = overrides_validate(model)
+        self._lazy = (not self._custom_init and
+                      not _overrides_setattr(model) and
+                      getattr(model, '__storage__', 'dict') == 'dict')
+
+        self._sparse = getattr(model, '__storage__', 'dict') == 'sparse'
+
+        if self._sparse:
+            self._by_field = dict((f.field, f) for f in self.fields)
+            self._always = tuple(
+                f for f in self.fields
+                if self._targets[f.name][0] is None or
+                not _is_none_default(f.field))
+            # Built on the first validation, see `rejects_none`.
+            self._always_validate = None
+
+    def init(self, instance, values):
+        """Sets the given `values` mapping of field names to values in the
+        model `instance`, as the default :func:`models.Model.__init__`
+        does, writing them straight into the instance storage.
+
+        :raises: :class:`errors.FieldError` if any of the keys is not a
+            field of the model.
+
+        """
+
+        if self._custom_update:
+            instance._update(values)
+            return
+
+        if not self._keys.issuperset(values):
+            raise errors.FieldError(
+                next(k for k in values if k not in self._keys))
+
+        targets = self._targets
+        data = getattr(instance, '_data', None)
+
+        for name, value in values.items():
+            field, resolve, slot = targets[name]
+
+            if field is None:
+                setattr(instance, name, value)
+                continue
+
+            if resolve is not None:
+                value = resolve(value)
+
+            if slot is None:
+                data[field] = value
+            else:
+                slot.__set__(instance, value)
+
+        validated = instance._validated
+
+        if validated:
+            validated.subtree = None
+
+            for name in values:
+                validated.discard(self.model._fields[name])
+
+    def from_dict(self, values):
+        """Returns a new instance of the model with the given `values`
+        mapping of field names to values.
+
+        """
+
+        if self._custom_init:
+            return self.model(**values)
+
+        instance = self.model.__new__(self.model)
+        self.init(instance, values)
+
+        return instance
+
+    def dump(self, instance):
+        """Returns a bitmask of the fields set in the given model
+        `instance`, in the plan order, and a tuple with their values.
+
+        """
+
+        data = getattr(instance, '_data', None)
+        raw = getattr(data, 'raw', ())
+        mask = 0
+        values = []
+
+        for i, f in enumerate(self.fields):
+            field, _, slot = self._targets[f.name]
+
+            if field is None:
+                value = getattr(instance, f.name)
+            elif slot is not None:
+                try:
+                    value = slot.__get__(instance, self.model)
+                except AttributeError:
+                    continue
+            elif field in data or f.wire_name in raw:
+                value = data[field]
+            else:
+                continue
+
+            mask |= 1 << i
+            values.append(value)
+
+        return mask, tuple(values)
+
+    def load(self, mask, values):
+        """Returns a new instance of the model with the fields set in the
+        given `mask`, as returned by :func:`dump`, and their `values`.
+
+        """
+
+        instance = self.model.__new__(self.model)
+        data = getattr(instance, '_data', None)
+        values = iter(values)
+
+        for i, f in enumerate(self.fields):
+            if not mask >> i & 1:
+                continue
+
+            field, _, slot = self._targets[f.name]
+            value = next(values)
+
+            if field is None:
+                setattr(instance, f.name, value)
+            elif slot is not None:
+                slot.__set__(instance, value)
+            else:
+                data[field] = value
+
+        return instance
+
+    def present(self, instance, validating=False):
+        """Returns the plans of the fields to visit when traversing the
+        given model `instance`: all the fields, or for `sparse` models
+        only the fields that are set or have a default other than
+        :keyword:`None`. If `validating`, also the unset fields whose
+        validators reject :keyword:`None`.
+
+        """
+
+        if not self._sparse:
+            return self.fields
+
+        if validating:
+            if self._always_validate is None:
+                self._always_validate = tuple(
+                    f for f in self.fields
+                    if f in self._always or rejects_none(f.field))
+
+            return self._present(instance, self._always_validate)
+
+        return self._present(instance, self._always)
+
+    def _present(self, instance, always):
+        by_field = self._by_field
+        data = instance._data
+
+        result = [by_field[field] for field in data if field in by_field]
+        result.extend(f for f in always if f.field not in data)
+        result.sort(key=_by_name)
+
+        return result
+
+    def encode(self, instance):
+        data = getattr(instance, '_data', None)
+
+        if type(data) is LazyData:
+            return self._encode_lazy(instance, data)
+
+        if self._sparse:
+            return self._encode_sparse(instance)
+
+        result = {}
+
+        for read, _, wire_name, encode in self._encoders:
+            value = read(instance)
+
+            if encode is not None:
+                value = encode(value)
+
+            result[wire_name] = value
+
+        return result
+
+    def _encode_sparse(self, instance):
+        result = {}
+
+        for f in self.present(instance):
+            if f.read_only:
+                continue
+
+            value = f.read(instance)
+
+            if f.encode is not None:
+                value = f.encode(value)
+
+            result[f.wire_name] = value
+
+        return result
+
+    def _encode_lazy(self, instance, data):
+        result = {}
+        raw = data.raw
+
+        for read, field, wire_name, encode in self._encoders:
+            if field not in data and wire_name in raw:
+                result[wire_name] = raw[wire_name]
+                continue
+
+            value = read(instance)
+
+            if encode is not None:
+                value = encode(value)
+
+            result[wire_name] = value
+
+        return result
+
+    def decode(self, raw):
+        result = {}
+
+        for name, wire_name, decode in self._decoders_for(raw):
+            try:
+                value = raw[wire_name]
+            except KeyError:
+                continue
+
+            if decode is not None:
+                value = decode(value)
+
+            result[name] = value
+
+        return result
+
+    def build(self, raw):
+        """Decodes the given `raw` mapping straight into a new instance
+        of the model, without building the intermediate decoded `dict`.
+
+        """
+
+        if self._custom_init:
+            return self.model(**self.decode(raw))
+
+        instance = self.model.__new__(self.model)
+
+        for name, wire_name, decode in self._decoders_for(raw):
+            try:
+                value = raw[wire_name]
+            except KeyError:
+                continue
+
+            if decode is not None:
+                value = decode(value)
+
+            setattr(instance, name, value)
+
+        return instance
+
+    def _decoders_for(self, raw):
+        # Payloads smaller than the schema are walked by their own keys.
+        wire_decoders = self._wire_decoders
+
+        if wire_decoders is None or len(raw) >= len(self._decoders):
+            return self._decoders
+
+        return [wire_decoders[k] for k in raw if k in wire_decoders]
+
+    def build_lazy(self, raw):
+        """Returns a new instance of the model backed by the given `raw`
+        mapping, decoding each field the first time it is read.
+
+        """
+
+        if not self._lazy:
+            return self.build(raw)
+
+        instance = self.model.__new__(self.model)
+        instance._data = LazyData(raw, self._lazy_decoders)
+
+        return instance
+
+    def validate(self, instance):
+        """Validates the given model `instance`.
+
+        The fields that passed validation are recorded in the instance and
+        skipped on later validations until they are assigned again, as
+        long as their values are immutable. Fields holding models or lists
+        are validated delegating to the incremental validation of the
+        models they contain.
+
+        Once all its fields pass, the instance is also marked as a valid
+        subtree, with the models it holds and the items of its lists. It
+        isn't validated again while none of its fields is assigned, its
+        lists hold the same items and those models are still valid
+        subtrees, so an unchanged tree is checked without running any
+        validator. Instances holding other mutable values, or of models
+        overriding :func:`models.Model.validate`, are never marked.
+
+        Unset fields of `sparse` models are validated only if their
+        default value is not :keyword:`None` or if their validators
+        reject :keyword:`None`.
+
+        """
+
+        validated = instance._validated
+
+        if validated and validated.subtree is not None:
+            if _is_valid_subtree(instance):
+                return
+
+            validated.subtree = None
+
+        if not validated:
+            validated = instance._validated = _Validated()
+            validated.subtree = None
+
+        validators = self._validators
+        subtree = ()
+
+        if self._sparse:
+            validators = [
+                (f.name, f.field, f.validate, f.read)
+                for f in self.present(instance, validating=True)
+                if f.validate is not None]
+
+        for name, field, validate, read in validators:
+            value = read(instance)
+
+            if type(value) in _IMMUTABLE_TYPES:
+                if field in validated:
+                    continue
+            elif subtree is not None:
+                if field._pure_default and not self._is_stored(instance, name):
+                    # Pure defaults are built again on each read, so the
+                    # field is checked to be still unset instead.
+                    subtree += ((self._is_stored, _UNSET, name),)
+                else:
+                    subtree = _add_to_subtree(subtree, read, value)
+
+            try:
+                validate(value)
+            except errors.ValidationError as err:
+                validated.discard(field)
+                raise errors.ValidationError('%s %s' % (name, err))
+
+            validated.add(field)
+
+        # Instances with no validated fields aren't marked, as assigning
+        # their fields doesn't clear the mark, nor those of models with
+        # their own `validate` method, which may check anything else.
+        if validated and not self._custom_validate:
+            validated.subtree = subtree
+
+    def _is_stored(self, instance, name):
+        # Returns `False` if the field `name` isn't set in the `instance`
+        # storage, so reading it returns its default.
+        field, _, slot = self._targets[name]
+
+        if field is None:
+            return True
+
+        if slot is None:
+            return field in instance._data
+
+        try:
+            slot.__get__(instance, self.model)
+        except AttributeError:
+            return False
+
+        return True
+
+
+class _Validated(set):
+    # The fields of a model instance that passed validation. If `subtree`
+    # isn't `None` the whole instance passed, and it holds the values to
+    # check to know they are unchanged. Assigning any field clears it.
+
+    __slots__ = ('subtree',)
+
+
+def _add_to_subtree(subtree, read, value):
+    # Adds a `(read, value, items)` tuple for a field holding a model
+    # instance or a list, or returns `None` if it holds any other mutable
+    # value.
+    if hasattr(value, '_validated'):
+        return subtree + ((read, value, None),)
+
+    if type(value) is list and all(
+            type(item) in _IMMUTABLE_TYPES or hasattr(item, '_validated')
+            for item in value):
+        return subtree + ((read, value, tuple(value)),)
+
+    return None
+
+
+def _is_valid_subtree(instance):
+    subtree = getattr(instance._validated, 'subtree', None)
+
+    if subtree is None:
+        return False
+
+    for read, value, items in subtree:
+        if value is _UNSET:
+            if read(instance, items):
+                return False
+
+            continue
+
+        if read(instance) is not value:
+            return False
+
+        if items is None:
+            if not _is_valid_subtree(value):
+                return False
+        elif len(value) != len(items) or not all(
+                map(operator.is_, value, items)):
+            return False
+        else:
+            for item in items:
+                if (type(item) not in _IMMUTABLE_TYPES and
+                        not _is_valid_subtree(item)):
+                    return False
+
+    return True
+
+
+class LazyData(dict):
+    """The `dict` of field values of a model instance built by
+    :func:`ModelPlan.build_lazy`. Missing values are decoded from the
+    `raw` mapping, and cached, when first read.
+
+    """
+
+    def __init__(self, raw, decoders):
+        super(LazyData, self).__init__()
+
+        self.raw = raw
+        self._decoders = decoders
+
+    def __missing__(self, field):
+        wire_name, decode = self._decoders[field]
+        value = self.raw[wire_name]
+
+        if decode is not None:
+            value = decode(value)
+
+        value = field._resolve(value)
+        self[field] = value
+
+        return value
+
+
+def _by_name(field_plan):
+    return field_plan.name
+
+
+def _is_none_default(field):
+    return not callable(field.default) and field.default is None
+
+
+def present_fields(instance, validating=False):
+    """Returns the `(name, field)` pairs of the given model `instance`
+    to visit when compilation is disabled, like :func:`ModelPlan.present`
+    does for compiled models.
+
+    """
+
+    items = list(instance._fields.items())
+
+    if getattr(instance, '__storage__', 'dict') != 'sparse':
+        return items
+
+    data = instance._data
+
+    return [(name, field) for name, field in items
+            if field in data or not _is_none_default(field) or
+            validating and rejects_none(field)]
+
+
+def rejects_none(field):
+    """Returns `True` if the validators of the given `field` reject
+    :keyword:`None`, so unset fields of `sparse` models are validated.
+
+    Builtin validators are checked by their type. Fields with any other
+    validator are validated with :keyword:`None` the first time they are
+    checked, while validating a model, and the result is cached.
+
+    """
+
+    try:
+        return _REJECTS_NONE[field]
+    except KeyError:
+        pass
+
+    result = None
+
+    if not overrides(field, 'validate'):
+        result = _builtin_rejects_none(field.validators)
+
+    if result is None:
+        try:
+            field.validate(None)
+        except Exception:
+            result = True
+        else:
+            result = False
+
+    _REJECTS_NONE[field] = result
+
+    return result
+
+
+def _builtin_rejects_none(validators):
+    # Returns `None` if there are validators other than the builtin ones,
+    # unless a builtin one already rejects `None`.
+    from booby import validators as builtin
+
+    nullable = (builtin.String, builtin.Integer, builtin.Float,
+                builtin.Boolean, builtin.Model, builtin.Email,
+                builtin.List, builtin.DateTime)
+    known = True
+
+    for validator in validators:
+        kind = type(validator)
+
+        if kind is builtin.Required:
+            return True
+
+        if kind is builtin.In:
+            if None not in validator.choices:
+                return True
+        elif kind not in nullable:
+            known = False
+
+    return False if known else None
+
+
+def overrides(field, name):
+    """Returns `True` if the given `field` overrides the :class:`fields.Field`
+    method with the given `name`.
+
+    """
+
+    from booby import fields
+
+    return (_function(getattr(type(field), name)) is not
+            _function(getattr(fields.Field, name)))
+
+
+def resolver_for(field):
+    """Returns the `_resolve` method the given `field` applies to the
+    values assigned to it, or :keyword:`None` if it keeps them unchanged,
+    like :class:`fields.String` fields that don't intern their values and
+    :class:`fields.Enum` fields that don't store indexes.
+
+    """
+
+    from booby import fields
+
+    resolve = _function(field._resolve)
+
+    if (resolve is _function(fields.Field._resolve) or
+            resolve is _function(fields.String._resolve) and
+            field.intern_table is None or
+            resolve is _function(fields.Enum._resolve) and
+            not field.store_index):
+        return None
+
+    return field._resolve
+
+
+def _kind_of(field):
+    from booby import fields, encoders, decoders
+
+    if type(field) is fields.Embedded:
+        codecs = encoders.Model, decoders.Model
+    elif type(field) is fields.Collection:
+        codecs = encoders.Collection, decoders.Collection
+    else:
+        return VALUE
+
+    field_encoders = field.options.get('encoders', [])
+    field_decoders = field.options.get('decoders', [])
+
+    if (len(field_encoders) == 1 and type(field_encoders[0]) is codecs[0] and
+            len(field_decoders) == 1 and type(field_decoders[0]) is codecs[1]):
+        return MODEL if codecs[0] is encoders.Model else COLLECTION
+
+    return VALUE
+
+
+def _lazy_decoder_for(plan):
+    model = getattr(plan.field, 'model', None)
+
+    if plan.kind == MODEL:
+        return lambda value: (
+            None if value is None else model.decode_lazy(value))
+
+    if plan.kind == COLLECTION:
+        return lambda value: (
+            None if value is None
+            else [model.decode_lazy(item) for item in value])
+
+    return plan.decode
+
+
+def _encoder_for(field, kind):
+    if overrides(field, 'encode'):
+        return field.encode
+
+    if kind == MODEL:
+        return _encode_model
+
+    if kind == COLLECTION:
+        generic = _chain(field.options['encoders'])
+
+        def encode_collection(value):
+            if type(value) is not list:
+                return generic(value)
+
+            return [_encode_model(item) for item in value]
+
+        return encode_collection
+
+    return _chain(field.options.get('encoders', []))
+
+
+def _encode_model(value):
+    # Same as the `encoders.Model` encoder, but going straight to the
+    # compiled plan of the value model.
+    try:
+        plan = type(value).__dict__['_plan']
+    except KeyError:
+        from booby import models
+
+        if value is None:
+            return None
+
+        if not isinstance(value, models.Model):
+            return value.encode()
+
+        plan = plan_for(type(value))
+
+        if plan is None:
+            return value.encode()
+
+    if plan._custom_encode:
+        return value.encode()
+
+    return plan.encode(value)
+
+
+def _decoder_for(field):
+    if overrides(field, 'decode'):
+        return field.decode
+
+    return _chain(field.options.get('decoders', []))
+
+
+def _validator_for(field):
+    if overrides(field, 'validate'):
+        return field.validate
+
+    validators = tuple(field.validators)
+
+    if not validators:
+        return None
+
+    return fuse_validators(validators)
+
+
+def fuse_validators(validators):
+    """Returns a single function running the given `validators` in order.
+
+    The builtin validators are inlined into the generated function: the
+    :keyword:`None` check is done only once, up front, repeated type
+    checks are merged, as in `String` and `Email`, and the `In` choices
+    are looked up in a `frozenset` when they are hashable. Any other
+    validator is called unchanged.
+
+    """
+
+    from booby import validators as builtin
+
+    checks = type_checks()
+    namespace = {'ValidationError': errors.ValidationError}
+    when_none = []
+    when_value = []
+    checked = set()
+
+    for i, validator in enumerate(validators):
+        kind = type(validator)
+        namespace['v%d' % i] = validator
+
+        if kind is builtin.Email:
+            kind = builtin.String
+            namespace['p%d' % i] = validator.pattern.match
+            email_check = [
+                'if p%d(value) is None:' % i,
+                "    raise ValidationError('should be a valid email')"]
+        else:
+            email_check = []
+
+        if kind is builtin.Required:
+            when_none.append("raise ValidationError('is required')")
+        elif kind is builtin.In:
+            namespace['m%d' % i] = validator.message
+
+            if None not in validator.choices:
+                when_none.append('raise ValidationError(m%d)' % i)
+
+            try:
+                namespace['c%d' % i] = frozenset(validator.choices)
+            except TypeError:
+                when_value.append('missing = value not in v%d.choices' % i)
+            else:
+                when_value.extend([
+                    'try:',
+                    '    missing = value not in c%d' % i,
+                    'except TypeError:',
+                    '    missing = value not in v%d.choices' % i])
+
+            when_value.extend([
+                'if missing:',
+                '    raise ValidationError(m%d)' % i])
+        elif kind in checks:
+            if kind not in checked:
+                checked.add(kind)
+                namespace['t%d' % i], namespace['m%d' % i] = checks[kind]
+                when_value.extend([
+                    'if not isinstance(value, t%d):' % i,
+                    '    raise ValidationError(m%d)' % i])
+        elif kind in (builtin.Model, builtin.List):
+            when_value.append('v%d(value)' % i)
+        else:
+            when_none.append('v%d(value)' % i)
+            when_value.append('v%d(value)' % i)
+
+        when_value.extend(email_check)
+
+    source = '\n'.join(
+        ['def validate(value):', '    if value is None:'] +
+        ['        ' + line for line in when_none + ['return']] +
+        ['    ' + line for line in when_value])
+
+    exec(compile(source, '<booby validators>', 'exec'), namespace)
+
+    return namespace['validate']
+
+
+def type_checks():
+    """Returns a `dict` mapping the builtin validators that only check
+    the type of the values to the accepted types and their error
+    message.
+
+    """
+
+    from booby import validators
+
+    return {
+        validators.String: (basestring, 'should be a string'),
+        validators.Integer: (int, 'should be an integer'),
+        validators.Float: (float, 'should be a float'),
+        validators.Boolean: (bool, 'should be a boolean'),
+        validators.DateTime: (datetime.datetime, 'should be a datetime')
+    }
+
+
+def _overrides_init(model):
+    from booby import models
+
+    return _function(model.__init__) is not _function(models.Model.__init__)
+
+
+def overrides_validate(model):
+    """Returns `True` if the given `model` class overrides
+    :func:`models.Model.validate`, usually to add checks involving
+    several fields.
+
+    """
+
+    from booby import models
+
+    return _function(model.validate) is not _function(models.Model.validate)
+
+
+def _overrides_setattr(model):
+    from booby import models
+
+    return (_function(model.__setattr__) is not
+            _function(models.Model.__setattr__))
+
+
+def _overrides_update(model):
+    from booby import models
+
+    return any(_function(getattr(model, name)) is not
+               _function(getattr(models.Model, name))
+               for name in ('_update', '__setitem__'))
+
+
+def _target_for(model, name, field):
+    # The field, its `_resolve` method if overriden and the slot where its
+    # value is stored, or all `None` if it has a custom `__set__` method or
+    # the model a custom `__setattr__` method.
+    from booby import fields
+
+    setter = _function(type(field).__set__)
+
+    if _overrides_setattr(model) or setter not in (
+            _function(fields.Field.__set__),
+            _function(fields.String.__set__),
+            _function(fields.Enum.__set__),
+            _function(fields.Embedded.__set__),
+            _function(fields.Collection.__set__)):
+        return None, None, None
+
+    resolve = resolver_for(field)
+    slot = None
+
+    if getattr(model, '__storage__', 'dict') == 'slots':
+        slot = _slot_field(model, name).slot
+
+    return field, resolve, slot
+
+
+def _slot_field(model, name):
+    for klass in model.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+
+
+def _reader_for(model, name, field, target):
+    # Fields overriding `__get__` are read through it, unless they
+    # override `_peek` too, in the same class or a subclass.
+    if target[0] is None or overrides(field, '__get__') and not issubclass(
+            _utils.defining_class(type(field), '_peek'),
+            _utils.defining_class(type(field), '__get__')):
+        return lambda instance: getattr(instance, name)
+
+    if target[2] is not None:
+        return _slot_field(model, name)._peek
+
+    return field._peek
+
+
+def _overrides_encode(model):
+    from booby import mixins
+
+    return _function(model.encode) is not _function(mixins.Encoder.encode)
+
+
+def _chain(callables):
+    callables = tuple(callables)
+
+    if not callables:
+        return None
+
+    if len(callables) == 1:
+        return callables[0]
+
+    def chain(value):
+        for callable_ in callables:
+            value = callable_(value)
+
+        return value
+
+    return chain
+
+
+def _function(method):
+    return getattr(method, '__func__', method)
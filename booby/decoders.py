@@ -14,10 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 import datetime
+import collections
 
-from . import errors
+from . import errors, encoders
 from .helpers import nullable
 
 
@@ -32,35 +32,226 @@ class Model(Decoder):
 
     @nullable
     def decode(self, value):
+        if not isinstance(value, collections.Mapping):
+            raise errors.DecodeError()
+
         return self._model.decode(value)
 
 
 class DateTime(Decoder):
-    def __init__(self, format=None):
+    """Decodes `ISO 8601` strings into :py:class:`datetime.datetime`
+    objects, or strings in the given `format` if any. If an `epoch` mode
+    is given decodes numbers since the Unix epoch, as encoded by the
+    :class:`encoders.DateTime` encoder, into naive UTC datetimes.
+
+    Dates, times with or without seconds, fractional seconds and
+    `Z` or `+HH:MM` offsets are supported. Values with an offset are
+    decoded as aware datetimes.
+
+    ISO strings are parsed by slicing instead of with
+    :py:func:`datetime.datetime.strptime`. The layout of the strings is
+    detected once and cached by length, as the timestamps decoded by a
+    field usually share it.
+
+    """
+
+    def __init__(self, format=None, epoch=None):
+        encoders._check_datetime_mode(format, epoch)
+
         self._format = format
+        self._epoch = epoch
+        self._layouts = {}
 
     @nullable
     def decode(self, value):
-        format = self._format_for(value)
+        if self._epoch is not None:
+            return self._from_epoch(value)
 
         try:
-            return datetime.datetime.strptime(value, format)
-        except ValueError:
+            if self._format is not None:
+                return datetime.datetime.strptime(value, self._format)
+
+            return self._parse(value)
+        except (TypeError, ValueError):
             raise errors.DecodeError()
 
-    def _format_for(self, value):
-        if self._format is not None:
-            return self._format
+    def decode_many(self, values):
+        """Decodes a whole `list` of values at once."""
+
+        decode = self.decode
+
+        return [decode(value) for value in values]
+
+    def _from_epoch(self, value):
+        if (isinstance(value, bool) or
+                not isinstance(value, (int, long, float))):
+            raise errors.DecodeError()
+
+        try:
+            return encoders.EPOCH + _EPOCH_UNITS[self._epoch](value)
+        except OverflowError:
+            raise errors.DecodeError()
+
+    def _parse(self, value):
+        layout = self._layouts.get(len(value))
+
+        if layout is not None and layout.matches(value):
+            try:
+                return layout.parse(value)
+            except ValueError:
+                pass
+
+        layout = self._layouts[len(value)] = _ISOLayout(value)
+
+        return layout.parse(value)
+
+
+_EPOCH_UNITS = {
+    'seconds': lambda value: datetime.timedelta(seconds=value),
+    'milliseconds': lambda value: datetime.timedelta(milliseconds=value),
+    'float': lambda value: datetime.timedelta(seconds=value)
+}
+
+
+class _ISOLayout(object):
+    # The positions of the fields in ISO 8601 strings of a given length:
+    # YYYY-MM-DD[THH:MM[:SS[.ffffff]][Z|+HH[:MM]]]
+
+    def __init__(self, value):
+        if len(value) < 10 or value[4] != '-' or value[7] != '-':
+            raise ValueError(value)
+
+        self.separators = [(4, '-'), (7, '-')]
+        self.time = self.seconds = self.fraction = self.offset = None
+        position = 10
+
+        if len(value) > 10:
+            if (len(value) < 16 or value[10] not in 'T ' or
+                    value[13] != ':'):
+                raise ValueError(value)
+
+            self.separators.extend([(10, value[10]), (13, ':')])
+            self.time = 11
+            position = 16
+
+            if value[16:17] == ':':
+                if len(value) < 19:
+                    raise ValueError(value)
+
+                self.separators.append((16, ':'))
+                self.seconds = 17
+                position = 19
+
+                if value[19:20] in ('.', ','):
+                    end = 20
+
+                    while value[end:end + 1].isdigit():
+                        end += 1
+
+                    self.separators.append((19, value[19]))
+                    self.fraction = (20, end)
+                    position = end
+
+        if position < len(value):
+            offset = value[position:]
+
+            if offset != 'Z' and (offset[0] not in '+-' or
+                                  len(offset) not in (3, 5, 6)):
+                raise ValueError(value)
 
-        format = '%Y-%m-%dT%H:%M:%S'
+            self.offset = position
 
-        if self._has_microseconds(value):
-            format += '.%f'
+    def matches(self, value):
+        for position, separator in self.separators:
+            if value[position] != separator:
+                return False
 
-        return format
+        return True
 
-    def _has_microseconds(self, value):
-        return re.match('^.*\.[0-9]+$', value) is not None
+    def parse(self, value):
+        digits = [value[0:4], value[5:7], value[8:10]]
+        microsecond = 0
+
+        if self.time is not None:
+            digits.extend([value[11:13], value[14:16]])
+
+            if self.seconds is not None:
+                digits.append(value[17:19])
+
+                if self.fraction is not None:
+                    fraction = value[self.fraction[0]:self.fraction[1]][:6]
+
+                    if not fraction.isdigit():
+                        raise ValueError(value)
+
+                    microsecond = int(fraction.ljust(6, '0'))
+
+        if not ''.join(digits).isdigit():
+            raise ValueError(value)
+
+        arguments = [int(part) for part in digits]
+        arguments.extend([0] * (6 - len(digits)))
+        arguments.append(microsecond)
+
+        return datetime.datetime(*arguments, tzinfo=self._tzinfo(value))
+
+    def _tzinfo(self, value):
+        if self.offset is None:
+            return None
+
+        offset = value[self.offset:]
+
+        if offset == 'Z':
+            return _FixedOffset.get(0)
+
+        sign, hours, minutes = offset[0], offset[1:3], offset[3:].lstrip(':')
+
+        if sign not in '+-' or not (hours + minutes).isdigit():
+            raise ValueError(value)
+
+        minutes = int(hours) * 60 + int(minutes or 0)
+
+        return _FixedOffset.get(-minutes if sign == '-' else minutes)
+
+
+class _FixedOffset(datetime.tzinfo):
+    """A :py:class:`datetime.tzinfo` with a fixed offset from UTC, in
+    minutes. Instances are shared.
+
+    """
+
+    _instances = {}
+
+    def __init__(self, minutes):
+        self._minutes = minutes
+        self._offset = datetime.timedelta(minutes=minutes)
+
+    @classmethod
+    def get(cls, minutes):
+        try:
+            return cls._instances[minutes]
+        except KeyError:
+            return cls._instances.setdefault(minutes, cls(minutes))
+
+    def __getinitargs__(self):
+        return (self._minutes,)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, self._minutes)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        if not self._minutes:
+            return 'UTC'
+
+        sign = '-' if self._minutes < 0 else '+'
+
+        return '{}{:02d}:{:02d}'.format(sign, *divmod(abs(self._minutes), 60))
 
 
 class List(Decoder):
@@ -68,6 +259,15 @@ class List(Decoder):
         self._decoders = decoders
 
     def decode(self, value):
+        if not isinstance(value, (list, tuple)):
+            raise errors.DecodeError()
+
+        if len(self._decoders) == 1:
+            decode_many = getattr(self._decoders[0], 'decode_many', None)
+
+            if decode_many is not None:
+                return decode_many(value)
+
         result = []
         for item in value:
             for decoder in self._decoders:
@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import collections
 
-from . import mixins, errors
+from . import _utils, mixins, errors
 from .helpers import nullable
 
 
@@ -40,6 +41,10 @@ class List(Encoder):
         if not isinstance(value, collections.MutableSequence):
             raise errors.EncodeError()
 
+        if (len(self._encoders) == 1 and
+                _utils.encodes_many(self._encoders[0])):
+            return self._encoders[0].encode_many(value)
+
         result = []
         for item in value:
             for encoder in self._encoders:
@@ -51,16 +56,83 @@ class List(Encoder):
 
 
 class DateTime(Encoder):
-    def __init__(self, format=None):
+    """Encodes :py:class:`datetime.datetime` objects as `ISO 8601`
+    strings, as strings in the given `format` or as numbers since the
+    Unix epoch.
+
+    The `epoch` mode can be `seconds` or `milliseconds`, encoded as
+    integers, or `float`, encoded as seconds with microsecond precision.
+    Naive datetimes are taken as UTC.
+
+    """
+
+    def __init__(self, format=None, epoch=None):
+        _check_datetime_mode(format, epoch)
+
         self._format = format
+        self._epoch = epoch
 
     @nullable
     def encode(self, value):
+        if self._epoch is not None:
+            return _EPOCH_ENCODERS[self._epoch](_since_epoch(value))
+
         if self._format is None:
             return value.isoformat()
 
         return value.strftime(self._format)
 
+    def encode_many(self, values):
+        """Encodes a whole `list` of datetimes at once."""
+
+        if self._epoch is not None:
+            encode = _EPOCH_ENCODERS[self._epoch]
+
+            return [None if value is None else encode(_since_epoch(value))
+                    for value in values]
+
+        if self._format is None:
+            return [None if value is None else value.isoformat()
+                    for value in values]
+
+        format = self._format
+
+        return [None if value is None else value.strftime(format)
+                for value in values]
+
+
+EPOCH_MODES = ('seconds', 'milliseconds', 'float')
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+_EPOCH_ENCODERS = {
+    'seconds': lambda delta: delta.days * 86400 + delta.seconds,
+    'milliseconds': lambda delta: (
+        (delta.days * 86400 + delta.seconds) * 1000 +
+        delta.microseconds // 1000),
+    'float': lambda delta: (
+        delta.days * 86400 + delta.seconds + delta.microseconds / 1e6)
+}
+
+
+def _since_epoch(value):
+    offset = value.utcoffset()
+
+    if offset is not None:
+        value = value.replace(tzinfo=None) - offset
+
+    return value - EPOCH
+
+
+def _check_datetime_mode(format, epoch):
+    if epoch is not None:
+        if epoch not in EPOCH_MODES:
+            raise ValueError('epoch should be one of {}, not {!r}'.format(
+                EPOCH_MODES, epoch))
+
+        if format is not None:
+            raise ValueError('format and epoch are mutually exclusive')
+
 
 class Collection(List):
     def __init__(self):
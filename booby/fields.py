@@ -32,12 +32,15 @@ The example below shows the most common fields and builtin validations::
         is_active = Boolean(default=False)
 """
 
+import inspect
 import collections
 
 from booby import (
     validators as builtin_validators,
     encoders as builtin_encoders,
     decoders as builtin_decoders,
+    errors,
+    interning,
     _utils
 )
 
@@ -99,21 +102,77 @@ class Field(object):
 
         return self
 
+    def _peek(self, instance):
+        """Returns the value of this field in the given model `instance`
+        like :func:`__get__` does, but without storing the default value
+        if the field is not set. Used by the model read-only traversals,
+        so they don't grow the instances they visit.
+
+        Defaults from arbitrary callables are still stored, as calling
+        them again may return a different value.
+
+        """
+
+        data = instance._data
+
+        try:
+            return data[self]
+        except KeyError:
+            if self._pure_default:
+                return self._default(instance)
+
+            return data.setdefault(self, self._default(instance))
+
     def __set__(self, instance, value):
         instance._data[self] = value
 
+        validated = instance._validated
+
+        if validated:
+            validated.discard(self)
+            validated.subtree = None
+
+    def _resolve(self, value):
+        return value
+
+    @property
+    def default(self):
+        return self.__default
+
+    @default.setter
+    def default(self, value):
+        self.__default = value
+        self.__default_arity = _arity(value)
+
+        if inspect.isclass(value) and value in _IMMUTABLE_FACTORIES:
+            self.__default_value = value()
+            self.__default_arity = None
+        else:
+            self.__default_value = value
+
+        self._pure_default = (self.__default_arity is None or
+                              value in (list, dict, set))
+
     def _default(self, model):
-        if callable(self.default):
-            return self.__call_default(model)
+        arity = self.__default_arity
+
+        if arity is None:
+            return self.__default_value
+
+        if arity == 0:
+            return self.__default()
 
-        return self.default
+        if arity == 1:
+            return self.__default(model)
+
+        return self.__call_default(model)
 
     def __call_default(self, *args):
         try:
-            return self.default()
+            return self.__default()
         except TypeError as error:
             try:
-                return self.default(*args)
+                return self.__default(*args)
             except TypeError:
                 raise error
 
@@ -121,6 +180,30 @@ class Field(object):
         for validator in self.validators:
             validator(value)
 
+    def validate_many(self, values):
+        """Validates a whole column of values for this field, running each
+        validator over all the values still valid at once. Returns a
+        `dict` mapping the positions of the values that don't validate to
+        the error message of the first failing validator.
+
+        """
+
+        result = {}
+
+        for validator in self.validators:
+            if not result:
+                result.update(_validate_many(validator, values))
+                continue
+
+            positions = [i for i in range(len(values)) if i not in result]
+            failures = _validate_many(
+                validator, [values[i] for i in positions])
+
+            for i, message in failures.items():
+                result[positions[i]] = message
+
+        return result
+
     def decode(self, value):
         for decoder in self.options.get('decoders', []):
             value = decoder(value)
@@ -134,12 +217,110 @@ class Field(object):
         return value
 
 
+# Callable defaults returning immutable values are called only once and
+# their value shared by all the instances.
+_IMMUTABLE_FACTORIES = frozenset([
+    tuple, frozenset, str, unicode, int, long, float, bool])
+
+_UNKNOWN_ARITY = -1
+
+try:
+    _getargspec = inspect.getfullargspec
+except AttributeError:
+    _getargspec = inspect.getargspec
+
+
+def _arity(default):
+    # Returns `None` for static defaults, and otherwise the number of
+    # arguments the `default` callable has to be called with: 0, or 1 to
+    # pass the model instance. Callables that can't be inspected fall
+    # back to trying both.
+
+    if not callable(default):
+        return None
+
+    if inspect.isclass(default):
+        return _class_arity(default)
+
+    if inspect.isfunction(default) or inspect.ismethod(default):
+        function = default
+        bound = getattr(default, '__self__', None) is not None
+    else:
+        function, bound = getattr(default, '__call__', None), True
+
+    try:
+        spec = _getargspec(function)
+    except TypeError:
+        return _UNKNOWN_ARITY
+
+    required = len(spec.args) - len(spec.defaults or ()) - int(bound)
+
+    return 1 if required > 0 else 0
+
+
+def _class_arity(cls):
+    # Classes take the model instance if their `__new__` or `__init__`
+    # methods require an argument. Builtin methods that can't be
+    # inspected, and the ones missing in old-style classes, take none.
+    for name in ('__new__', '__init__'):
+        try:
+            spec = _getargspec(getattr(cls, name))
+        except (AttributeError, TypeError):
+            continue
+
+        if len(spec.args) - len(spec.defaults or ()) > 1:
+            return 1
+
+    return 0
+
+
+def _validate_many(validator, values):
+    # Subclasses of the builtin validators overriding `validate` only
+    # inherit a `validate_many` that doesn't run their checks.
+    if _utils.validates_many(validator):
+        return validator.validate_many(values)
+
+    result = {}
+
+    for i, value in enumerate(values):
+        try:
+            validator(value)
+        except errors.ValidationError as err:
+            result[i] = str(err)
+
+    return result
+
+
 class String(Field):
-    """:class:`Field` subclass with builtin `string` validation."""
+    """:class:`Field` subclass with builtin `string` validation.
+
+    :param intern: If `True`, values are deduplicated through an
+        :class:`interning.InternTable` of this field when decoded and
+        assigned, so equal strings share a single copy. An
+        :class:`interning.InternTable` can be given to share it between
+        fields. Fields with string `choices` intern their values unless
+        `intern` is `False`.
+
+    """
 
     def __init__(self, *args, **kwargs):
+        table = interning.table_for(kwargs)
+
+        if table is not None:
+            kwargs.setdefault('decoders', []).append(table)
+
         super(String, self).__init__(builtin_validators.String(), *args, **kwargs)
 
+        self.intern_table = table
+
+    def __set__(self, instance, value):
+        super(String, self).__set__(instance, self._resolve(value))
+
+    def _resolve(self, value):
+        table = self.intern_table
+
+        return value if table is None else table.intern(value)
+
 
 class Integer(Field):
     """:class:`Field` subclass with builtin `integer` validation."""
@@ -162,6 +343,87 @@ class Boolean(Field):
         super(Boolean, self).__init__(builtin_validators.Boolean(), *args, **kwargs)
 
 
+class Enum(Field):
+    """:class:`Field` subclass whose values are one of the given `choices`.
+
+    The position of each choice is computed once, so values are validated
+    with a `set` lookup and the :mod:`binary` and :mod:`records` formats
+    write them as their index. They are encoded and decoded unchanged.
+
+    :param choices: A sequence of distinct hashable values.
+    :param store_index: If `True`, model instances store the index of the
+        value instead of the value itself. Not supported by `slots`
+        models.
+
+    """
+
+    def __init__(self, choices, *args, **kwargs):
+        self.choices = tuple(choices)
+        self.indexes = dict(
+            (choice, i) for i, choice in enumerate(self.choices))
+
+        if not self.choices or len(self.indexes) != len(self.choices):
+            raise ValueError('Enum choices should be distinct and not empty')
+
+        kwargs['choices'] = list(self.choices)
+
+        super(Enum, self).__init__(*args, **kwargs)
+
+        self.store_index = kwargs.get('store_index', False)
+
+    def __get__(self, instance, owner):
+        if instance is None or not self.store_index:
+            return super(Enum, self).__get__(instance, owner)
+
+        try:
+            return self._value_of(instance._data[self])
+        except KeyError:
+            value = self._default(instance)
+            instance._data[self] = self._index_of(value)
+            return value
+
+    def _peek(self, instance):
+        if not self.store_index:
+            return super(Enum, self)._peek(instance)
+
+        try:
+            return self._value_of(instance._data[self])
+        except KeyError:
+            if self._pure_default:
+                return self._default(instance)
+
+            return self.__get__(instance, type(instance))
+
+    def __set__(self, instance, value):
+        super(Enum, self).__set__(instance, self._resolve(value))
+
+    def _resolve(self, value):
+        return self._index_of(value) if self.store_index else value
+
+    def _index_of(self, value):
+        try:
+            return self.indexes[value]
+        except (KeyError, TypeError):
+            return value if value is None else _Unknown(value)
+
+    def _value_of(self, stored):
+        if type(stored) is int:
+            return self.choices[stored]
+
+        if type(stored) is _Unknown:
+            return stored.value
+
+        return stored
+
+
+class _Unknown(object):
+    # A value not in the choices of an `Enum` storing indexes, kept apart
+    # from indexes when the choices are integers.
+
+    def __init__(self, value):
+        self.value = value
+
+
 class Embedded(Field):
     """:class:`Field` subclass with builtin embedded :class:`models.Model`
     validation.
@@ -177,10 +439,40 @@ class Embedded(Field):
         self.model = model
 
     def __set__(self, instance, value):
-        if isinstance(value, collections.MutableMapping):
-            value = self.model(**value)
+        super(Embedded, self).__set__(instance, self._resolve(value))
 
-        super(Embedded, self).__set__(instance, value)
+    def _resolve(self, value):
+        if (type(value) is dict or
+                isinstance(value, collections.MutableMapping)):
+            return self.model.from_dict(value)
+
+        return value
+
+
+class DateTime(Field):
+    """:class:`Field` subclass with builtin :py:class:`datetime.datetime`
+    validation, encoding and decoding.
+
+    Values are encoded as `ISO 8601` strings by default. Pass a `format`
+    to encode them with :py:meth:`datetime.datetime.strftime` instead, or
+    an `epoch` mode to encode them as numbers since the Unix epoch. See
+    :class:`encoders.DateTime` for the supported modes::
+
+        class Sample(Model):
+            taken_at = DateTime(epoch='milliseconds')
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        format, epoch = kwargs.get('format'), kwargs.get('epoch')
+
+        kwargs.setdefault('encoders', []).append(
+            builtin_encoders.DateTime(format, epoch))
+        kwargs.setdefault('decoders', []).append(
+            builtin_decoders.DateTime(format, epoch))
+
+        super(DateTime, self).__init__(
+            builtin_validators.DateTime(), *args, **kwargs)
 
 
 class Email(Field):
@@ -245,15 +537,17 @@ class Collection(Field):
         self.model = model
 
     def __set__(self, instance, value):
-        if isinstance(value, collections.MutableSequence):
-            value = self._resolve(value)
-
-        super(Collection, self).__set__(instance, value)
+        super(Collection, self).__set__(instance, self._resolve(value))
 
     def _resolve(self, value):
+        if not isinstance(value, collections.MutableSequence):
+            return value
+
+        model = self.model
         result = []
         for item in value:
-            if isinstance(item, collections.MutableMapping):
-                item = self.model(**item)
+            if (type(item) is dict or
+                    isinstance(item, collections.MutableMapping)):
+                item = model.from_dict(item)
             result.append(item)
         return result
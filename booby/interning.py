@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`interning` module deduplicates repeated string values, so
+all the models holding an equal string share a single copy of it.
+
+:class:`fields.String` fields intern their values when decoded and
+assigned if created with the `intern` option, and by default if they
+have `choices`::
+
+    class User(Model):
+        country = fields.String(intern=True)
+        role = fields.String(choices=['admin', 'user'])
+
+    users = [User(**User.decode(raw)) for raw in payload]
+
+    print User.country.intern_table.hit_rate
+
+"""
+
+import sys
+
+DEFAULT_MAX_SIZE = 10000
+
+
+class InternTable(object):
+    """A bounded table of canonical strings. Once `max_size` strings are
+    stored new values are returned unchanged, so tables for fields with
+    unexpectedly high cardinality don't grow without limit.
+
+    Tables are callables, so they can be used as field `decoders` too.
+
+    :param max_size: The maximum number of strings stored.
+    :param values: Strings to store upfront, like the `choices` of a
+        field.
+
+    :ivar hits: The number of values replaced by an equal stored string.
+    :ivar misses: The number of values stored.
+    :ivar rejected: The number of values not stored as the table was full.
+    :ivar bytes_saved: The size of the values replaced by stored strings.
+
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, values=()):
+        self.max_size = max_size
+        self._strings = {}
+        self.clear()
+
+        for value in values:
+            if isinstance(value, basestring) and len(self) < max_size:
+                self._strings.setdefault((type(value), value), value)
+
+    def intern(self, value):
+        """Returns the stored string equal to the given `value`, storing
+        it if there is none and the table isn't full. Values other than
+        strings are returned unchanged.
+
+        Strings are stored by type too, so a `unicode` value is never
+        replaced by an equal `str` one.
+
+        """
+
+        key = type(value), value
+
+        try:
+            canonical = self._strings[key]
+        except KeyError:
+            if not isinstance(value, basestring):
+                return value
+
+            if len(self._strings) >= self.max_size:
+                self.rejected += 1
+                return value
+
+            self.misses += 1
+            self._strings[key] = value
+            return value
+        except TypeError:
+            return value
+
+        # Values already interned are not counted, so a value interned
+        # when decoded and again when assigned is only counted once.
+        if canonical is not value:
+            self.hits += 1
+            self.bytes_saved += sys.getsizeof(value)
+
+        return canonical
+
+    __call__ = intern
+
+    @property
+    def hit_rate(self):
+        """The ratio of values replaced by a stored string."""
+
+        total = self.hits + self.misses + self.rejected
+
+        return float(self.hits) / total if total else 0.0
+
+    def clear(self):
+        """Removes the stored strings and resets the counters."""
+
+        self._strings.clear()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.bytes_saved = 0
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, value):
+        return (type(value), value) in self._strings
+
+    def __repr__(self):
+        cls = type(self)
+
+        return '<{}.{}(size={}, hits={}, misses={}, rejected={})>'.format(
+            cls.__module__, cls.__name__, len(self), self.hits, self.misses,
+            self.rejected)
+
+
+def table_for(options):
+    """Returns the :class:`InternTable` for a :class:`fields.String` field
+    with the given `options`, or :keyword:`None` if its values shouldn't
+    be interned.
+
+    The `intern` option can be `True`, for a table of the field, an
+    :class:`InternTable` shared with other fields or `False`. By default
+    fields with string `choices` intern them.
+
+    """
+
+    intern = options.get('intern')
+
+    if isinstance(intern, InternTable):
+        return intern
+
+    if intern:
+        return InternTable()
+
+    choices = options.get('choices')
+
+    if (intern is None and choices and
+            all(isinstance(choice, basestring) for choice in choices)):
+        return InternTable(len(choices), choices)
+
+    return None
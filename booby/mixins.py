@@ -14,11 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from booby import compiler
+
 
 class Encoder(object):
+    __slots__ = ()
+
     def encode(self):
+        plan = compiler.plan_for(type(self))
+
+        if plan is not None:
+            return plan.encode(self)
+
         return {
             field.options.get('name', name): field.encode(getattr(self, name))
-                for name, field in self._fields.items()
+                for name, field in compiler.present_fields(self)
                 if not field.options.get('read_only', False)
         }
@@ -41,7 +41,11 @@ Something like this::
 import json
 import collections
 
-from booby import mixins, fields, errors, _utils
+from booby import (mixins, fields, errors, compiler, batch, streaming,
+                   reports, binary, _utils)
+
+
+_NOT_VALIDATED = frozenset()
 
 
 class ModelMeta(type):
@@ -60,13 +64,115 @@ class ModelMeta(type):
             if isinstance(v, fields.Field):
                 attrs['_fields'][k] = v
 
-        return super(ModelMeta, cls).__new__(cls, name, bases, attrs)
+        storage = attrs.get('__storage__')
+
+        if storage is None:
+            storage = next((getattr(base, '__storage__') for base in bases
+                            if hasattr(base, '__storage__')), 'dict')
+
+        if storage != 'slots':
+            return super(ModelMeta, cls).__new__(cls, name, bases, attrs)
+
+        inherited = _inherited_slots(bases)
+        slots = [k for k in sorted(attrs['_fields']) if k not in inherited]
+
+        for k in slots:
+            attrs.pop(k, None)
+
+        if not any(getattr(base, '__storage__', None) == 'slots'
+                   for base in bases):
+            slots.append('_validated')
+
+        attrs['__slots__'] = tuple(attrs.get('__slots__', ())) + tuple(slots)
+        attrs['__storage__'] = storage
+
+        model = super(ModelMeta, cls).__new__(cls, name, bases, attrs)
+
+        for k, field in model._fields.items():
+            if getattr(field, 'store_index', False):
+                raise TypeError(
+                    "field '{}' storing indexes can not be used in a slots "
+                    "model".format(k))
+
+            if k in inherited:
+                if inherited[k].field is field:
+                    continue
+
+                slot = inherited[k].slot
+            else:
+                slot = model.__dict__[k]
+
+            setattr(model, k, _SlotField(field, slot))
+
+        return model
 
     def __repr__(cls):
         return '<{}.{}({})>'.format(cls.__module__, cls.__name__,
                                     _utils.repr_options(cls._fields))
 
 
+def _inherited_slots(bases):
+    result = {}
+
+    for base in reversed(bases):
+        for klass in reversed(base.__mro__):
+            for k, v in klass.__dict__.items():
+                if isinstance(v, _SlotField):
+                    result[k] = v
+
+    return result
+
+
+def _unpickle(cls, mask, values):
+    return compiler.ensure_plan(cls).load(mask, values)
+
+
+class _SlotField(object):
+    """Descriptor placed in `slots` models instead of each field. Stores
+    the field value in an instance slot and returns the field itself when
+    accessed through the class.
+
+    """
+
+    def __init__(self, field, slot):
+        self.field = field
+        self.slot = slot
+
+        self._resolve = compiler.resolver_for(field)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.field
+
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.field._default(instance)
+            self.slot.__set__(instance, value)
+            return value
+
+    def _peek(self, instance):
+        try:
+            return self.slot.__get__(instance, type(instance))
+        except AttributeError:
+            if self.field._pure_default:
+                return self.field._default(instance)
+
+            return self.__get__(instance, type(instance))
+
+    def __set__(self, instance, value):
+        if self._resolve is not None:
+            value = self._resolve(value)
+
+        self.slot.__set__(instance, value)
+
+        validated = instance._validated
+
+        if validated:
+            validated.discard(self.field)
+            validated.subtree = None
+
+
 class Model(mixins.Encoder):
     """The `Model` class. All Booby models should subclass this.
 
@@ -86,20 +192,102 @@ class Model(mixins.Encoder):
           File "<stdin>", line 1, in <module>
         errors.FieldError: foo
 
+    By default field values are kept in a per-instance `dict`. Models
+    holding many instances in memory can store them in `slots` instead,
+    which makes instances smaller and attribute access faster::
+
+        class Point(Model):
+            __storage__ = 'slots'
+
+            x = fields.Integer()
+            y = fields.Integer()
+
+    Instances of `slots` models have no `__dict__`, so attributes other
+    than the model fields cannot be set on them.
+
+    Models with lots of optional fields, of which only a few are set in
+    each instance, can use the `sparse` storage mode. Encoding,
+    validating and iterating a `sparse` model only visits the fields set
+    in the instance and those with a default value other than `None`::
+
+        class Event(Model):
+            __storage__ = 'sparse'
+
+            kind = fields.String(required=True)
+            # ... hundreds of optional fields
+
+    Unset fields without a default value are omitted from the `sparse`
+    model encoded `dict` and iteration, and they are validated only if
+    their validators reject `None`, like `required` fields do.
+
+    The storage mode is inherited by subclasses.
+
     :param \*\*kwargs: Keyword arguments with the fields values to initialize the model.
 
     """
 
     __metaclass__ = ModelMeta
+    __slots__ = ()
+    __storage__ = 'dict'
+
+    _validated = _NOT_VALIDATED
 
     def __new__(cls, *args, **kwargs):
         model = super(Model, cls).__new__(cls)
-        model._data = {}
+
+        if cls.__storage__ != 'slots':
+            model._data = {}
+        else:
+            model._validated = _NOT_VALIDATED
 
         return model
 
+    def __reduce__(self):
+        """Pickles the `model` as its class, a bitmask of the fields set
+        in the instance and a tuple with their values, in the compiled
+        plan order. Unset fields are omitted, and the fields themselves
+        are never pickled. Other attributes in the instance `__dict__`,
+        if any, are pickled as its state.
+
+        Pickles can only be loaded by a `model` class with the same
+        fields.
+
+        """
+
+        cls = type(self)
+        mask, values = compiler.ensure_plan(cls).dump(self)
+        state = getattr(self, '__dict__', None)
+
+        if state:
+            state = dict((k, v) for k, v in state.items()
+                         if k not in ('_data', '_validated'))
+
+        return _unpickle, (cls, mask, values), state or None
+
     def __init__(self, **kwargs):
-        self._update(kwargs)
+        plan = compiler.plan_for(type(self))
+
+        if plan is None:
+            self._update(kwargs)
+        else:
+            plan.init(self, kwargs)
+
+    @classmethod
+    def from_dict(cls, values):
+        """Returns a new instance of this `model` initialized with the
+        given mapping of field names to values. Works like `Model(**values)`
+        without unpacking the mapping into keyword arguments, and is used
+        to build the models assigned to :class:`fields.Embedded` and
+        :class:`fields.Collection` fields as mappings.
+
+        """
+
+        plan = compiler.plan_for(cls)
+
+        if plan is None:
+            return cls(**values)
+
+        return plan.from_dict(values)
 
     def __repr__(self):
         cls = type(self)
@@ -108,8 +296,15 @@ class Model(mixins.Encoder):
                                     _utils.repr_options(dict(self)))
 
     def __iter__(self):
-        for name in self._fields:
-            value = getattr(self, name)
+        plan = compiler.plan_for(type(self))
+
+        if plan is None:
+            items = ((name, getattr(self, name))
+                     for name, _ in compiler.present_fields(self))
+        else:
+            items = ((f.name, f.read(self)) for f in plan.present(self))
+
+        for name, value in items:
 
             if isinstance(value, Model):
                 value = dict(value)
@@ -180,14 +375,47 @@ class Model(mixins.Encoder):
         exception that the :func:`field.validate` method had raised, but
         with the field name prepended.
 
+        Validation is incremental: fields holding immutable values are not
+        validated again until they are assigned a new value. Embedded
+        models and collections are always checked, but their own unchanged
+        fields are skipped the same way, so validating an unchanged tree
+        again is cheap.
+
         """
 
-        for name, field in self._fields.items():
+        plan = compiler.plan_for(type(self))
+
+        if plan is not None:
+            return plan.validate(self)
+
+        for name, field in compiler.present_fields(self, validating=True):
             try:
                 field.validate(getattr(self, name))
             except errors.ValidationError as err:
                 raise errors.ValidationError('%s %s' % (name, err))
 
+    def validation_report(self, max_errors=None):
+        """Validates the entire `model`, and the models it contains, in a
+        single pass and returns a :class:`reports.ValidationReport` with
+        all the errors found, each with the path of the failing field,
+        like `tokens[3].key`, and an error code. Validation stops after
+        `max_errors` errors, if given. See :func:`reports.validate`.
+
+        """
+
+        return reports.validate(self, max_errors)
+
+    @classmethod
+    def validate_many(cls, instances):
+        """Validates a batch of instances of this `model` column by column
+        and returns a :class:`batch.BatchValidation` with a valid mask and
+        all the errors indexed by record and field name. See
+        :func:`batch.validate_many`.
+
+        """
+
+        return batch.validate_many(cls, instances)
+
     @property
     def validation_errors(self):
         """Generator of field name and validation error string pairs
@@ -195,9 +423,20 @@ class Model(mixins.Encoder):
 
         """
 
-        for name, field in self._fields.items():
+        plan = compiler.plan_for(type(self))
+
+        if plan is None:
+            items = ((name, field.validate, getattr(self, name))
+                     for name, field in compiler.present_fields(
+                         self, validating=True))
+        else:
+            items = ((f.name, f.validate, f.read(self))
+                     for f in plan.present(self, validating=True)
+                     if f.validate is not None)
+
+        for name, validate, value in items:
             try:
-                field.validate(getattr(self, name))
+                validate(value)
             except errors.ValidationError as err:
                 yield name, str(err)
 
@@ -205,15 +444,77 @@ class Model(mixins.Encoder):
         """This method returns the `model` as a `json string`. It receives
         the same arguments as the builtin :py:func:`json.dump` function.
 
-        To build a json representation of this `model` this method iterates
-        over the object to build a `dict` and then serializes it as json.
+        To build a json representation of this `model` this method
+        serializes the result of :func:`encode`, so field `encoders` and
+        the `name` and `read_only` options are honored.
+
+        """
+
+        return json.dumps(self.encode(), *args, **kwargs)
+
+    def to_json_stream(self, fp, **kwargs):
+        """This method writes the `model` as `json` to the given file-like
+        object or socket, in chunks, without building the whole document
+        in memory. Useful for models with huge collections.
+
+        It receives the same keyword arguments as :func:`to_json`, except
+        `indent`. See :func:`streaming.dump`.
+
+        """
+
+        streaming.dump(self, fp, **kwargs)
+
+    def iter_json(self, **kwargs):
+        """Returns a generator of chunks of the `model` `json`
+        representation. See :func:`streaming.iterencode`.
+
+        """
+
+        return streaming.iterencode(self, **kwargs)
+
+    def to_bytes(self):
+        """This method returns the `model` serialized in the compact
+        binary format of the :mod:`binary` module. See :func:`binary.dumps`.
+
+        """
+
+        return binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns an instance of this `model` read from the given `bytes`
+        returned by :func:`to_bytes`. See :func:`binary.loads`.
 
         """
 
-        return json.dumps(dict(self), *args, **kwargs)
+        return binary.loads(cls, data)
+
+    @classmethod
+    def to_bytes_many(cls, instances):
+        """Returns the given iterable of instances of this `model`
+        serialized as a single binary document. See
+        :func:`binary.dumps_many`.
+
+        """
+
+        return binary.dumps_many(cls, instances)
+
+    @classmethod
+    def from_bytes_many(cls, data):
+        """Returns a `list` with the instances of this `model` read from
+        the given `bytes` returned by :func:`to_bytes_many`.
+
+        """
+
+        return binary.loads_many(cls, data)
 
     @classmethod
     def decode(self, raw):
+        plan = compiler.plan_for(self)
+
+        if plan is not None:
+            return plan.decode(raw)
+
         result = {}
 
         for name, field in self._fields.items():
@@ -227,3 +528,50 @@ class Model(mixins.Encoder):
             result[name] = value
 
         return result
+
+    @classmethod
+    def decode_lazy(cls, raw):
+        """Returns an instance of this `model` backed by the given `raw`
+        mapping. Each field is decoded the first time it is read and
+        :class:`fields.Embedded` and :class:`fields.Collection` values
+        are decoded lazily too, so the parts of the document never read
+        are never built.
+
+        Encoding the instance passes the `raw` value of the fields never
+        read through unchanged.
+
+        Models with `slots` storage or a custom `__init__` are decoded
+        eagerly.
+
+        """
+
+        plan = compiler.plan_for(cls)
+
+        if plan is None:
+            return cls(**cls.decode(raw))
+
+        return plan.build_lazy(raw)
+
+    @classmethod
+    def decode_stream(cls, source, path=(), on_error='raise', failures=None,
+                      validate=False):
+        """Returns a generator of instances of this `model` decoded from the
+        elements of a JSON array read incrementally from a file-like
+        object or an iterable of chunks. See :func:`streaming.load`.
+
+        """
+
+        return streaming.load(cls, source, path, on_error=on_error,
+                              failures=failures, validate=validate)
+
+    @classmethod
+    def decode_many(cls, raws, on_error='raise', failures=None,
+                    validate=False):
+        """Returns a generator of instances of this `model` decoded from
+        the given iterable of `raw` mappings, built in a single pass
+        without the intermediate decoded `dict`. See
+        :func:`batch.decode_many` for the supported arguments.
+
+        """
+
+        return batch.decode_many(cls, raws, on_error, failures, validate)
@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`records` module stores flat models as fixed size records
+packed with :py:mod:`struct`, and reads files of them through
+:py:mod:`mmap` as random access sequences::
+
+    class Sample(Model):
+        sensor = fields.String()
+        value = fields.Float()
+        count = fields.Integer()
+
+    layout = records.Layout(Sample, sizes={'sensor': 8})
+
+    with open('samples.bin', 'wb') as fp:
+        layout.dump(samples, fp)
+
+    with layout.open('samples.bin') as samples:
+        sample = samples[1000]
+
+Opening a file doesn't parse it. Records are only unpacked when indexed,
+and the file pages are shared by all the processes that open it.
+
+"""
+
+import os
+import mmap
+import struct
+import hashlib
+import collections
+
+from booby import compiler, errors, fields
+
+MAGIC = b'BBYR'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sB3x8s')
+
+HEADER_SIZE = _HEADER.size
+
+_FORMATS = {
+    fields.Integer: 'q',
+    fields.Float: 'd',
+    fields.Boolean: '?'
+}
+
+# The types accepted by each packed field type, as `struct` would coerce
+# other values, and their description in error messages.
+_TYPES = {
+    fields.Integer: ((int, long), 'an integer'),
+    fields.Float: ((float, int, long), 'a float'),
+    fields.Boolean: (bool, 'a boolean')
+}
+
+_MASKS = ((8, 'B'), (16, 'H'), (32, 'I'), (64, 'Q'))
+
+
+class Layout(object):
+    """The fixed size record layout of the given `model` class, with the
+    fields in the compiled plan order after a bitmask of the fields that
+    are :keyword:`None`.
+
+    `Integer` fields are stored as signed 64 bit integers, `Float` fields
+    as doubles and `Boolean` fields as a byte. `String` and `Email` fields
+    are stored as UTF-8 in the number of bytes given for their name in
+    `sizes`, padded with null bytes, so their values can't contain null
+    characters. `Enum` fields are stored as the index of their value, in
+    one, two or four bytes.
+
+    :raises: :py:exc:`ValueError` if the `model` has fields of any other
+        type, a `String` field without a size or more than 64 fields.
+
+    """
+
+    def __init__(self, model, sizes=None):
+        sizes = sizes or {}
+        plan = compiler.ensure_plan(model)
+        codes = []
+        strings = []
+        enums = []
+        typed = []
+
+        for i, f in enumerate(plan.fields):
+            field_type = type(f.field)
+
+            if field_type in (fields.String, fields.Email):
+                if f.name not in sizes:
+                    raise ValueError(
+                        'missing size for string field {!r}'.format(f.name))
+
+                codes.append('{}s'.format(sizes[f.name]))
+                strings.append((i, f.name, sizes[f.name]))
+            elif field_type is fields.Enum:
+                codes.append(_index_code(len(f.field.choices)))
+                enums.append((i, f.name, f.field))
+            elif field_type in _FORMATS:
+                codes.append(_FORMATS[field_type])
+                typed.append((i, f.name) + _TYPES[field_type])
+            else:
+                raise ValueError(
+                    'field {!r} of type {} can not be packed'.format(
+                        f.name, field_type.__name__))
+
+        mask_code = next(
+            (code for bits, code in _MASKS if len(codes) <= bits), None)
+
+        if mask_code is None:
+            raise ValueError('records are limited to 64 fields')
+
+        self.model = model
+        self.names = tuple(f.name for f in plan.fields)
+        self.format = '<' + mask_code + ''.join(codes)
+        self.size = struct.calcsize(self.format)
+        self.fingerprint = hashlib.sha1(
+            (self.format + ',' + ','.join(self.names) +
+             ''.join(repr(field.choices) for _, _, field in enums)
+             ).encode('utf-8')).digest()[:8]
+        self.view_class = collections.namedtuple(
+            model.__name__ + 'Record', self.names)
+
+        self._sizes = dict(sizes)
+        self._plan = plan
+        self._struct = struct.Struct(self.format)
+        self._strings = tuple(strings)
+        self._enums = tuple(enums)
+        self._typed = tuple(typed)
+        self._columns = dict(
+            (name, (i, _column_unpacker(mask_code, codes, i)))
+            for i, name in enumerate(self.names))
+        self._empty = tuple(b'' if code.endswith('s') else 0
+                            for code in codes)
+        self._all = (1 << len(codes)) - 1
+
+    def pack(self, instance):
+        """Returns the given model `instance` packed as a record.
+
+        :raises: :class:`errors.EncodeError` if a value doesn't match
+            its field type or doesn't fit in it.
+
+        """
+
+        values = [f.read(instance) for f in self._plan.fields]
+        nulls = 0
+
+        for i, value in enumerate(values):
+            if value is None:
+                nulls |= 1 << i
+                values[i] = self._empty[i]
+
+        for i, name, types, description in self._typed:
+            value = values[i]
+
+            # `bool` values are integers too, so only Boolean fields
+            # accept them.
+            if not nulls >> i & 1 and (
+                    not isinstance(value, types) or
+                    type(value) is bool and types is not bool):
+                raise errors.EncodeError(
+                    '{} should be {}'.format(name, description))
+
+        for i, name, size in self._strings:
+            values[i] = _encoded_string(values[i], name, size)
+
+        for i, name, field in self._enums:
+            if not nulls >> i & 1:
+                try:
+                    values[i] = field.indexes[values[i]]
+                except (KeyError, TypeError):
+                    raise errors.EncodeError('{} should be in {}'.format(
+                        name, list(field.choices)))
+
+        try:
+            return self._struct.pack(nulls, *values)
+        except struct.error as err:
+            raise errors.EncodeError("can not pack '{}' record: {}".format(
+                self.model.__name__, err))
+
+    def unpack(self, data, offset=0):
+        """Returns a new model instance with the record packed in the
+        given buffer `data` at `offset`.
+
+        """
+
+        nulls, values = self._unpack(data, offset, stored=True)
+        present = self._all & ~nulls
+
+        if nulls:
+            values = [value for i, value in enumerate(values)
+                      if present >> i & 1]
+
+        return self._plan.load(present, values)
+
+    def view(self, data, offset=0):
+        """Returns a read-only :py:func:`collections.namedtuple` with the
+        values of the record packed in the given buffer `data` at
+        `offset`, without building a model instance.
+
+        """
+
+        nulls, values = self._unpack(data, offset)
+
+        if nulls:
+            values = [None if nulls >> i & 1 else value
+                      for i, value in enumerate(values)]
+
+        return self.view_class._make(values)
+
+    def _unpack(self, data, offset, stored=False):
+        # If `stored`, `Enum` fields storing indexes keep them, as they
+        # are loaded straight into the model instance storage.
+        values = self._struct.unpack_from(data, offset)
+        nulls = values[0]
+        values = list(values[1:])
+
+        for i, _, _ in self._strings:
+            values[i] = values[i].rstrip(b'\0').decode('utf-8')
+
+        for i, _, field in self._enums:
+            if not (stored and field.store_index):
+                values[i] = field.choices[values[i]]
+
+        return nulls, values
+
+    def column(self, data, offset, length, name):
+        """Returns a `list` with the values of the field `name` in the
+        `length` records packed in the given buffer `data` from `offset`,
+        unpacking only that field.
+
+        """
+
+        index, unpack = self._columns[name]
+        field = self._plan.fields[index].field
+        is_string = any(i == index for i, _, _ in self._strings)
+        choices = field.choices if type(field) is fields.Enum else None
+        result = []
+
+        for record in range(offset, offset + length * self.size, self.size):
+            nulls, value = unpack(data, record)
+
+            if nulls >> index & 1:
+                value = None
+            elif is_string:
+                value = value.rstrip(b'\0').decode('utf-8')
+            elif choices is not None:
+                value = choices[value]
+
+            result.append(value)
+
+        return result
+
+    def header(self):
+        """Returns the header written before the records, with the
+        layout fingerprint.
+
+        """
+
+        return _HEADER.pack(MAGIC, VERSION, self.fingerprint)
+
+    def check_header(self, data, offset=0):
+        """Checks the header at `offset` in the given buffer `data` was
+        written by this layout.
+
+        :raises: :class:`errors.DecodeError` if it wasn't.
+
+        """
+
+        if len(data) - offset < _HEADER.size:
+            raise errors.DecodeError('not a booby records file')
+
+        magic, version, fingerprint = _HEADER.unpack_from(data, offset)
+
+        if magic != MAGIC:
+            raise errors.DecodeError('not a booby records file')
+
+        if version != VERSION:
+            raise errors.DecodeError('unsupported version {}'.format(version))
+
+        if fingerprint != self.fingerprint:
+            raise errors.DecodeError("layout mismatch for '{}'".format(
+                self.model.__name__))
+
+    def dump(self, instances, fp):
+        """Writes a header and the given iterable of model `instances` as
+        records to the binary file-like object `fp`.
+
+        """
+
+        fp.write(self.header())
+
+        for instance in instances:
+            fp.write(self.pack(instance))
+
+    def open(self, path):
+        """Returns a :class:`RecordFile` with the records in the file
+        written with :func:`dump` at the given `path`.
+
+        """
+
+        return RecordFile(self, path)
+
+    def __reduce__(self):
+        return Layout, (self.model, self._sizes)
+
+
+class RecordBuffer(object):
+    """A read-only sequence of `length` records packed with the given
+    `layout` in the buffer `data`, starting at `offset`.
+
+    Indexing it with an integer returns a new model instance and with a
+    slice, a `list` of them. Use :func:`view` to get a record values
+    without building the model and :func:`column` to get the values of
+    a single field.
+
+    """
+
+    def __init__(self, layout, data, offset=0, length=None):
+        if length is None:
+            length = (len(data) - offset) // layout.size
+
+        self.layout = layout
+        self._data = data
+        self._start = offset
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self.layout.unpack(self._data, self._offset(i))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.layout.unpack(self._data, self._offset(i))
+                    for i in range(*key.indices(self._length))]
+
+        return self.layout.unpack(self._data, self._offset(self._index(key)))
+
+    def view(self, index):
+        """Returns the values of the record at `index` as a read-only
+        :py:func:`collections.namedtuple`. See :func:`Layout.view`.
+
+        """
+
+        return self.layout.view(self._data, self._offset(self._index(index)))
+
+    def column(self, name):
+        """Returns a `list` with the values of the field `name` in all the
+        records. See :func:`Layout.column`.
+
+        """
+
+        return self.layout.column(self._data, self._start, self._length, name)
+
+    def _index(self, index):
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError(
+                '{} index out of range'.format(type(self).__name__))
+
+        return index
+
+    def _offset(self, index):
+        return self._start + index * self.layout.size
+
+    def __repr__(self):
+        cls = type(self)
+
+        return '<{}.{}({}, length={})>'.format(
+            cls.__module__, cls.__name__, self.layout.model.__name__,
+            self._length)
+
+
+class RecordFile(RecordBuffer):
+    """A :class:`RecordBuffer` with the records in the file at `path`
+    written with :func:`Layout.dump`, memory mapped.
+
+    :raises: :class:`errors.DecodeError` if the file was written with a
+        different layout or is truncated.
+
+    """
+
+    def __init__(self, layout, path):
+        with open(path, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size < _HEADER.size:
+                raise errors.DecodeError('not a booby records file')
+
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            layout.check_header(self._mmap)
+
+            length, rest = divmod(len(self._mmap) - _HEADER.size, layout.size)
+
+            if rest:
+                raise errors.DecodeError('truncated records file')
+        except Exception:
+            self.close()
+            raise
+
+        super(RecordFile, self).__init__(
+            layout, self._mmap, _HEADER.size, length)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _column_unpacker(mask_code, codes, index):
+    # Unpacks the null bitmask and the field at `index`, skipping the
+    # fields before it.
+    skipped = struct.calcsize('<' + ''.join(codes[:index]))
+
+    return struct.Struct('<{}{}x{}'.format(
+        mask_code, skipped, codes[index])).unpack_from
+
+
+def _encoded_string(value, name, size):
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+    elif isinstance(value, bytes):
+        try:
+            value.decode('utf-8')
+        except UnicodeDecodeError:
+            raise errors.EncodeError('{} should be UTF-8'.format(name))
+    else:
+        raise errors.EncodeError('{} should be a string'.format(name))
+
+    if b'\0' in value:
+        raise errors.EncodeError(
+            '{} should not contain null characters'.format(name))
+
+    if len(value) > size:
+        raise errors.EncodeError(
+            '{} is longer than {} bytes'.format(name, size))
+
+    return value
+
+
+def _index_code(size):
+    if size <= 1 << 8:
+        return 'B'
+
+    if size <= 1 << 16:
+        return 'H'
+
+    return 'I'
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`reports` module validates a whole tree of models in a single
+pass and collects all the errors found, instead of raising on the first
+one like :func:`models.Model.validate` does::
+
+    report = user.validation_report()
+
+    for entry in report:
+        print entry.path, entry.code, entry.message
+
+    'tokens[3].key' 'type' 'should be a string'
+
+The builtin validators are checked without raising exceptions. Custom
+validators are called as usual and their :class:`errors.ValidationError`
+collected with the `invalid` code.
+
+"""
+
+import weakref
+import collections
+
+from booby import compiler, errors, validators
+
+REQUIRED = 'required'
+CHOICES = 'choices'
+TYPE = 'type'
+EMAIL = 'email'
+INVALID = 'invalid'
+
+# The checks of each field, built the first time it is validated.
+_CHECKS = weakref.WeakKeyDictionary()
+
+_TYPES = compiler.type_checks()
+
+
+def validate(instance, max_errors=None):
+    """Validates the given model `instance` and all the models it
+    contains and returns a :class:`ValidationReport` with every error
+    found. If `max_errors` is given, validation stops after that many
+    errors and the report is marked as `truncated`.
+
+    """
+
+    report = ValidationReport(max_errors)
+
+    try:
+        _walk(instance, '', report)
+    except _Cutoff:
+        report.truncated = True
+
+    return report
+
+
+class ValidationReport(object):
+    """The errors found validating a model tree with :func:`validate`.
+    Iterating the report yields its :class:`ValidationEntry` objects in
+    the order they were found.
+
+    :ivar entries: The `list` of :class:`ValidationEntry` objects.
+    :ivar truncated: `True` if validation stopped after `max_errors`.
+
+    """
+
+    def __init__(self, max_errors=None):
+        self.entries = []
+        self.truncated = False
+        self._max_errors = max_errors
+
+    @property
+    def is_valid(self):
+        """`True` if no errors were found."""
+
+        return not self.entries
+
+    def add(self, path, code, template, *args):
+        self.entries.append(ValidationEntry(path, code, template, args))
+
+        if len(self.entries) == self._max_errors:
+            raise _Cutoff()
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return '<{}.{}({!r})>'.format(
+            type(self).__module__, type(self).__name__, self.entries)
+
+
+class ValidationEntry(object):
+    """A single validation error.
+
+    :ivar path: The path of the failing field from the validated model,
+        like `tokens[3].key`.
+    :ivar code: The kind of error: `required`, `choices`, `type`, `email`
+        or `invalid` for the errors raised by custom validators.
+
+    """
+
+    def __init__(self, path, code, template, args=()):
+        self.path = path
+        self.code = code
+        self._template = template
+        self._args = args
+
+    @property
+    def message(self):
+        """The error message, only formatted when read."""
+
+        return self._template.format(*self._args)
+
+    def __repr__(self):
+        return '<{}.{}({!r}, {!r})>'.format(
+            type(self).__module__, type(self).__name__, self.path, self.code)
+
+
+class _Cutoff(Exception):
+    pass
+
+
+def _walk(instance, prefix, report):
+    plan = compiler.plan_for(type(instance))
+
+    if plan is None:
+        values = ((name, field, getattr(instance, name))
+                  for name, field in sorted(compiler.present_fields(
+                      instance, validating=True)))
+    else:
+        values = ((f.name, f.field, f.read(instance))
+                  for f in plan.present(instance, validating=True))
+
+    errors_before = len(report)
+
+    for name, field, value in values:
+        path = prefix + name
+
+        for check in _checks_for(field):
+            if not check(value, path, report):
+                break
+
+    # Models overriding `validate` may check anything else, so it's called
+    # once their fields are valid, as it would fail on them first.
+    if (len(report) == errors_before and
+            compiler.overrides_validate(type(instance))):
+        try:
+            instance.validate()
+        except errors.ValidationError as err:
+            report.add(prefix.rstrip('.'), INVALID, '{}', err)
+
+
+def _checks_for(field):
+    try:
+        return _CHECKS[field]
+    except KeyError:
+        if compiler.overrides(field, 'validate'):
+            checks = [_custom(field.validate)]
+        else:
+            checks = [_check(validator) for validator in field.validators]
+
+        return _CHECKS.setdefault(field, checks)
+
+
+def _check(validator):
+    kind = type(validator)
+
+    if kind is validators.Required:
+        return _required
+    if kind is validators.In:
+        return _choices(validator.choices)
+    if kind in _TYPES:
+        return _type(*_TYPES[kind])
+    if kind is validators.Email:
+        return _email(validator.pattern.match)
+    if kind is validators.Model:
+        return _model(validator.model)
+    if kind is validators.List:
+        return _list([_check(inner) for inner in validator.validators])
+
+    return _custom(validator)
+
+
+def _required(value, path, report):
+    if value is None:
+        report.add(path, REQUIRED, 'is required')
+        return False
+
+    return True
+
+
+def _choices(choices):
+    try:
+        hashed = frozenset(choices)
+    except TypeError:
+        hashed = choices
+
+    def check(value, path, report):
+        try:
+            missing = value not in hashed
+        except TypeError:
+            missing = value not in choices
+
+        if missing:
+            report.add(path, CHOICES, 'should be in {}', choices)
+            return False
+
+        return True
+
+    return check
+
+
+def _type(types, message):
+    def check(value, path, report):
+        if value is not None and not isinstance(value, types):
+            report.add(path, TYPE, message)
+            return False
+
+        return True
+
+    return check
+
+
+def _email(match):
+    def check(value, path, report):
+        if value is None:
+            return True
+
+        if not isinstance(value, basestring):
+            report.add(path, TYPE, 'should be a string')
+            return False
+
+        if match(value) is None:
+            report.add(path, EMAIL, 'should be a valid email')
+            return False
+
+        return True
+
+    return check
+
+
+def _model(model):
+    def check(value, path, report):
+        if value is None:
+            return True
+
+        if not isinstance(value, model):
+            report.add(path, TYPE, "should be an instance of '{}'",
+                       model.__name__)
+            return False
+
+        errors_before = len(report)
+        _walk(value, path + '.', report)
+
+        return len(report) == errors_before
+
+    return check
+
+
+def _list(checks):
+    def check(value, path, report):
+        if value is None:
+            return True
+
+        if not isinstance(value, collections.MutableSequence):
+            report.add(path, TYPE, 'should be a list')
+            return False
+
+        errors_before = len(report)
+
+        for i, item in enumerate(value):
+            item_path = '%s[%d]' % (path, i)
+
+            for item_check in checks:
+                if not item_check(item, item_path, report):
+                    break
+
+        return len(report) == errors_before
+
+    return check
+
+
+def _custom(validate):
+    def check(value, path, report):
+        try:
+            validate(value)
+        except errors.ValidationError as err:
+            report.add(path, INVALID, '{}', err)
+            return False
+
+        return True
+
+    return check
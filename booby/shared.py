@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`shared` module shares batches of flat models with worker
+processes through shared memory, packed as :mod:`records`, so they are
+neither pickled nor copied for each worker::
+
+    def mean(samples):
+        values = samples.column('value')
+        return sum(values) / len(values)
+
+    layout = records.Layout(Sample, sizes={'sensor': 8})
+
+    with shared.SharedRecords.create(layout, instances) as samples:
+        result = pool.apply(mean, (samples,))
+
+:class:`SharedRecords` are pickled as the name of their memory block, and
+attached to it again when unpickled in the worker.
+
+Blocks are memory mapped temporary files, created in `/dev/shm` where
+the system has it.
+
+"""
+
+import os
+import mmap
+import struct
+import tempfile
+
+from booby import records
+
+_COUNT = struct.Struct('<Q')
+
+# Temporary files are created in memory where the system allows it.
+_FILES_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+class SharedRecords(records.RecordBuffer):
+    """A :class:`records.RecordBuffer` over a shared memory block.
+
+    Blocks are created with :func:`create` and attached by name from
+    other processes with :func:`attach`, or unpickling the instance.
+    Each process must :func:`close` its instance when done with it, and
+    the creator must :func:`unlink` the block once no process needs it
+    anymore. Used as a context manager, the instance is closed on exit,
+    and unlinked if it created the block.
+
+    """
+
+    def __init__(self, layout, block, owner=False):
+        self.name = block.name
+        self.owner = owner
+        self._block = block
+
+        layout.check_header(block.buf)
+
+        offset = records.HEADER_SIZE + _COUNT.size
+        length = _COUNT.unpack_from(block.buf, records.HEADER_SIZE)[0]
+
+        super(SharedRecords, self).__init__(layout, block.buf, offset, length)
+
+    @classmethod
+    def create(cls, layout, instances):
+        """Returns a new :class:`SharedRecords` with the given `instances`
+        packed with `layout` in a new shared memory block.
+
+        """
+
+        packed = [layout.pack(instance) for instance in instances]
+        offset = records.HEADER_SIZE + _COUNT.size
+        block = _FileBlock.create(offset + len(packed) * layout.size)
+
+        try:
+            block.buf[:records.HEADER_SIZE] = layout.header()
+            block.buf[records.HEADER_SIZE:offset] = _COUNT.pack(len(packed))
+
+            for record in packed:
+                block.buf[offset:offset + layout.size] = record
+                offset += layout.size
+        except Exception:
+            block.close()
+            block.unlink()
+            raise
+
+        return cls(layout, block, owner=True)
+
+    @classmethod
+    def attach(cls, layout, name):
+        """Returns a :class:`SharedRecords` attached to the existing
+        shared memory block with the given `name`.
+
+        :raises: :class:`errors.DecodeError` if the block was packed with
+            a different layout.
+
+        """
+
+        block = _FileBlock(name)
+
+        try:
+            return cls(layout, block)
+        except Exception:
+            block.close()
+            raise
+
+    def close(self):
+        """Detaches this process from the shared memory block."""
+
+        self._data = None
+        self._block.close()
+
+    def unlink(self):
+        """Frees the shared memory block. Processes still attached can
+        read it until they close it.
+
+        """
+
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return _unpickle, (self.layout, self.name)
+
+
+def _unpickle(layout, name):
+    return SharedRecords.attach(layout, name)
+
+
+class _FileBlock(object):
+    # A memory mapped temporary file, named by its path.
+
+    def __init__(self, name, access=mmap.ACCESS_READ):
+        with open(name, 'r+b' if access == mmap.ACCESS_WRITE else 'rb') as fp:
+            self.buf = mmap.mmap(fp.fileno(), 0, access=access)
+
+        self.name = name
+
+    @classmethod
+    def create(cls, size):
+        fd, name = tempfile.mkstemp(prefix='booby-', dir=_FILES_DIR)
+
+        try:
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+        return cls(name, mmap.ACCESS_WRITE)
+
+    def close(self):
+        self.buf.close()
+
+    def unlink(self):
+        os.remove(self.name)
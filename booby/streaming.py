@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2014 Jaime Gil de Sagredo Luna
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The :mod:`streaming` module serializes and deserializes models as
+JSON incrementally.
+
+Instead of building the whole document in memory, models and lists of
+models are walked field by field and written as chunks of JSON, so memory
+usage stays bounded regardless of the size of the collections::
+
+    with open('users.json', 'w') as fp:
+        streaming.dump(users, fp)
+
+Large JSON arrays of records can be read back element by element, so
+memory usage depends on the size of the largest record instead of the
+size of the whole document::
+
+    with open('users.json', 'rb') as fp:
+        for user in streaming.load(User, fp):
+            pass
+
+"""
+
+import re
+import json
+import codecs
+import collections
+
+from booby import batch, compiler
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def dump(obj, fp, chunk_size=CHUNK_SIZE, **kwargs):
+    """Writes the given `model`, or sequence or iterable of models, as
+    JSON to the file-like object or socket `fp`.
+
+    Accepts the same arguments as :func:`iterencode`.
+
+    """
+
+    write = getattr(fp, 'write', None)
+
+    if write is None:
+        def write(chunk):
+            fp.sendall(chunk.encode('utf-8'))
+
+    for chunk in iterencode(obj, chunk_size, **kwargs):
+        write(chunk)
+
+
+def iterencode(obj, chunk_size=CHUNK_SIZE, **kwargs):
+    """Returns a generator of JSON chunks of about `chunk_size` characters
+    for the given `model`, or sequence or iterable of models. Fields are
+    serialized like :func:`models.Model.to_json` does.
+
+    Keyword arguments are passed to :py:class:`json.JSONEncoder`, except
+    `indent` which isn't supported.
+
+    """
+
+    if kwargs.get('indent') is not None:
+        raise ValueError('indent is not supported when streaming')
+
+    separators = kwargs.pop('separators', None) or (', ', ': ')
+    sort_keys = kwargs.pop('sort_keys', False)
+
+    encoder = json.JSONEncoder(
+        separators=separators, sort_keys=sort_keys, **kwargs)
+
+    fragments = _Fragments(encoder, separators, sort_keys)
+
+    buffered = []
+    size = 0
+
+    for fragment in fragments.value(obj, top_level=True):
+        buffered.append(fragment)
+        size += len(fragment)
+
+        if size >= chunk_size:
+            yield ''.join(buffered)
+
+            buffered = []
+            size = 0
+
+    if buffered:
+        yield ''.join(buffered)
+
+
+class _Fragments(object):
+    def __init__(self, encoder, separators, sort_keys):
+        from booby import models
+
+        self._model = models.Model
+        self._encoder = encoder
+        self._item_separator, self._key_separator = separators
+        self._sort_keys = sort_keys
+
+    def value(self, value, top_level=False):
+        if isinstance(value, self._model):
+            return self.model(value)
+
+        if isinstance(value, collections.MutableSequence):
+            return self.sequence(value)
+
+        if top_level and isinstance(value, collections.Iterator):
+            return self.sequence(value)
+
+        return self._encoder.iterencode(value)
+
+    def model(self, model):
+        plan = compiler.plan_for(type(model))
+
+        if (plan is None or plan._custom_encode or
+                type(getattr(model, '_data', None)) is compiler.LazyData):
+            return self._encoder.iterencode(model.encode())
+
+        return self._fields(model, plan)
+
+    def _fields(self, model, plan):
+        fields = [f for f in plan.present(model) if not f.read_only]
+
+        if self._sort_keys:
+            fields.sort(key=lambda f: f.wire_name)
+
+        yield '{'
+
+        for i, field in enumerate(fields):
+            if i:
+                yield self._item_separator
+
+            yield self._encoder.encode(field.wire_name)
+            yield self._key_separator
+
+            value = field.read(model)
+
+            if field.kind == compiler.MODEL and value is not None:
+                fragments = self.value(value)
+            elif field.kind == compiler.COLLECTION and type(value) is list:
+                fragments = self.sequence(value)
+            else:
+                if field.encode is not None:
+                    value = field.encode(value)
+
+                fragments = self._encoder.iterencode(value)
+
+            for fragment in fragments:
+                yield fragment
+
+        yield '}'
+
+    def sequence(self, sequence):
+        yield '['
+
+        for i, item in enumerate(sequence):
+            if i:
+                yield self._item_separator
+
+            for fragment in self.value(item):
+                yield fragment
+
+        yield ']'
+
+
+def load(model, source, path=(), chunk_size=CHUNK_SIZE, on_error='raise',
+         failures=None, validate=False):
+    """Returns a generator of `model` instances decoded from the elements
+    of a JSON array read incrementally from `source`. See :func:`iterload`
+    for the `source`, `path` and `chunk_size` arguments and
+    :func:`batch.decode_many` for the others.
+
+    """
+
+    return batch.decode_many(model, iterload(source, path, chunk_size),
+                             on_error, failures, validate)
+
+
+def iterload(source, path=(), chunk_size=CHUNK_SIZE):
+    """Returns a generator of the elements of a JSON array read
+    incrementally from `source`. Only one element is kept in memory
+    at a time.
+
+    :param source: A file-like object or an iterable of `bytes` or text
+        chunks. Bytes are decoded as UTF-8.
+    :param path: A sequence of object keys leading to the array, if it
+        isn't the top-level value. For example, `('data', 'items')` reads
+        the array in `{"data": {"items": [...]}}`. Other values found
+        along the path are skipped.
+    :param chunk_size: The size of the reads from file-like objects.
+
+    :raises: :py:exc:`ValueError` if the JSON is malformed, the array
+        is not found or other data follows the document.
+
+    """
+
+    reader = _Reader(_chunks(source, chunk_size))
+
+    for key in path:
+        reader.find_key(key)
+
+    return reader.array(len(path))
+
+
+def _chunks(source, chunk_size):
+    if hasattr(source, 'read'):
+        source = _read_chunks(source, chunk_size)
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+
+        if chunk:
+            yield chunk
+
+    tail = decoder.decode(b'', True)
+
+    if tail:
+        yield tail
+
+
+def _read_chunks(fp, chunk_size):
+    while True:
+        chunk = fp.read(chunk_size)
+
+        if not chunk:
+            break
+
+        yield chunk
+
+
+class _Reader(object):
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = u''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def find_key(self, key):
+        self._expect('{')
+
+        if self._peek() != '}':
+            while True:
+                name = self._value()
+                self._expect(':')
+
+                if name == key:
+                    return
+
+                self._value()
+
+                if not self._next_member():
+                    break
+
+        raise ValueError('key {!r} not found'.format(key))
+
+    def array(self, depth=0):
+        """Yields the elements of the array at the current position and
+        then checks that the rest of the document, the `depth` objects
+        enclosing it, is well formed and not followed by other data.
+
+        """
+
+        self._expect('[')
+
+        if self._peek() != ']':
+            while True:
+                yield self._value()
+
+                char = self._peek()
+
+                if char == ']':
+                    break
+
+                if char != ',':
+                    raise ValueError(self._error("expected ',' or ']'"))
+
+                self._pos += 1
+
+        self._pos += 1
+
+        for _ in range(depth):
+            while self._next_member():
+                self._value()
+                self._expect(':')
+                self._value()
+
+            self._pos += 1
+
+        if self._peek() is not None:
+            raise ValueError(self._error('unexpected data'))
+
+    def _next_member(self):
+        # Skips the `,` before the next member of an object, returning
+        # `False` at its closing `}`.
+        char = self._peek()
+
+        if char == '}':
+            return False
+
+        if char != ',':
+            raise ValueError(self._error("expected ',' or '}'"))
+
+        self._pos += 1
+
+        return True
+
+    def _value(self):
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+
+                continue
+
+            # A value ending with the buffer may be a truncated number
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+
+            return value
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(self._error('expected {!r}'.format(char)))
+
+        self._pos += 1
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._fill():
+                return None
+
+    def _fill(self):
+        """Reads at least as much data as there is pending in the buffer,
+        so retrying the decoding of a large value is amortized linear.
+
+        """
+
+        if self._eof:
+            return False
+
+        pending = [self._buffer[self._pos:]]
+        wanted = max(len(pending[0]), 1)
+        read = 0
+
+        for chunk in self._chunks:
+            pending.append(chunk)
+            read += len(chunk)
+
+            if read >= wanted:
+                break
+        else:
+            self._eof = True
+
+        self._buffer = u''.join(pending)
+        self._pos = 0
+
+        return read > 0
+
+    def _error(self, message):
+        return '{} at {!r}'.format(message, self._buffer[self._pos:][:20])
@@ -40,6 +40,23 @@ class Validator(object):
     def validate(self, value):
         raise NotImplementedError()
 
+    def validate_many(self, values):
+        """Validates a whole column of values at once. Returns a `dict`
+        mapping the positions of the values that don't validate to their
+        error messages.
+
+        """
+
+        result = {}
+
+        for i, value in enumerate(values):
+            try:
+                self(value)
+            except errors.ValidationError as err:
+                result[i] = str(err)
+
+        return result
+
 
 class Required(Validator):
     """This validator forces fields to have a value other than :keyword:`None`."""
@@ -48,9 +65,14 @@ class Required(Validator):
         if value is None:
             raise errors.ValidationError('is required')
 
+    def validate_many(self, values):
+        return dict((i, 'is required')
+                    for i, value in enumerate(values) if value is None)
+
 
 class In(Validator):
     """This validator forces fields to have their value in the given list.
+    The `choices` are read on each call, so they may change later on.
 
     :param choices: A `list` of possible values.
 
@@ -61,7 +83,25 @@ class In(Validator):
 
     def validate(self, value):
         if value not in self.choices:
-            raise errors.ValidationError('should be in {}'.format(self.choices))
+            raise errors.ValidationError(self.message)
+
+    def validate_many(self, values):
+        try:
+            hashed = frozenset(self.choices)
+        except TypeError:
+            hashed = None
+
+        result = {}
+
+        for i, value in enumerate(values):
+            if not _contains(self.choices, hashed, value):
+                result[i] = self.message
+
+        return result
+
+    @property
+    def message(self):
+        return 'should be in {}'.format(self.choices)
 
 
 class String(Validator):
@@ -72,6 +112,9 @@ class String(Validator):
         if not isinstance(value, basestring):
             raise errors.ValidationError('should be a string')
 
+    def validate_many(self, values):
+        return _type_errors(values, basestring, 'should be a string')
+
 
 class Integer(Validator):
     """This validator forces fields values to be an instance of `int`."""
@@ -81,6 +124,9 @@ class Integer(Validator):
         if not isinstance(value, int):
             raise errors.ValidationError('should be an integer')
 
+    def validate_many(self, values):
+        return _type_errors(values, int, 'should be an integer')
+
 
 class Float(Validator):
     """This validator forces fields values to be an instance of `float`."""
@@ -90,6 +136,9 @@ class Float(Validator):
         if not isinstance(value, float):
             raise errors.ValidationError('should be a float')
 
+    def validate_many(self, values):
+        return _type_errors(values, float, 'should be a float')
+
 
 class Boolean(Validator):
     """This validator forces fields values to be an instance of `bool`."""
@@ -99,6 +148,9 @@ class Boolean(Validator):
         if not isinstance(value, bool):
             raise errors.ValidationError('should be a boolean')
 
+    def validate_many(self, values):
+        return _type_errors(values, bool, 'should be a boolean')
+
 
 class Model(Validator):
     """This validator forces fields values to be an instance of the given
@@ -139,6 +191,16 @@ class Email(String):
         if self.pattern.match(value) is None:
             raise errors.ValidationError('should be a valid email')
 
+    def validate_many(self, values):
+        result = super(Email, self).validate_many(values)
+        match = self.pattern.match
+
+        for i, value in enumerate(values):
+            if value is not None and i not in result and match(value) is None:
+                result[i] = 'should be a valid email'
+
+        return result
+
 
 class List(Validator):
     """This validator forces field values to be a :keyword:`list`.
@@ -170,3 +232,21 @@ class DateTime(Validator):
     def validate(self, value):
         if not isinstance(value, datetime.datetime):
             raise errors.ValidationError('should be a datetime')
+
+    def validate_many(self, values):
+        return _type_errors(values, datetime.datetime, 'should be a datetime')
+
+
+def _type_errors(values, types, message):
+    return dict((i, message) for i, value in enumerate(values)
+                if value is not None and not isinstance(value, types))
+
+
+def _contains(choices, hashed, value):
+    if hashed is not None:
+        try:
+            return value in hashed
+        except TypeError:
+            pass
+
+    return value in choices
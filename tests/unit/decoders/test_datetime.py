@@ -4,7 +4,7 @@ import datetime
 
 from expects import *
 
-from booby import decoders, errors
+from booby import decoders, encoders, errors
 
 CUSTOM_FORMAT = '%d/%m/%Y %H:%M:%S'
 IRRELEVANT_DATETIME = datetime.datetime(
@@ -17,6 +17,7 @@ DATETIME_WITH_MICROSECOND = datetime.datetime(
 
 DATETIME_WITH_MICROSECOND_IN_ISO = DATETIME_WITH_MICROSECOND.isoformat()
 INVALID_DATETIME_STRING = 'invalid datetime string'
+IRRELEVANT_TIMESTAMP = 1360770937
 
 
 class TestDecode(object):
@@ -39,6 +40,61 @@ class TestDecode(object):
 
         expect(callback).to(raise_error(errors.DecodeError))
 
+    def test_should_return_datetime_from_date_in_iso_format(self):
+        result = self.decoder('2013-02-13')
+
+        expect(result).to(equal(datetime.datetime(2013, 2, 13)))
+
+    def test_should_return_datetime_from_string_without_seconds(self):
+        result = self.decoder('2013-02-13T15:55')
+
+        expect(result).to(equal(datetime.datetime(2013, 2, 13, 15, 55)))
+
+    def test_should_return_datetime_from_string_with_space_separator(self):
+        result = self.decoder('2013-02-13 15:55:37')
+
+        expect(result).to(equal(IRRELEVANT_DATETIME))
+
+    def test_should_truncate_fractional_seconds_to_microseconds(self):
+        result = self.decoder('2013-02-13T15:55:37.1234567')
+
+        expect(result.microsecond).to(equal(123456))
+
+    def test_should_return_datetime_with_fractional_seconds_of_any_length(self):
+        result = self.decoder('2013-02-13T15:55:37.5')
+
+        expect(result.microsecond).to(equal(500000))
+
+    def test_should_return_utc_datetime_if_string_ends_with_z(self):
+        result = self.decoder('2013-02-13T15:55:37Z')
+
+        expect(result.utcoffset()).to(equal(datetime.timedelta(0)))
+        expect(result.replace(tzinfo=None)).to(equal(IRRELEVANT_DATETIME))
+
+    def test_should_return_aware_datetime_if_string_has_offset(self):
+        for offset in ['-02:30', '-0230']:
+            result = self.decoder('2013-02-13T15:55:37.012345' + offset)
+
+            expect(result.utcoffset()).to(equal(
+                -datetime.timedelta(hours=2, minutes=30)))
+            expect(result.replace(tzinfo=None)).to(equal(
+                DATETIME_WITH_MICROSECOND))
+
+    def test_should_decode_strings_of_same_length_with_different_layout(self):
+        first = self.decoder('2013-02-13T15:55:37.1234+01:00')
+        second = self.decoder('2013-02-13T15:55:37.123456789Z')
+
+        expect(first.utcoffset()).to(equal(datetime.timedelta(hours=1)))
+        expect(second.utcoffset()).to(equal(datetime.timedelta(0)))
+
+    def test_should_raise_decode_error_if_iso_string_is_malformed(self):
+        for value in ['2013-02-1x', '2013-02-13T15', '2013-02-13T15:5',
+                      '2013-02-13T15:55:3',
+                      '2013-02-13T15:55:37+1', '2013-02-13T15:55:37.x',
+                      '2013-13-13', '2013-02-13T15:55:37 01:00']:
+            expect(lambda: self.decoder(value)).to(
+                raise_error(errors.DecodeError))
+
     def test_should_return_datetime_with_given_format(self):
         self.decoder = decoders.DateTime(CUSTOM_FORMAT)
 
@@ -46,5 +102,38 @@ class TestDecode(object):
 
         expect(result).to(equal(IRRELEVANT_DATETIME))
 
+    def test_should_return_datetime_from_epoch_number_in_given_mode(self):
+        cases = [('seconds', IRRELEVANT_TIMESTAMP, IRRELEVANT_DATETIME),
+                 ('milliseconds', IRRELEVANT_TIMESTAMP * 1000 + 12,
+                  DATETIME_WITH_MICROSECOND.replace(microsecond=12000)),
+                 ('float', IRRELEVANT_TIMESTAMP + 0.012345,
+                  DATETIME_WITH_MICROSECOND)]
+
+        for epoch, value, expected in cases:
+            decoder = decoders.DateTime(epoch=epoch)
+
+            expect(decoder(value)).to(equal(expected))
+
+    def test_should_round_trip_epoch_encoding(self):
+        for epoch in encoders.EPOCH_MODES:
+            encoder = encoders.DateTime(epoch=epoch)
+            decoder = decoders.DateTime(epoch=epoch)
+
+            expect(decoder(encoder(IRRELEVANT_DATETIME))).to(
+                equal(IRRELEVANT_DATETIME))
+
+    def test_should_raise_decode_error_if_epoch_value_is_not_a_number(self):
+        decoder = decoders.DateTime(epoch='seconds')
+
+        for value in ['1360770937', True, 1e300]:
+            expect(lambda: decoder(value)).to(raise_error(errors.DecodeError))
+
+    def test_list_decoder_should_decode_datetimes_at_once(self):
+        decoder = decoders.List(decoders.DateTime(epoch='seconds'))
+
+        result = decoder([IRRELEVANT_TIMESTAMP, None])
+
+        expect(result).to(equal([IRRELEVANT_DATETIME, None]))
+
     def setup(self):
         self.decoder = decoders.DateTime()
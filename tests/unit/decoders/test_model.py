@@ -2,7 +2,7 @@
 
 from expects import *
 
-from booby import models, fields, decoders
+from booby import models, fields, decoders, errors
 
 IRRELEVANT_NAME = 'irrelevant name'
 IRRELEVANT_EMAIL = 'irrelevant email'
@@ -21,6 +21,10 @@ class TestDecode(object):
 
         expect(result).to(equal(User.decode(raw_user)))
 
+    def test_should_raise_decode_error_if_value_is_not_a_mapping(self):
+        expect(lambda: self.decoder('foo')).to(
+            raise_error(errors.DecodeError))
+
     def setup(self):
         self.decoder = decoders.Model(User)
 
@@ -17,6 +17,7 @@ DATETIME_WITH_MICROSECOND = datetime.datetime(
     year=2013, month=2, day=13, hour=15, minute=55, second=37, microsecond=12345)
 
 DATETIME_WITH_MICROSECOND_IN_ISO = DATETIME_WITH_MICROSECOND.isoformat()
+IRRELEVANT_TIMESTAMP = 1360770937
 
 
 class TestEncode(object):
@@ -40,5 +41,60 @@ class TestEncode(object):
 
         expect(result).to(equal(IRRELEVANT_DATETIME_IN_CUSTOM_FORMAT))
 
+    def test_should_return_epoch_seconds_if_epoch_mode_is_seconds(self):
+        self.encoder = encoders.DateTime(epoch='seconds')
+
+        expect(self.encoder(DATETIME_WITH_MICROSECOND)).to(
+            equal(IRRELEVANT_TIMESTAMP))
+
+    def test_should_return_epoch_milliseconds_if_epoch_mode_is_milliseconds(self):
+        self.encoder = encoders.DateTime(epoch='milliseconds')
+
+        expect(self.encoder(DATETIME_WITH_MICROSECOND)).to(
+            equal(IRRELEVANT_TIMESTAMP * 1000 + 12))
+
+    def test_should_return_float_epoch_seconds_if_epoch_mode_is_float(self):
+        self.encoder = encoders.DateTime(epoch='float')
+
+        expect(self.encoder(DATETIME_WITH_MICROSECOND)).to(
+            equal(IRRELEVANT_TIMESTAMP + 0.012345))
+
+    def test_should_convert_aware_datetimes_to_utc_epoch(self):
+        self.encoder = encoders.DateTime(epoch='seconds')
+        aware = IRRELEVANT_DATETIME.replace(tzinfo=PlusOneHour())
+
+        expect(self.encoder(aware)).to(equal(IRRELEVANT_TIMESTAMP - 3600))
+
+    def test_should_fail_if_epoch_mode_is_unknown(self):
+        expect(lambda: encoders.DateTime(epoch='minutes')).to(
+            raise_error(ValueError))
+
+    def test_should_fail_if_both_format_and_epoch_mode_are_given(self):
+        expect(lambda: encoders.DateTime(CUSTOM_FORMAT, epoch='seconds')).to(
+            raise_error(ValueError))
+
+    def test_encode_many_should_encode_a_list_of_datetimes(self):
+        for encoder in [encoders.DateTime(), encoders.DateTime(CUSTOM_FORMAT),
+                        encoders.DateTime(epoch='milliseconds')]:
+            values = [IRRELEVANT_DATETIME, None, DATETIME_WITH_MICROSECOND]
+
+            expect(encoder.encode_many(values)).to(
+                equal([encoder(value) for value in values]))
+
+    def test_list_encoder_should_encode_datetimes_at_once(self):
+        encoder = encoders.List(encoders.DateTime(epoch='seconds'))
+
+        result = encoder([IRRELEVANT_DATETIME, None])
+
+        expect(result).to(equal([IRRELEVANT_TIMESTAMP, None]))
+
     def setup(self):
         self.encoder = encoders.DateTime()
+
+
+class PlusOneHour(datetime.tzinfo):
+    def utcoffset(self, dt):
+        return datetime.timedelta(hours=1)
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+
 from expects import *
 from .._helpers import MyList
 
@@ -35,6 +37,20 @@ class TestEncode(object):
 
         expect(result).to(equal([users[0].encode(), users[1].encode()]))
 
+    def test_should_encode_datetimes_at_once(self):
+        self.encoder = encoders.List(encoders.DateTime())
+
+        result = self.encoder([datetime.datetime(2014, 1, 2), None])
+
+        expect(result).to(equal(['2014-01-02T00:00:00', None]))
+
+    def test_should_call_overridden_encode_of_item_encoder(self):
+        self.encoder = encoders.List(DateEncoder())
+
+        result = self.encoder([datetime.datetime(2014, 1, 2)])
+
+        expect(result).to(equal(['2014-01-02']))
+
     def test_should_return_none_if_value_is_none(self):
         result = self.encoder(None)
 
@@ -53,3 +69,8 @@ class TestEncode(object):
 class User(models.Model):
     name = fields.Field()
     email = fields.Field()
+
+
+class DateEncoder(encoders.DateTime):
+    def encode(self, value):
+        return value.date().isoformat()
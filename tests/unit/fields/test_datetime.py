@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+
+from expects import *
+
+from booby import fields, models, errors
+
+IRRELEVANT_DATETIME = datetime.datetime(2013, 2, 13, 15, 55, 37)
+IRRELEVANT_TIMESTAMP = 1360770937
+
+
+class TestDateTimeField(object):
+    def test_should_encode_and_decode_iso_strings_by_default(self):
+        sample = Sample(taken_at=IRRELEVANT_DATETIME)
+
+        encoded = sample.encode()
+
+        expect(encoded).to(have_key('taken_at', IRRELEVANT_DATETIME.isoformat()))
+        expect(Sample.decode(encoded)).to(have_key('taken_at', IRRELEVANT_DATETIME))
+
+    def test_should_encode_and_decode_epoch_in_given_mode(self):
+        sample = Sample(received_at=IRRELEVANT_DATETIME)
+
+        encoded = sample.encode()
+
+        expect(encoded).to(have_key('received_at', IRRELEVANT_TIMESTAMP * 1000))
+        expect(Sample.decode(encoded)).to(
+            have_key('received_at', IRRELEVANT_DATETIME))
+
+    def test_should_validate_datetimes(self):
+        sample = Sample(taken_at='foo')
+
+        expect(sample.validate).to(raise_error(
+            errors.ValidationError, 'taken_at should be a datetime'))
+
+
+class Sample(models.Model):
+    taken_at = fields.DateTime()
+    received_at = fields.DateTime(epoch='milliseconds')
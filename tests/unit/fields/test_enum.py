@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from expects import *
+
+from booby import errors, fields, models
+
+
+class TestEnumField(object):
+    def test_should_encode_and_decode_values(self):
+        task = Task(status='done', priority=20)
+
+        expect(task.encode()).to(equal({'status': 'done', 'priority': 20}))
+        expect(Task.decode({'status': 'done'})).to(equal({'status': 'done'}))
+
+    def test_should_validate_values_in_choices(self):
+        task = Task(status='foo')
+
+        expect(task.validate).to(raise_error(
+            errors.ValidationError, match("status should be in \[u?'todo'")))
+
+    def test_should_store_index_if_enabled(self):
+        task = Task(priority=20)
+
+        expect(task._data[Task.priority]).to(equal(1))
+        expect(task.priority).to(equal(20))
+
+    def test_should_store_values_not_in_choices_apart_from_indexes(self):
+        task = Task()
+        task.priority = 1
+
+        expect(task.priority).to(equal(1))
+        expect(task.validate).to(raise_error(
+            errors.ValidationError, 'priority should be in [10, 20, 30]'))
+
+    def test_should_return_default_when_storing_index(self):
+        task = Task()
+
+        expect(task.priority).to(equal(10))
+        expect(task.encode()).to(have_key('priority', 10))
+
+    def test_should_read_lazily_decoded_index(self):
+        task = Task.decode_lazy({'priority': 30})
+
+        expect(task.priority).to(equal(30))
+        expect(task._data[Task.priority]).to(equal(2))
+
+    def test_should_pickle_index(self):
+        task = pickle.loads(pickle.dumps(Task(priority=30)))
+
+        expect(task.priority).to(equal(30))
+
+    def test_encode_should_not_store_default_index(self):
+        task = Task(status='done')
+
+        result = task.encode()
+
+        expect(result).to(have_key('priority', 10))
+        expect(task._data).not_to(have_key(Task.priority))
+
+    def test_should_raise_value_error_on_duplicated_choices(self):
+        expect(lambda: fields.Enum(['foo', 'foo'])).to(raise_error(ValueError))
+
+    def test_should_raise_type_error_storing_index_in_slots_model(self):
+        def define():
+            class Point(models.Model):
+                __storage__ = 'slots'
+
+                axis = fields.Enum(['x', 'y'], store_index=True)
+
+        expect(define).to(raise_error(TypeError))
+
+
+class Task(models.Model):
+    status = fields.Enum(['todo', 'doing', 'done'])
+    priority = fields.Enum([10, 20, 30], default=10, store_index=True)
@@ -54,6 +54,62 @@ class TestFieldDefault(object):
 
         expect(lambda: User().name).to(raise_error(TypeError, 'foo'))
 
+    def test_when_callable_receiving_owner_raises_type_error_then_should_not_be_catched(self):
+        def callback(model):
+            raise TypeError('foo')
+
+        User.name.default = callback
+
+        expect(lambda: User().name).to(raise_error(TypeError, 'foo'))
+
+    def test_when_default_is_a_class_receiving_owner_then_pass_owner_instance(self):
+        class Default(object):
+            def __init__(self, model):
+                self.model = model
+
+        User.name.default = Default
+
+        user = User()
+
+        expect(user.name.model).to(be(user))
+
+    def test_when_default_is_a_class_creating_from_owner_then_pass_owner_instance(self):
+        class Default(object):
+            def __new__(cls, model):
+                instance = super(Default, cls).__new__(cls)
+                instance.model = model
+                return instance
+
+        User.name.default = Default
+
+        user = User()
+
+        expect(user.name.model).to(be(user))
+
+    def test_when_default_is_a_class_without_init_then_call_it_without_arguments(self):
+        class Default:
+            pass
+
+        User.name.default = Default
+
+        expect(User().name).to(be_a(Default))
+
+    def test_when_default_is_a_bound_method_then_call_it_without_arguments(self):
+        User.name.default = 'anonymous'.upper
+
+        expect(User().name).to(equal('ANONYMOUS'))
+
+    def test_when_default_is_immutable_type_then_share_its_value(self):
+        User.name.default = tuple
+
+        expect(User().name).to(be(User().name))
+        expect(User.name.default).to(be(tuple))
+
+    def test_when_default_is_mutable_type_then_should_not_be_shared(self):
+        User.name.default = list
+
+        expect(User().name).not_to(be(User().name))
+
     def test_when_default_is_callable_then_should_be_called_once_per_onwer_instance(self):
         default_callable = Spy()
 
@@ -74,6 +130,9 @@ class TestFieldDefault(object):
 
         expect(default_callable.times_called).to(equal(2))
 
+    def teardown(self):
+        User.name.default = 'nobody'
+
 
 class TestFieldValues(object):
     def test_when_access_obj_field_and_value_is_already_assigned_then_is_value(self):
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from expects import *
+
+from booby import fields, interning, models
+
+
+class TestStringField(object):
+    def test_should_intern_decoded_values(self):
+        first = User.decode({'country': _copy('es')})
+        second = User.decode({'country': _copy('es')})
+
+        expect(second['country']).to(be(first['country']))
+
+    def test_should_intern_assigned_values(self):
+        first = User(country=_copy('es'))
+        second = User()
+        second.country = _copy('es')
+
+        expect(second.country).to(be(first.country))
+
+    def test_should_intern_values_of_built_instances(self):
+        users = list(User.decode_many([{'country': _copy('es')},
+                                       {'country': _copy('es')}]))
+
+        expect(users[1].country).to(be(users[0].country))
+
+    def test_should_share_given_table(self):
+        user = User(country=_copy('es'), nationality=_copy('es'))
+
+        expect(user.nationality).to(be(user.country))
+
+    def test_should_intern_choices_by_default(self):
+        User(role=_copy('admin'))
+
+        expect(User.role.intern_table).to(have_length(2))
+        expect(User.role.intern_table.hits).to(be_above(0))
+
+    def test_should_keep_type_of_values_equal_to_choices(self):
+        user = User(role=u'admin')
+
+        expect(user.role).to(be_a(unicode))
+        expect(User.decode({u'role': u'admin'})['role']).to(be_a(unicode))
+
+    def test_should_be_picklable(self):
+        user = pickle.loads(pickle.dumps(User(country='es', role='admin')))
+
+        expect(user).to(have_properties(country='es', role='admin'))
+
+    def test_should_not_intern_choices_if_disabled(self):
+        expect(User.status.intern_table).to(be_none)
+
+    def test_should_not_intern_by_default(self):
+        expect(User.name.intern_table).to(be_none)
+
+
+COUNTRIES = interning.InternTable()
+
+
+class User(models.Model):
+    name = fields.String()
+    country = fields.String(intern=COUNTRIES)
+    nationality = fields.String(intern=COUNTRIES)
+    role = fields.String(choices=['admin', 'user'])
+    status = fields.String(choices=['active', 'banned'], intern=False)
+
+
+def _copy(value):
+    return ''.join(list(value))
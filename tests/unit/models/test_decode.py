@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import types
+
 from expects import *
 
-from booby import fields, models
+from booby import fields, models, errors
 
 
 IRRELEVANT_NAME = 'irrelevant name'
@@ -64,6 +66,194 @@ class TestDecodeModel(object):
                                     last_update=IRRELEVANT_DATE))
 
 
+class TestDecodeMany(object):
+    def test_should_return_a_generator(self):
+        result = User.decode_many([])
+
+        expect(result).to(be_a(types.GeneratorType))
+
+    def test_should_yield_model_instances_with_decoded_values(self):
+        result = list(User.decode_many([
+            {'username': IRRELEVANT_NAME},
+            {'username': IRRELEVANT_NAME, 'emailAddress': IRRELEVANT_EMAIL}
+        ]))
+
+        expect(result[0]).to(be_a(User) & have_properties(
+            name=IRRELEVANT_NAME, email=None))
+        expect(result[1]).to(have_properties(
+            name=IRRELEVANT_NAME, email=IRRELEVANT_EMAIL))
+
+    def test_should_decode_records_lazily(self):
+        def raws():
+            yield {'username': IRRELEVANT_NAME}
+            raise AssertionError('should not be consumed')
+
+        result = next(User.decode_many(raws()))
+
+        expect(result.name).to(equal(IRRELEVANT_NAME))
+
+    def test_should_call_overriden_init(self):
+        class UserWithInit(User):
+            def __init__(self, **kwargs):
+                super(UserWithInit, self).__init__(**kwargs)
+                self.email = IRRELEVANT_EMAIL
+
+        result = next(UserWithInit.decode_many([{'username': IRRELEVANT_NAME}]))
+
+        expect(result).to(have_properties(
+            name=IRRELEVANT_NAME, email=IRRELEVANT_EMAIL))
+
+    def test_should_raise_error_by_default(self):
+        result = User.decode_many([{'username': 1}], validate=True)
+
+        expect(lambda: list(result)).to(raise_error(
+            errors.ValidationError, 'name should be a string'))
+
+    def test_should_skip_failing_records(self):
+        result = list(User.decode_many(
+            [{'username': 1}, {'username': IRRELEVANT_NAME}],
+            on_error='skip', validate=True))
+
+        expect(result).to(have_length(1))
+        expect(result[0].name).to(equal(IRRELEVANT_NAME))
+
+    def test_should_collect_failing_records(self):
+        failures = []
+        raw = {'username': 1}
+
+        result = list(User.decode_many(
+            [{'username': IRRELEVANT_NAME}, raw],
+            on_error='collect', failures=failures, validate=True))
+
+        expect(result).to(have_length(1))
+        expect(failures).to(have_length(1))
+        expect(failures[0][:2]).to(equal((1, raw)))
+        expect(failures[0][2]).to(be_a(errors.ValidationError))
+
+    def test_should_skip_malformed_records(self):
+        result = list(Event.decode_many(
+            [None, 'foo', {'at': 5}, {'name': IRRELEVANT_NAME}],
+            on_error='skip'))
+
+        expect(result).to(have_length(1))
+        expect(result[0].name).to(equal(IRRELEVANT_NAME))
+
+    def test_should_collect_malformed_records_as_decode_errors(self):
+        failures = []
+
+        list(Event.decode_many([None, 'foo', {'at': 5}],
+                               on_error='collect', failures=failures))
+
+        expect([index for index, _, _ in failures]).to(equal([0, 1, 2]))
+        expect([type(err) for _, _, err in failures]).to(
+            equal([errors.DecodeError] * 3))
+
+    def test_should_skip_records_with_mistyped_embedded_models(self):
+        result = list(Group.decode_many(
+            [{'owner': 'foo'}, {'users': 5}, {'users': ['foo']}],
+            on_error='skip'))
+
+        expect(result).to(be_empty)
+
+    def test_should_propagate_errors_of_custom_decoders(self):
+        class Account(models.Model):
+            owner = fields.String(decoders=[failing_decoder])
+
+        expect(lambda: list(Account.decode_many(
+            [{'owner': IRRELEVANT_NAME}], on_error='skip'))).to(
+                raise_error(KeyError))
+
+    def test_should_fail_if_collect_without_failures_list(self):
+        expect(lambda: User.decode_many([], on_error='collect')).to(
+            raise_error(ValueError))
+
+    def test_should_fail_if_invalid_on_error(self):
+        expect(lambda: User.decode_many([], on_error='ignore')).to(
+            raise_error(ValueError))
+
+
+class TestDecodeLazy(object):
+    def test_should_return_model_instance(self):
+        result = User.decode_lazy({'username': IRRELEVANT_NAME})
+
+        expect(result).to(be_a(User) & have_properties(
+            name=IRRELEVANT_NAME, email=None))
+
+    def test_should_decode_field_when_first_read(self):
+        spy = Spy()
+
+        class Account(models.Model):
+            owner = fields.String(decoders=[spy])
+
+        result = Account.decode_lazy({'owner': IRRELEVANT_NAME})
+
+        expect(spy.calls).to(equal(0))
+        result.owner
+        result.owner
+        expect(spy.calls).to(equal(1))
+
+    def test_should_return_assigned_value_instead_of_raw_value(self):
+        result = User.decode_lazy({'username': IRRELEVANT_NAME})
+
+        result.name = DECODED_IRRELEVANT_NAME
+
+        expect(result.name).to(equal(DECODED_IRRELEVANT_NAME))
+
+    def test_should_decode_embedded_and_collection_fields_lazily(self):
+        result = Group.decode_lazy({
+            'owner': {'username': IRRELEVANT_NAME},
+            'users': [{'username': IRRELEVANT_NAME}]
+        })
+
+        expect(result.owner).to(be_a(User))
+        expect(result.owner.name).to(equal(IRRELEVANT_NAME))
+        expect(result.users[0]).to(be_a(User))
+        expect(result.users[0].name).to(equal(IRRELEVANT_NAME))
+
+    def test_should_pass_raw_values_of_unread_fields_when_encoding(self):
+        owner = {'username': IRRELEVANT_NAME, 'unknown': IRRELEVANT_DATE}
+
+        result = Group.decode_lazy({'owner': owner, 'users': []}).encode()
+
+        expect(result['owner']).to(be(owner))
+
+    def test_should_encode_read_fields(self):
+        group = Group.decode_lazy({'owner': {'username': IRRELEVANT_NAME}})
+
+        group.owner.name = DECODED_IRRELEVANT_NAME
+
+        expect(group.encode()['owner']).to(have_keys(
+            username=DECODED_IRRELEVANT_NAME))
+
+
+class Spy(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return value
+
+
+def failing_decoder(value):
+    return {}[value]
+
+
+class User(models.Model):
+    name = fields.String(name='username')
+    email = fields.String(name='emailAddress')
+
+
+class Event(models.Model):
+    name = fields.String()
+    at = fields.DateTime()
+
+
+class Group(models.Model):
+    owner = fields.Embedded(User)
+    users = fields.Collection(User)
+
+
 class StubField(fields.Field):
     def decode(self, value):
         return self.options['decoded']
@@ -26,6 +26,73 @@ class TestDefaultModelInit(object):
             errors.FieldError, 'foo'))
 
 
+class TestModelFromDict(object):
+    def test_should_set_fields_values(self):
+        user = User.from_dict({'name': 'foo', 'email': 'foo@example.com'})
+
+        expect(user).to(have_properties(name='foo', email='foo@example.com'))
+
+    def test_should_raise_field_error_if_key_is_not_a_field(self):
+        expect(lambda: User.from_dict({'name': 'foo', 'foo': 'bar'})).to(
+            raise_error(errors.FieldError, 'foo'))
+
+    def test_should_build_nested_models_from_mappings(self):
+        user = UserWithTokens.from_dict({'tokens': [{'key': 'foo'}, Token()]})
+
+        expect(user.tokens[0]).to(be_a(Token) & have_property('key', 'foo'))
+        expect(user.tokens[1]).to(be_a(Token))
+
+    def test_should_call_overriden_field_set_method(self):
+        user = UserWithUppercaseName.from_dict({'name': 'foo'})
+
+        expect(user.name).to(equal('FOO'))
+
+    def test_should_call_overriden_setitem_method(self):
+        user = UserWithSetItemLog.from_dict({'name': 'foo'})
+
+        expect(user.log).to(equal(['name']))
+
+    def test_should_call_overriden_init(self):
+        user = UserWithInitLog.from_dict({'name': 'foo'})
+
+        expect(user).to(have_properties(name='foo', log=['init']))
+
+
+class TestNonMaterializingReads(object):
+    def test_encode_should_not_store_default_values(self):
+        user = UserWithDefaults(name='foo')
+
+        result = user.encode()
+
+        expect(result).to(have_keys(tags=[], role='user'))
+        expect(user._data).not_to(have_key(UserWithDefaults.tags))
+        expect(user._data).not_to(have_key(UserWithDefaults.role))
+
+    def test_iter_validate_and_repr_should_not_store_default_values(self):
+        user = UserWithDefaults(name='foo')
+
+        dict(user)
+        user.validate()
+        repr(user)
+
+        expect(user._data).not_to(have_key(UserWithDefaults.tags))
+        expect(user._data).not_to(have_key(UserWithDefaults.role))
+
+    def test_should_store_default_values_of_arbitrary_callables(self):
+        user = UserWithDefaults()
+
+        result = user.encode()
+
+        expect(user.token).to(equal(result['token']))
+
+    def test_should_return_default_value_when_field_is_read(self):
+        user = UserWithDefaults()
+
+        user.tags.append('foo')
+
+        expect(user.encode()).to(have_key('tags', ['foo']))
+
+
 class TestOverridenModelInit(object):
     def test_when_pass_args_then_set_fields_values(self):
         class UserWithOverridenInit(User):
@@ -92,6 +159,180 @@ class TestValidateModel(object):
                                              'name is required'))
 
 
+class TestIncrementalValidation(object):
+    def test_should_not_validate_again_unchanged_fields(self):
+        spy = CountingValidator()
+
+        class User(models.Model):
+            name = fields.String(spy)
+
+        user = User(name='foo')
+        user.validate()
+        user.validate()
+
+        expect(spy.calls).to(equal(1))
+
+    def test_should_validate_again_assigned_fields(self):
+        spy = CountingValidator()
+
+        class User(models.Model):
+            name = fields.String(spy)
+
+        user = User(name='foo')
+        user.validate()
+        user.name = 'bar'
+        user.validate()
+
+        expect(spy.calls).to(equal(2))
+
+    def test_should_validate_again_failing_fields(self):
+        user = UserWithRequiredName()
+
+        expect(user.validate).to(raise_error(errors.ValidationError))
+        expect(user.validate).to(raise_error(errors.ValidationError))
+
+    def test_should_validate_again_fields_with_mutable_values(self):
+        spy = CountingValidator()
+
+        class User(models.Model):
+            tags = fields.List(spy)
+
+        user = User(tags=['foo'])
+        user.validate()
+        user.tags.append('bar')
+        user.validate()
+
+        expect(spy.calls).to(equal(2))
+
+    def test_should_not_validate_again_unchanged_trees(self):
+        spy = CountingValidator()
+
+        class Tag(models.Model):
+            name = fields.String()
+
+        class Post(models.Model):
+            tag = fields.Embedded(Tag, spy)
+            tags = fields.Collection(Tag, spy)
+
+        post = Post(tag=Tag(name='foo'), tags=[Tag(name='bar')])
+        post.validate()
+        calls = spy.calls
+        post.validate()
+
+        expect(spy.calls).to(equal(calls))
+
+    def test_should_validate_changes_in_embedded_models(self):
+        user = UserWithToken(token=Token(key='foo'))
+        user.validate()
+
+        user.token.key = 1
+
+        expect(user.validate).to(raise_error(
+            errors.ValidationError, 'token key should be a string'))
+
+    def test_should_validate_changes_in_collection_elements(self):
+        user = UserWithTokens(tokens=[Token(key='foo')])
+        user.validate()
+
+        user.tokens.append(Token(key=1))
+
+        expect(user.validate).to(raise_error(
+            errors.ValidationError, contain('key should be a string')))
+
+    def test_should_not_validate_again_unchanged_trees_with_unset_lists(self):
+        spy = CountingValidator()
+
+        class Tag(models.Model):
+            names = fields.List()
+
+        class Post(models.Model):
+            tags = fields.Collection(Tag, spy)
+
+        post = Post(tags=[Tag()])
+        post.validate()
+        calls = spy.calls
+        post.validate()
+
+        expect(spy.calls).to(equal(calls))
+
+        post.tags[0].names = 'foo'
+
+        expect(post.validate).to(raise_error(
+            errors.ValidationError, contain('names should be a list')))
+
+    def test_should_validate_replaced_collection_elements(self):
+        user = UserWithTokens(tokens=[Token(key='foo')])
+        user.validate()
+
+        user.tokens[0] = Token(key=1)
+
+        expect(user.validate).to(raise_error(
+            errors.ValidationError, contain('key should be a string')))
+
+    def test_should_validate_changes_in_nested_models(self):
+        user = UserWithTokens(tokens=[Token(key='foo')])
+        group = Group(users=[user])
+        group.validate()
+
+        user.tokens[0].key = 1
+
+        expect(group.validate).to(raise_error(
+            errors.ValidationError, contain('key should be a string')))
+
+    def test_should_validate_again_assigned_fields_of_slots_models(self):
+        class Point(models.Model):
+            __storage__ = 'slots'
+
+            x = fields.Integer()
+
+        point = Point(x=1)
+        point.validate()
+        point.x = 'foo'
+
+        expect(point.validate).to(raise_error(
+            errors.ValidationError, 'x should be an integer'))
+
+
+class TestValidateManyModels(object):
+    def test_should_return_valid_mask(self):
+        result = UserWithRequiredFields.validate_many([
+            UserWithRequiredFields(name='foo', role='user'),
+            UserWithRequiredFields(id=1),
+            UserWithRequiredFields(name='bar', role='admin')
+        ])
+
+        expect(result.valid).to(equal([True, False, True]))
+        expect(result.is_valid).to(be_false)
+        expect(result).to(have_length(3))
+
+    def test_should_return_all_errors_by_record_and_field(self):
+        result = UserWithRequiredFields.validate_many([
+            UserWithRequiredFields(name='foo'),
+            UserWithRequiredFields(id=1, role='root')
+        ])
+
+        expect(result.errors).to(have_keys(1))
+        expect(result.errors[1]['id']).to(contain('be a string'))
+        expect(result.errors[1]['role']).to(contain('be in'))
+        expect(result.errors[1]['name']).to(contain('required'))
+
+    def test_should_be_valid_if_no_errors(self):
+        result = UserWithRequiredName.validate_many(
+            [UserWithRequiredName(name='foo')])
+
+        expect(result.is_valid).to(be_true)
+        expect(result.errors).to(be_empty)
+
+    def test_should_run_overridden_validate_of_records_with_valid_fields(self):
+        result = Range.validate_many(
+            [Range(lo=1, hi=2), Range(lo=2, hi=1), Range(lo='2', hi=1)])
+
+        expect(result.valid).to(equal([True, False, False]))
+        expect(result.errors[1]).to(equal(
+            {None: 'lo should be lower than hi'}))
+        expect(result.errors[2]).to(have_keys('lo'))
+
+
 class TestInheritedModel(object):
     def test_when_pass_kwargs_then_set_fields_values(self):
         user = UserWithPage(name='foo', email='foo@example.com', page='example.com')
@@ -221,12 +462,39 @@ class TestModelToJSON(object):
     def test_when_model_has_single_fields_then_returns_json_with_fields_values(self):
         result = self.user.to_json()
 
-        expect(result).to(equal(json.dumps(dict(self.user))))
+        expect(result).to(equal(json.dumps(self.user.encode())))
 
     def test_when_pass_extra_arguments_then_call_json_dump_function_with_these_args(self):
         result = self.user.to_json(indent=2)
 
-        expect(result).to(equal(json.dumps(dict(self.user), indent=2)))
+        expect(result).to(equal(json.dumps(self.user.encode(), indent=2)))
+
+    def test_should_use_field_names_and_skip_read_only_fields(self):
+        user = UserWithWireNames(name='foo', email='foo@example.com', id=1)
+
+        result = json.loads(user.to_json())
+
+        expect(result).to(equal({'username': 'foo',
+                                 'emailAddress': 'foo@example.com'}))
+
+    def test_should_encode_embedded_models_and_collections(self):
+        user = UserWithTokens(name='foo', tokens=[
+            UserWithWireNames(name='bar', email='bar@example.com')])
+
+        result = json.loads(user.to_json())
+
+        expect(result).to(equal({
+            'name': 'foo',
+            'email': None,
+            'tokens': [{'username': 'bar', 'emailAddress': 'bar@example.com'}]
+        }))
+
+    def test_should_encode_models_with_overriden_encode(self):
+        user = UserWithToken(token=TokenWithCustomEncode(key='foo'))
+
+        result = json.loads(user.to_json())
+
+        expect(result).to(have_key('token', 'custom'))
 
     def setup(self):
         self.user = User(name='Jack', email='jack@example.com')
@@ -267,6 +535,75 @@ class Token(models.Model):
     secret = fields.String()
 
 
+class UserWithToken(User):
+    token = fields.Embedded(Token)
+
+
+class UserWithTokens(User):
+    tokens = fields.Collection(Token)
+
+
+class Group(models.Model):
+    users = fields.Collection(UserWithTokens)
+
+
+class UserWithWireNames(models.Model):
+    name = fields.String(name='username')
+    email = fields.String(name='emailAddress')
+    id = fields.Integer(read_only=True)
+
+
+class TokenWithCustomEncode(Token):
+    def encode(self):
+        return 'custom'
+
+
+class UppercaseString(fields.String):
+    def __set__(self, instance, value):
+        super(UppercaseString, self).__set__(instance, value.upper())
+
+
+class UserWithUppercaseName(User):
+    name = UppercaseString()
+
+
+class UserWithSetItemLog(User):
+    def __setitem__(self, k, v):
+        self.__dict__.setdefault('log', []).append(k)
+        super(UserWithSetItemLog, self).__setitem__(k, v)
+
+
+class UserWithInitLog(User):
+    def __init__(self, **kwargs):
+        super(UserWithInitLog, self).__init__(**kwargs)
+        self.log = ['init']
+
+
+class UserWithDefaults(User):
+    tags = fields.List()
+    role = fields.String(default='user')
+    token = fields.Field(default=lambda: object())
+
+
+class CountingValidator(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+
+
+class Range(models.Model):
+    lo = fields.Integer()
+    hi = fields.Integer()
+
+    def validate(self):
+        super(Range, self).validate()
+
+        if self.lo > self.hi:
+            raise errors.ValidationError('lo should be lower than hi')
+
+
 class Animal(models.Model):
     role = fields.String(default='Animal')
     attribute = fields.String(default='default')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from expects import *
+
+from booby import fields, models
+
+
+class TestPickle(object):
+    def test_should_restore_fields_values(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            user = _round_trip(self.user, protocol)
+
+            expect(user).to(be_a(User))
+            expect(user.encode()).to(equal(self.user.encode()))
+
+    def test_should_not_pickle_fields(self):
+        result = pickle.dumps(self.user, pickle.HIGHEST_PROTOCOL)
+
+        expect(result).not_to(contain(b'booby.fields'))
+
+    def test_should_omit_unset_fields(self):
+        user = User(login='foo')
+
+        restored = _round_trip(user)
+
+        expect(restored._data).to(have_length(1))
+        expect(restored.karma).to(equal(0))
+
+    def test_should_restore_instance_attributes(self):
+        self.user.extra = 'foo'
+
+        expect(_round_trip(self.user)).to(have_property('extra', 'foo'))
+
+    def test_should_restore_slots_models(self):
+        point = Point(x=1)
+
+        restored = _round_trip(point)
+
+        expect(restored).to(have_properties(x=1, y=None))
+
+    def test_should_restore_lazily_decoded_models(self):
+        user = User.decode_lazy({'login': 'foo', 'tokens': [{'key': 'a'}]})
+
+        restored = _round_trip(user)
+
+        expect(restored.tokens[0]).to(be_a(Token) & have_property('key', 'a'))
+
+    def test_should_validate_restored_models(self):
+        self.user.validate()
+        self.user.login = 1
+
+        restored = _round_trip(self.user)
+
+        expect(restored.is_valid).to(be_false)
+
+    def setup(self):
+        self.user = User(login='foo', karma=3, tokens=[Token(key='a')],
+                         token=Token(key='b', secret='c'))
+
+
+def _round_trip(instance, protocol=pickle.HIGHEST_PROTOCOL):
+    return pickle.loads(pickle.dumps(instance, protocol))
+
+
+class Token(models.Model):
+    key = fields.String()
+    secret = fields.String()
+
+
+class User(models.Model):
+    login = fields.String()
+    karma = fields.Integer(default=0)
+    token = fields.Embedded(Token)
+    tokens = fields.Collection(Token)
+
+
+class Point(models.Model):
+    __storage__ = 'slots'
+
+    x = fields.Integer()
+    y = fields.Integer()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from expects import *
+
+from booby import errors, fields, models, inspection
+
+
+class TestSlotsStorage(object):
+    def test_instances_should_not_have_dict(self):
+        expect(hasattr(Point(), '__dict__')).to(be_false)
+
+    def test_should_return_assigned_values(self):
+        point = Point(x=1, y=2)
+
+        expect(point).to(have_properties(x=1, y=2))
+
+    def test_should_return_default_if_value_is_not_assigned(self):
+        expect(Point().x).to(equal(0))
+
+    def test_class_attribute_should_be_the_field_object(self):
+        expect(Point.x).to(be_a(fields.Integer))
+
+    def test_should_get_and_set_fields_as_items(self):
+        point = Point()
+        point['y'] = 3
+
+        expect(point['y']).to(equal(3))
+
+    def test_should_update_fields_values(self):
+        point = Point()
+        point.update(x=3, y=4)
+
+        expect(dict(point)).to(equal({'x': 3, 'y': 4, 'label': None}))
+
+    def test_should_raise_field_error_if_field_does_not_exist(self):
+        expect(lambda: Point(z=1)).to(raise_error(errors.FieldError, 'z'))
+
+    def test_should_not_allow_non_field_attributes(self):
+        def callback():
+            Point().z = 1
+
+        expect(callback).to(raise_error(AttributeError))
+
+    def test_inspection_should_return_model_fields(self):
+        expect(inspection.get_fields(Point)).to(have_keys(
+            x=Point.x, y=Point.y, label=Point.label))
+
+    def test_should_resolve_embedded_models(self):
+        point = Point(label={'text': 'origin'})
+
+        expect(point.label).to(be_a(Label) & have_property('text', 'origin'))
+
+    def test_should_encode_and_validate(self):
+        point = Point(x=1, y='foo')
+
+        expect(point.encode()).to(have_keys(x=1, y='foo'))
+        expect(point.validate).to(raise_error(
+            errors.ValidationError, 'y should be an integer'))
+
+
+    def test_encode_should_not_store_default_values(self):
+        point = Point()
+
+        point.encode()
+
+        expect(lambda: Point.__dict__['x'].slot.__get__(point, Point)).to(
+            raise_error(AttributeError))
+
+
+class TestInheritedSlotsStorage(object):
+    def test_should_inherit_storage_mode(self):
+        expect(hasattr(Point3D(), '__dict__')).to(be_false)
+
+    def test_should_store_inherited_and_own_fields(self):
+        point = Point3D(x=1, y=2, z=3)
+
+        expect(point).to(have_properties(x=1, y=2, z=3))
+
+    def test_should_use_overriden_fields(self):
+        point = Point3D(y='foo')
+
+        expect(Point3D.y).to(be_a(fields.String))
+        expect(point.validate).not_to(raise_error(errors.ValidationError))
+
+
+class Label(models.Model):
+    text = fields.String()
+
+
+class Point(models.Model):
+    __storage__ = 'slots'
+
+    x = fields.Integer(default=0)
+    y = fields.Integer()
+    label = fields.Embedded(Label)
+
+
+class Point3D(Point):
+    y = fields.String()
+    z = fields.Integer()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from expects import *
+
+from booby import compiler, errors, fields, models
+
+
+class TestSparseStorage(object):
+    def test_should_return_assigned_and_default_values(self):
+        event = Event(kind='click')
+
+        expect(event).to(have_properties(kind='click', source='web', page=None))
+
+    def test_encode_should_only_include_set_and_defaulted_fields(self):
+        event = Event(kind='click', page='/home', secret='foo')
+
+        expect(event.encode()).to(equal({
+            'kind': 'click', 'source': 'web', 'pageUrl': '/home'}))
+
+    def test_iter_should_only_include_set_and_defaulted_fields(self):
+        event = Event(kind='click')
+
+        expect(dict(event)).to(equal({'kind': 'click', 'source': 'web'}))
+
+    def test_to_json_should_only_include_set_and_defaulted_fields(self):
+        event = Event(kind='click')
+
+        expect(json.loads(event.to_json())).to(equal(
+            {'kind': 'click', 'source': 'web'}))
+
+    def test_validate_should_check_set_fields(self):
+        event = Event(kind='click', page=1)
+
+        expect(event.validate).to(raise_error(
+            errors.ValidationError, 'page should be a string'))
+
+    def test_validate_should_check_unset_required_fields(self):
+        event = Event(page='/home')
+
+        expect(event.validate).to(raise_error(
+            errors.ValidationError, 'kind is required'))
+        expect(dict(event.validation_errors)).to(have_key('kind'))
+
+    def test_validate_should_skip_unset_fields_accepting_none(self):
+        Event(kind='click').validate()
+        calls = Event.counted.validators[0].calls
+
+        Event(kind='click').validate()
+
+        expect(Event.counted.validators[0].calls).to(equal(calls))
+
+    def test_should_not_call_validators_until_validating(self):
+        class Visit(models.Model):
+            __storage__ = 'sparse'
+
+            counted = fields.Field(CountingValidator())
+
+        Visit().encode()
+
+        expect(Visit.counted.validators[0].calls).to(equal(0))
+
+    def test_decode_should_decode_payload_fields(self):
+        result = Event.decode({'kind': 'click', 'pageUrl': '/home', 'foo': 1})
+
+        expect(result).to(equal({'kind': 'click', 'page': '/home'}))
+
+    def test_decode_many_should_build_instances_from_payload_fields(self):
+        event = next(Event.decode_many([{'kind': 'click', 'pageUrl': '/'}]))
+
+        expect(event.encode()).to(equal(
+            {'kind': 'click', 'source': 'web', 'pageUrl': '/'}))
+
+    def test_should_inherit_storage_mode(self):
+        event = PageView(kind='view')
+
+        expect(event.encode()).to(equal({'kind': 'view', 'source': 'web'}))
+
+
+class TestSparseStorageWithoutCompiler(TestSparseStorage):
+    def setup(self):
+        compiler.enabled = False
+
+    def teardown(self):
+        compiler.enabled = True
+
+
+class CountingValidator(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+
+
+class Event(models.Model):
+    __storage__ = 'sparse'
+
+    kind = fields.String(required=True)
+    source = fields.String(default='web')
+    page = fields.String(name='pageUrl')
+    referrer = fields.String()
+    secret = fields.String(read_only=True)
+    counted = fields.Field(CountingValidator())
+
+
+class PageView(Event):
+    duration = fields.Integer()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from expects import *
+
+from booby import fields, models
+from booby.arrays import ModelArray, numpy
+
+
+class TestModelArray(object):
+    def test_should_have_length_of_items(self):
+        expect(self.array).to(have_length(3))
+
+    def test_should_store_fields_in_typed_columns(self):
+        expect(self.array['value'].dtype).to(equal(numpy.dtype('float64')))
+        expect(self.array['count'].dtype).to(equal(numpy.dtype('int64')))
+        expect(self.array['active'].dtype).to(equal(numpy.dtype('bool')))
+        expect(self.array['sensor'].dtype.kind).to(equal('U'))
+
+    def test_should_store_columns_with_none_values_as_objects(self):
+        array = ModelArray(Sample, [Sample(count=1), Sample()])
+
+        expect(array['count'].dtype).to(equal(numpy.dtype(object)))
+
+    def test_should_store_byte_strings_in_byte_string_columns(self):
+        array = ModelArray(Sample, [Sample(sensor=b'caf\xc3\xa9')])
+
+        expect(array['sensor'].dtype.kind).to(equal('S'))
+        expect(array[0].sensor).to(equal(b'caf\xc3\xa9'))
+        expect(array[0].sensor).to(be_a(bytes))
+
+    def test_should_store_mixed_text_and_byte_strings_as_objects(self):
+        array = ModelArray(Sample, [Sample(sensor=b'a'), Sample(sensor=u'b')])
+
+        expect(array['sensor'].dtype).to(equal(numpy.dtype(object)))
+        expect(array[0].sensor).to(be_a(bytes))
+
+    def test_should_store_strings_ending_with_nul_as_objects(self):
+        array = ModelArray(Sample, [Sample(sensor=b'a\x00')])
+
+        expect(array['sensor'].dtype).to(equal(numpy.dtype(object)))
+        expect(array[0].sensor).to(equal(b'a\x00'))
+
+    def test_should_store_booleans_in_integer_columns_as_objects(self):
+        array = ModelArray(Sample, [Sample(count=True), Sample(count=2)])
+
+        expect(array['count'].dtype).to(equal(numpy.dtype(object)))
+        expect(array[0].count).to(be(True))
+
+    def test_should_store_enum_fields_as_indexes(self):
+        array = ModelArray(Task, [Task(status='done'), Task(status='todo')])
+
+        expect(array['status'].dtype).to(equal(numpy.dtype('uint8')))
+        expect(array['status'].tolist()).to(equal([1, 0]))
+        expect(array[0].status).to(equal('done'))
+
+    def test_should_store_enum_values_not_in_choices_as_objects(self):
+        array = ModelArray(Task, [Task(status='done'), Task()])
+
+        expect(array['status'].dtype).to(equal(numpy.dtype(object)))
+        expect(array[0].status).to(equal('done'))
+
+    def test_should_build_items_from_mappings(self):
+        array = ModelArray(Sample, [{'sensor': 'a', 'value': 1.0}])
+
+        expect(array['sensor'].tolist()).to(equal(['a']))
+
+    def test_should_materialize_model_on_index_access(self):
+        result = self.array[1]
+
+        expect(result).to(be_a(Sample) & have_properties(
+            sensor='b', value=0.5, count=2, active=False))
+        expect(type(result.count)).to(be(int))
+
+    def test_should_support_negative_indexes(self):
+        expect(self.array[-1].sensor).to(equal('c'))
+
+    def test_should_raise_index_error_if_out_of_range(self):
+        expect(lambda: self.array[3]).to(raise_error(IndexError))
+
+    def test_should_return_new_array_on_slice(self):
+        result = self.array[1:]
+
+        expect(result).to(be_a(ModelArray) & have_length(2))
+        expect(result[0].sensor).to(equal('b'))
+
+    def test_should_filter_items_by_mask(self):
+        result = self.array.filter(self.array['value'] > 1.0)
+
+        expect([item.sensor for item in result]).to(equal(['a', 'c']))
+
+    def test_should_sort_items_by_field(self):
+        result = self.array.sort('value')
+
+        expect(result['sensor'].tolist()).to(equal(['b', 'a', 'c']))
+
+    def test_should_sort_items_by_several_fields_in_reverse(self):
+        result = self.array.sort(['active', 'value'], reverse=True)
+
+        expect(result['sensor'].tolist()).to(equal(['c', 'a', 'b']))
+
+    def test_should_aggregate_field_column(self):
+        expect(self.array.aggregate('count', 'sum')).to(equal(6))
+        expect(self.array.aggregate('value', max)).to(equal(3.0))
+
+    def test_should_fail_on_unknown_aggregate(self):
+        expect(lambda: self.array.aggregate('count', 'foo')).to(
+            raise_error(ValueError))
+
+    def test_should_convert_to_list_of_models(self):
+        result = self.array.to_models()
+
+        expect(result).to(have_length(3))
+        expect(result[0]).to(be_a(Sample))
+
+    def test_should_convert_from_and_to_collection_field(self):
+        station = Station(samples=self.array.to_models())
+
+        result = ModelArray.from_collection(station, 'samples')
+
+        expect(result['count'].tolist()).to(equal([1, 2, 3]))
+
+    def setup(self):
+        if numpy is None:
+            raise unittest.SkipTest('numpy is not installed')
+
+        self.array = ModelArray(Sample, [
+            Sample(sensor=u'a', value=1.5, count=1, active=True),
+            Sample(sensor=u'b', value=0.5, count=2, active=False),
+            Sample(sensor=u'c', value=3.0, count=3, active=True)
+        ])
+
+
+class Sample(models.Model):
+    sensor = fields.String()
+    value = fields.Float()
+    count = fields.Integer()
+    active = fields.Boolean()
+
+
+class Task(models.Model):
+    status = fields.Enum(['todo', 'done'])
+
+
+class Station(models.Model):
+    samples = fields.Collection(Sample)
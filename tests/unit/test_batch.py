@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from expects import *
+
+from booby import batch, errors, fields, models
+
+
+class TestProcessMany(object):
+    def test_should_return_decoded_instances_in_order(self):
+        result = list(batch.process_many(
+            User, self.raws, chunk_size=3, executor=self.executor))
+
+        expect([user.login for user in result]).to(
+            equal(['foo%d' % i for i in range(10)]))
+        expect(result[0].token).to(be_a(Token) & have_property('key', 'k0'))
+
+    def test_should_return_encoded_records_if_encode(self):
+        result = list(batch.process_many(
+            User, self.raws, encode=True, chunk_size=3, executor=self.executor))
+
+        expect(result).to(equal(self.raws))
+
+    def test_should_bound_chunks_in_flight(self):
+        results = batch.process_many(User, self.raws, chunk_size=2,
+                                     max_in_flight=2, executor=self.executor)
+
+        next(results)
+
+        expect(self.executor.submitted).to(equal(3))
+
+    def test_should_return_results_as_chunks_complete_if_not_ordered(self):
+        result = list(batch.process_many(User, self.raws, chunk_size=3,
+                                         ordered=False, executor=self.executor))
+
+        expect(sorted(user.login for user in result)).to(
+            equal(['foo%d' % i for i in range(10)]))
+
+    def test_should_collect_failing_records_with_their_index(self):
+        self.raws[4]['login'] = None
+        failures = []
+
+        result = list(batch.process_many(
+            User, self.raws, validate=True, chunk_size=3, on_error='collect',
+            failures=failures, executor=self.executor))
+
+        expect(result).to(have_length(9))
+        expect(failures).to(have_length(1))
+        expect(failures[0][0]).to(equal(4))
+        expect(failures[0][1]).to(be(self.raws[4]))
+
+    def test_should_raise_first_error_after_previous_results(self):
+        self.raws[4]['login'] = None
+
+        results = batch.process_many(User, self.raws, validate=True,
+                                     chunk_size=3, executor=self.executor)
+
+        expect([next(results) for _ in range(4)]).to(have_length(4))
+        expect(lambda: next(results)).to(raise_error(
+            errors.ValidationError, 'login is required'))
+
+    def test_should_fail_if_collect_without_failures_list(self):
+        expect(lambda: batch.process_many(User, [], on_error='collect')).to(
+            raise_error(ValueError))
+
+    def setup(self):
+        self.executor = SyncExecutor()
+        self.raws = [{'login': 'foo%d' % i, 'token': {'key': 'k%d' % i}}
+                     for i in range(10)]
+
+
+class TestProcessManyInProcessPool(object):
+    def test_should_decode_records_in_worker_processes(self):
+        if batch.futures is None:
+            raise unittest.SkipTest('concurrent.futures is not installed')
+
+        raws = [{'login': 'foo%d' % i} for i in range(20)]
+
+        result = list(batch.process_many(User, raws, workers=2, chunk_size=3))
+
+        expect([user.login for user in result]).to(
+            equal([raw['login'] for raw in raws]))
+
+
+class SyncExecutor(object):
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, function, *args):
+        self.submitted += 1
+
+        return DoneFuture(function(*args))
+
+
+class DoneFuture(object):
+    def __init__(self, result):
+        self._result = result
+
+    def done(self):
+        return True
+
+    def result(self):
+        return self._result
+
+
+class Token(models.Model):
+    key = fields.String()
+
+
+class User(models.Model):
+    login = fields.String(required=True)
+    token = fields.Embedded(Token)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+
+from expects import *
+
+from booby import binary, errors, fields, models
+
+
+class TestBinary(object):
+    def test_should_restore_fields_values(self):
+        user = User.from_bytes(self.user.to_bytes())
+
+        expect(user).to(be_a(User))
+        expect(user.encode()).to(equal(self.user.encode()))
+        expect(user.token).to(be_a(Token))
+        expect(user.tokens[0]).to(be_a(Token))
+
+    def test_should_restore_native_types(self):
+        user = User.from_bytes(self.user.to_bytes())
+
+        expect(user).to(have_properties(
+            login=u'fòo', karma=-300, score=0.1, active=True))
+
+    def test_should_restore_big_integers(self):
+        self.user.karma = -2 ** 70
+
+        expect(User.from_bytes(self.user.to_bytes()).karma).to(
+            equal(-2 ** 70))
+
+    def test_should_restore_read_only_fields(self):
+        self.user.id = 'abc'
+
+        expect(User.from_bytes(self.user.to_bytes()).id).to(equal('abc'))
+
+    def test_should_serialize_other_fields_through_their_codecs(self):
+        user = User.from_bytes(self.user.to_bytes())
+
+        expect(user.created).to(equal(datetime.datetime(2014, 1, 2, 3, 4)))
+        expect(user.tags).to(equal(['a', 'b']))
+
+    def test_should_restore_enum_values(self):
+        user = User.from_bytes(User(role='admin', level=3).to_bytes())
+
+        expect(user).to(have_properties(role='admin', level=3))
+
+    def test_should_raise_encode_error_on_value_not_in_enum(self):
+        self.user.role = 'foo'
+
+        expect(self.user.to_bytes).to(raise_error(
+            errors.EncodeError, match("role should be in \[u?'admin'")))
+
+    def test_should_restore_none_values(self):
+        user = User(login=None, karma=None, active=None, tags=None)
+
+        result = User.from_bytes(user.to_bytes())
+
+        expect(result).to(have_properties(
+            login=None, karma=None, active=None, tags=None, token=None))
+
+    def test_should_not_include_field_names(self):
+        expect(self.user.to_bytes()).not_to(contain(b'login'))
+
+    def test_should_be_smaller_than_json(self):
+        expect(len(self.user.to_bytes())).to(be_below(
+            len(self.user.to_json())))
+
+    def test_should_restore_batches(self):
+        users = [self.user, User(login='bar')]
+
+        result = User.from_bytes_many(User.to_bytes_many(users))
+
+        expect([user.encode() for user in result]).to(equal(
+            [user.encode() for user in users]))
+
+    def test_should_raise_encode_error_on_mistyped_value(self):
+        self.user.karma = 'foo'
+
+        expect(self.user.to_bytes).to(raise_error(
+            errors.EncodeError, 'karma should be an integer'))
+
+    def test_should_raise_encode_error_on_boolean_integer(self):
+        self.user.karma = True
+
+        expect(self.user.to_bytes).to(raise_error(
+            errors.EncodeError, 'karma should be an integer'))
+
+    def test_should_raise_encode_error_on_mistyped_model(self):
+        self.user.token = User()
+
+        expect(self.user.to_bytes).to(raise_error(
+            errors.EncodeError, "token should be an instance of 'Token'"))
+
+    def test_should_raise_encode_error_on_unserializable_value(self):
+        self.user.tags = [object()]
+
+        expect(self.user.to_bytes).to(raise_error(
+            errors.EncodeError, match('tags should be serializable')))
+
+    def test_should_raise_decode_error_on_malformed_json_value(self):
+        data = self.user.to_bytes().replace(b'"b"]', b'"b"}')
+
+        expect(lambda: User.from_bytes(data)).to(raise_error(
+            errors.DecodeError, match('malformed data')))
+
+    def test_should_raise_decode_error_on_schema_mismatch(self):
+        data = self.user.to_bytes()
+
+        expect(lambda: Token.from_bytes(data)).to(raise_error(
+            errors.DecodeError, "schema mismatch for 'Token'"))
+
+    def test_should_raise_decode_error_on_batch_read_as_record(self):
+        data = User.to_bytes_many([self.user])
+
+        expect(lambda: User.from_bytes(data)).to(raise_error(
+            errors.DecodeError, 'expected a record'))
+
+    def test_should_raise_decode_error_on_truncated_data(self):
+        data = self.user.to_bytes()
+
+        expect(lambda: User.from_bytes(data[:-3])).to(raise_error(
+            errors.DecodeError))
+
+    def test_should_raise_decode_error_on_trailing_data(self):
+        data = self.user.to_bytes() + b'\x00'
+
+        expect(lambda: User.from_bytes(data)).to(raise_error(
+            errors.DecodeError, '1 unexpected trailing bytes'))
+
+    def test_should_raise_decode_error_on_truncated_header(self):
+        expect(lambda: User.from_bytes(b'BBY')).to(raise_error(
+            errors.DecodeError, 'truncated header'))
+        expect(lambda: User.from_bytes(b'BBY\x01')).to(raise_error(
+            errors.DecodeError, 'truncated header'))
+
+    def test_should_raise_decode_error_on_other_data(self):
+        expect(lambda: User.from_bytes(b'{"login": "foo"}')).to(raise_error(
+            errors.DecodeError, 'not a booby binary document'))
+
+    def test_fingerprint_should_depend_on_embedded_models(self):
+        expect(binary.fingerprint(User)).not_to(
+            equal(binary.fingerprint(OtherUser)))
+
+    def setup(self):
+        self.user = User(
+            login=u'fòo', karma=-300, score=0.1, active=True,
+            created=datetime.datetime(2014, 1, 2, 3, 4), tags=['a', 'b'],
+            token=Token(key='a', secret='b'), tokens=[Token(key='c')])
+
+
+class Token(models.Model):
+    key = fields.String()
+    secret = fields.String()
+
+
+class OtherToken(models.Model):
+    key = fields.String()
+    secret = fields.Integer()
+
+
+class User(models.Model):
+    id = fields.String(read_only=True)
+    login = fields.String()
+    karma = fields.Integer()
+    score = fields.Float()
+    active = fields.Boolean(default=False)
+    created = fields.DateTime()
+    tags = fields.List()
+    token = fields.Embedded(Token)
+    tokens = fields.Collection(Token)
+    role = fields.Enum(['admin', 'user'])
+    level = fields.Enum([1, 2, 3], store_index=True)
+
+
+class OtherUser(User):
+    token = fields.Embedded(OtherToken)
+
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+from expects import *
+
+from booby import compiler, fields, models, errors, validators
+
+IRRELEVANT_NAME = 'irrelevant name'
+IRRELEVANT_EMAIL = 'irrelevant email'
+IRRELEVANT_DATE = 'irrelevant date'
+
+
+class TestPlanFor(object):
+    def test_should_return_the_same_plan_for_the_same_model(self):
+        expect(compiler.plan_for(User)).to(be(compiler.plan_for(User)))
+
+    def test_should_not_share_plan_with_subclasses(self):
+        class Admin(User):
+            role = fields.String()
+
+        expect(compiler.plan_for(Admin)).not_to(be(compiler.plan_for(User)))
+        expect(compiler.plan_for(Admin).model).to(be(Admin))
+
+    def test_should_return_none_if_compilation_is_disabled(self):
+        compiler.enabled = False
+
+        expect(compiler.plan_for(User)).to(be_none)
+
+    def test_should_build_a_new_plan_after_reset(self):
+        plan = compiler.plan_for(User)
+
+        compiler.reset(User)
+
+        expect(compiler.plan_for(User)).not_to(be(plan))
+
+    def teardown(self):
+        compiler.enabled = True
+
+
+class TestFieldPlan(object):
+    def test_should_resolve_wire_name_and_read_only(self):
+        plan = compiler.FieldPlan('email', User.email)
+
+        expect(plan.wire_name).to(equal('emailAddress'))
+        expect(plan.read_only).to(be_false)
+
+    def test_should_have_no_encoder_if_field_has_no_encoders(self):
+        plan = compiler.FieldPlan('name', User.name)
+
+        expect(plan.encode).to(be_none)
+
+    def test_should_use_field_encode_method_if_overriden(self):
+        field = StubField()
+
+        plan = compiler.FieldPlan('name', field)
+
+        expect(plan.encode(IRRELEVANT_NAME)).to(equal('encoded'))
+
+
+class TestFuseValidators(object):
+    def test_should_fail_like_each_validator_in_order(self):
+        cases = [
+            (fields.String(required=True), [None, 1, 'foo']),
+            (fields.Integer(choices=[1, 2]), [None, 1, 3, 'foo']),
+            (fields.Email(choices=['a@b', 'c']), [None, 'a@b', 'c', 1]),
+            (fields.Field(validators.String(), validators.Email()),
+             [None, 'foo', 'foo@bar', 1]),
+            (fields.Field(choices=[[1], [2]]), [None, [1], [3]]),
+            (fields.Field(choices=[None, 'a']), [None, 'a', {}]),
+            (fields.Embedded(Token), [None, Token(key='foo'), Token(key=1), 1]),
+            (fields.Collection(Token), [None, [Token()], [Token(key=1)], 1]),
+            (fields.Field(stub_none_validator), [None, 'foo'])
+        ]
+
+        for field, values in cases:
+            validate = compiler.fuse_validators(field.validators)
+
+            for value in values:
+                expect(_failure(validate, value)).to(
+                    equal(_failure(field.validate, value)))
+
+    def test_should_call_custom_validators_with_none(self):
+        validate = compiler.fuse_validators([stub_none_validator])
+
+        expect(lambda: validate(None)).to(raise_error(
+            errors.ValidationError, 'none'))
+
+
+class TestCompiledModel(object):
+    def test_encode_should_return_same_result_as_generic_encode(self):
+        user = User(name=IRRELEVANT_NAME, email=IRRELEVANT_EMAIL,
+                    last_update=IRRELEVANT_DATE)
+
+        compiled = user.encode()
+        compiler.enabled = False
+
+        expect(compiled).to(equal(user.encode()))
+
+    def test_encode_should_return_same_result_as_generic_encode_for_nested_models(self):
+        group = Group(owner=User(name=IRRELEVANT_NAME),
+                      members=[User(email=IRRELEVANT_EMAIL), User()])
+
+        compiled = group.encode()
+        compiler.enabled = False
+
+        expect(compiled).to(equal(group.encode()))
+
+    def test_decode_should_return_same_result_as_generic_decode(self):
+        raw = {'name': IRRELEVANT_NAME, 'emailAddress': IRRELEVANT_EMAIL}
+
+        compiled = User.decode(raw)
+        compiler.enabled = False
+
+        expect(compiled).to(equal(User.decode(raw)))
+
+    def test_validate_should_raise_error_with_field_name(self):
+        user = User(name=1)
+
+        expect(user.validate).to(raise_error(
+            errors.ValidationError, 'name should be a string'))
+
+    def test_should_set_fields_through_overriden_setattr(self):
+        expect(Celsius(degrees=20).degrees).to(equal(20.0))
+        expect(next(Celsius.decode_many([{'degrees': 5}])).degrees).to(
+            equal(5.0))
+        expect(Celsius.decode_lazy({'degrees': 5}).degrees).to(equal(5.0))
+
+    def teardown(self):
+        compiler.enabled = True
+
+
+def stub_none_validator(value):
+    if value is None:
+        raise errors.ValidationError('none')
+
+
+def _failure(validate, value):
+    try:
+        validate(value)
+    except errors.ValidationError as err:
+        return str(err)
+
+
+class Token(models.Model):
+    key = fields.String()
+
+
+class StubField(fields.Field):
+    def encode(self, value):
+        return 'encoded'
+
+
+class User(models.Model):
+    name = fields.String()
+    email = fields.String(name='emailAddress')
+    last_update = fields.Field(read_only=True)
+
+
+class Group(models.Model):
+    owner = fields.Embedded(User)
+    members = fields.Collection(User)
+
+
+class Celsius(models.Model):
+    degrees = fields.Float()
+
+    def __setattr__(self, name, value):
+        if name == 'degrees':
+            value = float(value)
+
+        super(Celsius, self).__setattr__(name, value)
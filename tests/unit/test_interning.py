@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from expects import *
+
+from booby import interning
+
+
+class TestInternTable(object):
+    def test_should_return_stored_equal_string(self):
+        first = self.table.intern(_copy('spain'))
+
+        result = self.table.intern(_copy('spain'))
+
+        expect(result).to(be(first))
+
+    def test_should_count_hits_and_misses(self):
+        self.table.intern(_copy('spain'))
+        self.table.intern(_copy('spain'))
+        self.table.intern(_copy('spain'))
+        self.table.intern(_copy('france'))
+
+        expect(self.table).to(have_properties(hits=2, misses=2, rejected=0))
+        expect(self.table.hit_rate).to(equal(0.5))
+        expect(self.table.bytes_saved).to(be_above(0))
+
+    def test_should_not_count_already_interned_values(self):
+        value = self.table.intern(_copy('spain'))
+
+        self.table.intern(value)
+
+        expect(self.table).to(have_properties(hits=0, misses=1))
+
+    def test_should_not_store_values_when_full(self):
+        for value in ('spain', 'france', 'italy', 'greece'):
+            self.table.intern(_copy(value))
+
+        expect(self.table).to(have_length(3))
+        expect(self.table).to(have_property('rejected', 1))
+        expect('greece' in self.table).to(be_false)
+
+    def test_should_return_other_values_unchanged(self):
+        value = ['spain']
+
+        expect(self.table.intern(value)).to(be(value))
+        expect(self.table.intern(1)).to(equal(1))
+        expect(self.table).to(have_length(0))
+
+    def test_should_not_replace_values_of_other_type(self):
+        self.table.intern('spain')
+
+        expect(self.table.intern(u'spain')).to(be_a(unicode))
+        expect(self.table).to(have_properties(hits=0, misses=2))
+
+    def test_should_store_given_values_upfront(self):
+        table = interning.InternTable(values=['admin', 'user'])
+
+        expect(table.intern(_copy('admin'))).to(equal('admin'))
+        expect(table).to(have_properties(hits=1, misses=0))
+
+    def test_clear_should_reset_strings_and_counters(self):
+        self.table.intern(_copy('spain'))
+
+        self.table.clear()
+
+        expect(self.table).to(have_length(0))
+        expect(self.table).to(have_property('misses', 0))
+
+    def setup(self):
+        self.table = interning.InternTable(max_size=3)
+
+
+def _copy(value):
+    return ''.join(list(value))
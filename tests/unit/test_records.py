@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from expects import *
+
+from booby import errors, fields, models, records
+
+
+class TestLayout(object):
+    def test_should_restore_packed_instance(self):
+        sample = Sample(sensor=u'ñu', value=1.5, count=-3, active=True)
+
+        result = self.layout.unpack(self.layout.pack(sample))
+
+        expect(result).to(be_a(Sample))
+        expect(result).to(have_properties(
+            sensor=u'ñu', value=1.5, count=-3, active=True))
+
+    def test_should_restore_enum_values(self):
+        layout = records.Layout(Task)
+
+        result = layout.unpack(layout.pack(Task(status='done', priority=20)))
+
+        expect(result).to(have_properties(status='done', priority=20))
+        expect(layout.view(layout.pack(Task(priority=30)))).to(
+            have_properties(status=None, priority=30))
+
+    def test_should_pack_fixed_size_records(self):
+        expect(self.layout.pack(Sample(sensor='a'))).to(
+            have_length(self.layout.size))
+        expect(self.layout.pack(Sample(sensor='abcd'))).to(
+            have_length(self.layout.size))
+
+    def test_should_restore_none_values_as_unset(self):
+        result = self.layout.unpack(self.layout.pack(Sample(value=2.0)))
+
+        expect(result._data).to(have_length(2))
+        expect(result).to(have_properties(
+            sensor=None, value=2.0, count=None, active=False))
+
+    def test_should_raise_encode_error_on_too_long_string(self):
+        sample = Sample(sensor='abcde')
+
+        expect(lambda: self.layout.pack(sample)).to(raise_error(
+            errors.EncodeError, 'sensor is longer than 4 bytes'))
+
+    def test_should_raise_encode_error_on_mistyped_value(self):
+        sample = Sample(count='foo')
+
+        expect(lambda: self.layout.pack(sample)).to(raise_error(
+            errors.EncodeError, 'count should be an integer'))
+
+    def test_should_raise_encode_error_on_values_struct_would_coerce(self):
+        for sample, message in [
+                (Sample(count=1.9), 'count should be an integer'),
+                (Sample(count=True), 'count should be an integer'),
+                (Sample(value=True), 'value should be a float'),
+                (Sample(active='no'), 'active should be a boolean')]:
+            expect(lambda: self.layout.pack(sample)).to(raise_error(
+                errors.EncodeError, message))
+
+    def test_should_raise_encode_error_on_string_with_null_characters(self):
+        sample = Sample(sensor='ab\0')
+
+        expect(lambda: self.layout.pack(sample)).to(raise_error(
+            errors.EncodeError, 'sensor should not contain null characters'))
+
+    def test_should_raise_encode_error_on_string_not_in_utf8(self):
+        sample = Sample(sensor=b'\xff')
+
+        expect(lambda: self.layout.pack(sample)).to(raise_error(
+            errors.EncodeError, 'sensor should be UTF-8'))
+
+    def test_should_raise_value_error_on_missing_string_size(self):
+        expect(lambda: records.Layout(Sample)).to(raise_error(
+            ValueError, "missing size for string field 'sensor'"))
+
+    def test_should_raise_value_error_on_unpackable_field(self):
+        expect(lambda: records.Layout(Tagged)).to(raise_error(
+            ValueError, "field 'tags' of type List can not be packed"))
+
+    def setup(self):
+        self.layout = records.Layout(Sample, sizes={'sensor': 4})
+
+
+class TestRecordFile(object):
+    def test_should_index_records(self):
+        with self.layout.open(self.path) as samples:
+            expect(samples).to(have_length(3))
+            expect(samples[1]).to(have_properties(sensor='b', count=2))
+            expect(samples[-1]).to(have_properties(sensor='c', count=3))
+
+    def test_should_slice_records(self):
+        with self.layout.open(self.path) as samples:
+            result = samples[1:]
+
+        expect([sample.sensor for sample in result]).to(equal(['b', 'c']))
+
+    def test_should_iterate_records(self):
+        with self.layout.open(self.path) as samples:
+            result = [sample.count for sample in samples]
+
+        expect(result).to(equal([1, 2, 3]))
+
+    def test_should_return_read_only_views(self):
+        with self.layout.open(self.path) as samples:
+            view = samples.view(0)
+
+        expect(view).to(have_properties(sensor='a', count=1, value=None))
+        expect(lambda: setattr(view, 'count', 2)).to(
+            raise_error(AttributeError))
+
+    def test_should_return_field_columns(self):
+        with self.layout.open(self.path) as samples:
+            expect(samples.column('sensor')).to(equal(['a', 'b', 'c']))
+            expect(samples.column('value')).to(equal([None, None, None]))
+
+    def test_should_raise_index_error_out_of_range(self):
+        with self.layout.open(self.path) as samples:
+            expect(lambda: samples[3]).to(raise_error(IndexError))
+
+    def test_should_raise_decode_error_on_layout_mismatch(self):
+        layout = records.Layout(Sample, sizes={'sensor': 8})
+
+        expect(lambda: layout.open(self.path)).to(raise_error(
+            errors.DecodeError, "layout mismatch for 'Sample'"))
+
+    def test_should_raise_decode_error_on_truncated_file(self):
+        with open(self.path, 'ab') as fp:
+            fp.write(b'\x00')
+
+        expect(lambda: self.layout.open(self.path)).to(raise_error(
+            errors.DecodeError, 'truncated records file'))
+
+    def test_should_raise_decode_error_on_other_file(self):
+        with open(self.path, 'wb') as fp:
+            fp.write(b'{}')
+
+        expect(lambda: self.layout.open(self.path)).to(raise_error(
+            errors.DecodeError, 'not a booby records file'))
+
+    def setup(self):
+        self.layout = records.Layout(Sample, sizes={'sensor': 4})
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'samples.bin')
+
+        with open(self.path, 'wb') as fp:
+            self.layout.dump([Sample(sensor='a', count=1),
+                              Sample(sensor='b', count=2),
+                              Sample(sensor='c', count=3)], fp)
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+
+class Sample(models.Model):
+    sensor = fields.String()
+    value = fields.Float()
+    count = fields.Integer()
+    active = fields.Boolean(default=False)
+
+
+class Tagged(models.Model):
+    tags = fields.List()
+
+
+class Task(models.Model):
+    status = fields.Enum(['todo', 'done'])
+    priority = fields.Enum([10, 20, 30], store_index=True)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from expects import *
+
+from booby import errors, fields, models, reports
+
+
+class TestValidationReport(object):
+    def test_should_be_valid_if_model_is_valid(self):
+        report = User(login='foo', tokens=[Token(key='a')]).validation_report()
+
+        expect(report.is_valid).to(be_true)
+        expect(report).to(have_length(0))
+
+    def test_should_collect_all_errors_with_paths_and_codes(self):
+        user = User(login=None, email='foo', role='root', karma='1',
+                    token=Token(key=1),
+                    tokens=[Token(key='a'), Token(key='b', secret=2)])
+
+        report = user.validation_report()
+
+        expect(_entries(report)).to(equal([
+            ('email', reports.EMAIL, 'should be a valid email'),
+            ('karma', reports.TYPE, 'should be an integer'),
+            ('login', reports.REQUIRED, 'is required'),
+            ('role', reports.CHOICES, "should be in ['admin', 'user']"),
+            ('token.key', reports.TYPE, 'should be a string'),
+            ('tokens[1].secret', reports.TYPE, 'should be a string')
+        ]))
+
+    def test_should_report_mistyped_models_and_lists(self):
+        user = User(login='foo', token='foo', tokens=[Token(), 'bar'])
+
+        report = user.validation_report()
+
+        expect(_entries(report)).to(equal([
+            ('token', reports.TYPE, "should be an instance of 'Token'"),
+            ('tokens[1]', reports.TYPE, "should be an instance of 'Token'")
+        ]))
+
+    def test_should_collect_custom_validator_errors(self):
+        user = User(login='foo', nickname='Foo')
+
+        report = user.validation_report()
+
+        expect(_entries(report)).to(equal([
+            ('nickname', reports.INVALID, 'should be lowercase')]))
+
+    def test_should_stop_after_max_errors(self):
+        user = User(login=None, email='foo', role='root', karma='1')
+
+        report = user.validation_report(max_errors=2)
+
+        expect(report).to(have_length(2))
+        expect(report.truncated).to(be_true)
+
+    def test_should_not_be_truncated_if_less_errors_than_max_errors(self):
+        report = User(login=None).validation_report(max_errors=2)
+
+        expect(report).to(have_length(1))
+        expect(report.truncated).to(be_false)
+
+    def test_should_collect_model_validate_errors(self):
+        report = Range(lo=2, hi=1).validation_report()
+
+        expect(report.is_valid).to(be_false)
+        expect(_entries(report)).to(equal([
+            ('', reports.INVALID, 'lo should be lower than hi')]))
+
+    def test_should_collect_embedded_model_validate_errors(self):
+        report = Span(range=Range(lo=2, hi=1)).validation_report()
+
+        expect(_entries(report)).to(equal([
+            ('range', reports.INVALID, 'lo should be lower than hi')]))
+
+    def test_should_not_call_model_validate_if_fields_are_invalid(self):
+        report = Range(lo='2', hi=1).validation_report()
+
+        expect(_entries(report)).to(equal([
+            ('lo', reports.TYPE, 'should be an integer')]))
+
+
+def _entries(report):
+    return [(entry.path, entry.code, entry.message) for entry in report]
+
+
+def lowercase(value):
+    if value is not None and value != value.lower():
+        raise errors.ValidationError('should be lowercase')
+
+
+class Token(models.Model):
+    key = fields.String()
+    secret = fields.String()
+
+
+class User(models.Model):
+    login = fields.String(required=True)
+    email = fields.Email()
+    role = fields.String(choices=['admin', 'user'], default='user')
+    karma = fields.Integer()
+    nickname = fields.String(lowercase)
+    token = fields.Embedded(Token)
+    tokens = fields.Collection(Token)
+
+
+class Range(models.Model):
+    lo = fields.Integer()
+    hi = fields.Integer()
+
+    def validate(self):
+        super(Range, self).validate()
+
+        if self.lo > self.hi:
+            raise errors.ValidationError('lo should be lower than hi')
+
+
+class Span(models.Model):
+    range = fields.Embedded(Range)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from expects import *
+
+from booby import errors, fields, models, records, shared
+
+
+class TestSharedRecords(object):
+    def test_should_index_records(self):
+        expect(self.samples).to(have_length(2))
+        expect(self.samples[0]).to(have_properties(sensor='a', value=1.0))
+        expect(self.samples[1]).to(have_properties(sensor=None, value=3.0))
+
+    def test_should_return_field_columns(self):
+        expect(self.samples.column('sensor')).to(equal(['a', None]))
+        expect(self.samples.column('value')).to(equal([1.0, 3.0]))
+
+    def test_should_attach_by_name(self):
+        attached = shared.SharedRecords.attach(self.layout, self.samples.name)
+
+        try:
+            expect(attached.view(1)).to(have_properties(value=3.0))
+            expect(attached.owner).to(be_false)
+        finally:
+            attached.close()
+
+    def test_should_attach_when_unpickled(self):
+        data = pickle.dumps(self.samples, pickle.HIGHEST_PROTOCOL)
+
+        attached = pickle.loads(data)
+
+        try:
+            expect(data).to(have_length(be_below(500)))
+            expect(attached[0]).to(have_properties(sensor='a'))
+        finally:
+            attached.close()
+
+    def test_should_raise_decode_error_on_layout_mismatch(self):
+        layout = records.Layout(Sample, sizes={'sensor': 8})
+
+        expect(lambda: shared.SharedRecords.attach(
+            layout, self.samples.name)).to(raise_error(
+                errors.DecodeError, "layout mismatch for 'Sample'"))
+
+    def test_should_not_attach_after_unlinked_on_exit(self):
+        with shared.SharedRecords.create(self.layout, []) as samples:
+            name = samples.name
+
+        expect(lambda: shared.SharedRecords.attach(self.layout, name)).to(
+            raise_error(EnvironmentError))
+
+    def setup(self):
+        self.layout = records.Layout(Sample, sizes={'sensor': 4})
+        self.samples = shared.SharedRecords.create(
+            self.layout, [Sample(sensor='a', value=1.0), Sample(value=3.0)])
+
+    def teardown(self):
+        self.samples.close()
+        self.samples.unlink()
+
+
+class Sample(models.Model):
+    sensor = fields.String()
+    value = fields.Float()
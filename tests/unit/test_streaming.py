@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+from expects import *
+
+from booby import fields, models, streaming
+
+
+class TestIterencode(object):
+    def test_should_return_same_json_as_to_json(self):
+        result = ''.join(streaming.iterencode(self.user, sort_keys=True))
+
+        expect(result).to(equal(self.user.to_json(sort_keys=True)))
+
+    def test_should_accept_json_encoder_arguments(self):
+        result = ''.join(streaming.iterencode(
+            self.user, sort_keys=True, separators=(',', ':')))
+
+        expect(result).to(equal(self.user.to_json(
+            sort_keys=True, separators=(',', ':'))))
+
+    def test_should_yield_chunks_of_about_chunk_size(self):
+        result = list(streaming.iterencode(self.user, chunk_size=16))
+
+        expect(len(result)).to(be_above(1))
+        expect(json.loads(''.join(result))).to(equal(
+            json.loads(self.user.to_json())))
+
+    def test_should_encode_lists_and_iterables_of_models(self):
+        users = [self.user, User(login='bar')]
+
+        from_list = ''.join(streaming.iterencode(users))
+        from_iterator = ''.join(streaming.iterencode(iter(users)))
+
+        expected = [json.loads(user.to_json()) for user in users]
+        expect(json.loads(from_list)).to(equal(expected))
+        expect(json.loads(from_iterator)).to(equal(expected))
+
+    def test_should_use_field_names_and_skip_read_only_fields(self):
+        account = Account(owner=self.user, id=1)
+
+        result = ''.join(streaming.iterencode(account, sort_keys=True))
+
+        expect(result).to(equal(account.to_json(sort_keys=True)))
+        expect(json.loads(result)).not_to(have_key('id'))
+
+    def test_should_fail_if_indent(self):
+        expect(lambda: list(streaming.iterencode(self.user, indent=2))).to(
+            raise_error(ValueError))
+
+    def setup(self):
+        self.user = User(
+            login='foo',
+            karma=3,
+            token=Token(key='k', secret='s'),
+            tokens=[Token(key='a'), Token(key='b')],
+            tags=['x', {'y': 1}])
+
+
+class TestDump(object):
+    def test_should_write_json_to_file_like_object(self):
+        fp = FakeFile()
+
+        self.user.to_json_stream(fp)
+
+        expect(json.loads(''.join(fp.written))).to(equal(
+            json.loads(self.user.to_json())))
+
+    def test_should_send_json_to_socket_like_object(self):
+        sock = FakeSocket()
+
+        streaming.dump(self.user, sock)
+
+        expect(json.loads(b''.join(sock.sent).decode('utf-8'))).to(equal(
+            json.loads(self.user.to_json())))
+
+    def setup(self):
+        self.user = User(login=u'foo', tokens=[Token(key=u'a')])
+
+
+class TestIterload(object):
+    def test_should_yield_elements_of_top_level_array(self):
+        result = list(streaming.iterload([b'[1, "foo", {"a": [2]}, null]']))
+
+        expect(result).to(equal([1, 'foo', {'a': [2]}, None]))
+
+    def test_should_yield_elements_split_across_chunks(self):
+        document = json.dumps([12345, {'name': u'\xf1and\xfa'}, 678],
+                              ensure_ascii=False).encode('utf-8')
+
+        result = list(streaming.iterload(_split(document, 3)))
+
+        expect(result).to(equal([12345, {'name': u'\xf1and\xfa'}, 678]))
+
+    def test_should_read_file_like_objects(self):
+        fp = FakeReadableFile(b'[{"login": "foo"}, {"login": "bar"}]')
+
+        result = list(streaming.iterload(fp, chunk_size=4))
+
+        expect(result).to(equal([{'login': 'foo'}, {'login': 'bar'}]))
+
+    def test_should_yield_nothing_if_empty_array(self):
+        expect(list(streaming.iterload([' [ ] ']))).to(equal([]))
+
+    def test_should_yield_elements_of_array_at_path(self):
+        document = b'{"meta": {"skip": [1, 2]}, "data": {"n": 1, "items": [1, 2]}}'
+
+        result = list(streaming.iterload(
+            _split(document, 5), path=('data', 'items')))
+
+        expect(result).to(equal([1, 2]))
+
+    def test_should_fail_if_path_not_found(self):
+        expect(lambda: list(streaming.iterload(['{"data": []}'], path=['items']))).to(
+            raise_error(ValueError))
+
+    def test_should_fail_if_malformed_json(self):
+        expect(lambda: list(streaming.iterload(['[1, 2 3]']))).to(
+            raise_error(ValueError))
+
+    def test_should_fail_if_members_before_path_are_not_separated(self):
+        expect(lambda: list(streaming.iterload(
+            ['{"a": 1 "data": []}'], path=['data']))).to(
+                raise_error(ValueError))
+
+    def test_should_fail_if_data_after_array(self):
+        expect(lambda: list(streaming.iterload(['[1] garbage']))).to(
+            raise_error(ValueError))
+
+    def test_should_fail_if_data_after_document_with_path(self):
+        expect(lambda: list(streaming.iterload(
+            ['{"data": [1], "n": 2} garbage'], path=['data']))).to(
+                raise_error(ValueError))
+
+    def test_should_fail_if_members_after_path_are_not_separated(self):
+        expect(lambda: list(streaming.iterload(
+            ['{"data": [1] "n": 2}'], path=['data']))).to(
+                raise_error(ValueError))
+
+    def test_should_read_elements_lazily(self):
+        def chunks():
+            yield '[1, '
+            raise AssertionError('should not be read')
+
+        expect(next(streaming.iterload(chunks()))).to(equal(1))
+
+
+class TestLoad(object):
+    def test_should_yield_decoded_models(self):
+        result = list(User.decode_stream(
+            [b'[{"login": "foo", "tokens": [{"key": "a"}]}]']))
+
+        expect(result[0]).to(be_a(User) & have_property('login', 'foo'))
+        expect(result[0].tokens[0]).to(be_a(Token))
+
+    def test_should_validate_and_collect_failures(self):
+        failures = []
+
+        result = list(User.decode_stream(
+            [b'[{"login": 1}, {"login": "foo"}]'],
+            on_error='collect', failures=failures, validate=True))
+
+        expect(result).to(have_length(1))
+        expect(failures[0][0]).to(equal(0))
+
+    def test_should_skip_elements_other_than_objects(self):
+        result = list(User.decode_stream(
+            io.BytesIO(b'[1, {"login": "foo"}, "bar"]'), on_error='skip'))
+
+        expect(result).to(have_length(1))
+        expect(result[0].login).to(equal('foo'))
+
+
+def _split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class FakeReadableFile(object):
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def read(self, size):
+        chunk = self._data[self._pos:self._pos + size]
+        self._pos += size
+
+        return chunk
+
+
+class FakeFile(object):
+    def __init__(self):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+
+class FakeSocket(object):
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+class Token(models.Model):
+    key = fields.String()
+    secret = fields.String()
+
+
+class User(models.Model):
+    login = fields.String()
+    karma = fields.Integer()
+    token = fields.Embedded(Token)
+    tokens = fields.Collection(Token)
+    tags = fields.List()
+
+
+class Account(models.Model):
+    owner = fields.Embedded(User, name='accountOwner')
+    id = fields.Integer(read_only=True)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from expects import *
+
+from booby import validators, fields, models, errors
+
+
+class TestRequired(object):
+    def test_should_return_positions_of_none_values(self):
+        result = validators.Required().validate_many(['foo', None, 'bar', None])
+
+        expect(result).to(equal({1: 'is required', 3: 'is required'}))
+
+
+class TestIn(object):
+    def test_should_return_positions_of_values_not_in_choices(self):
+        result = validators.In(['foo', 'bar']).validate_many(['foo', 'baz'])
+
+        expect(result).to(have_keys(1))
+        expect(result[1]).to(contain('should be in'))
+
+    def test_should_check_unhashable_values(self):
+        result = validators.In([['foo'], 'bar']).validate_many(
+            [['foo'], ['baz'], 'bar'])
+
+        expect(result).to(have_keys(1))
+        expect(result).not_to(have_keys(0, 2))
+
+
+class TestTypes(object):
+    def test_should_return_positions_of_values_of_other_type(self):
+        result = validators.String().validate_many(['foo', 1, None, 2.0])
+
+        expect(result).to(equal({1: 'should be a string',
+                                 3: 'should be a string'}))
+
+    def test_should_return_empty_dict_if_all_values_validate(self):
+        result = validators.Integer().validate_many([1, None, 2])
+
+        expect(result).to(equal({}))
+
+
+class TestEmail(object):
+    def test_should_return_positions_of_non_strings_and_invalid_emails(self):
+        result = validators.Email().validate_many(
+            ['foo@example.com', 1, '@example', None])
+
+        expect(result).to(equal({1: 'should be a string',
+                                 2: 'should be a valid email'}))
+
+
+class TestModel(object):
+    def test_should_return_positions_of_invalid_models(self):
+        result = validators.Model(User).validate_many(
+            [User(name='foo'), User(name=1), object()])
+
+        expect(result).to(equal({
+            1: 'name should be a string',
+            2: "should be an instance of 'User'"
+        }))
+
+
+class TestFieldValidateMany(object):
+    def test_should_return_first_error_of_each_value(self):
+        field = fields.String(required=True, choices=['foo', 'bar'])
+
+        result = field.validate_many(['foo', None, 'baz', 1])
+
+        expect(result).to(have_keys(1, 2, 3))
+        expect(result[1]).to(equal('is required'))
+        expect(result[3]).to(contain('should be in'))
+
+    def test_should_not_pass_failing_values_to_next_validators(self):
+        def validator(value):
+            if not value.startswith('f'):
+                raise errors.ValidationError('should start with f')
+
+        field = fields.String(validator)
+
+        result = field.validate_many(['foo', 1, 'bar'])
+
+        expect(result).to(equal({1: 'should be a string',
+                                 2: 'should start with f'}))
+
+    def test_should_run_validate_of_subclassed_builtin_validators(self):
+        field = fields.Field(Slug())
+
+        result = field.validate_many(['foo', 'a b', None])
+
+        expect(result).to(equal({1: 'should be a slug'}))
+
+    def test_model_should_run_validate_of_subclassed_builtin_validators(self):
+        result = Page.validate_many([Page(slug='foo'), Page(slug='a b')])
+
+        expect(result.valid).to(equal([True, False]))
+        expect(result.errors).to(equal({1: {'slug': 'should be a slug'}}))
+
+
+class Slug(validators.String):
+    def validate(self, value):
+        super(Slug, self).validate(value)
+
+        if value is not None and ' ' in value:
+            raise errors.ValidationError('should be a slug')
+
+
+class User(models.Model):
+    name = fields.String()
+
+
+class Page(models.Model):
+    slug = fields.Field(Slug())
@@ -29,6 +29,24 @@ class TestIn(object):
     def test_when_value_is_in_choices_then_does_not_raise(self):
         self.validator('bar')
 
+    def test_when_value_is_unhashable_then_raises_validation_error(self):
+        expect(lambda: self.validator(['foo'])).to(raise_error(
+            errors.ValidationError))
+
+    def test_when_choices_are_unhashable_then_compares_values(self):
+        validator = validators.In([['foo'], ['bar']])
+
+        validator(['bar'])
+
+    def test_when_choices_change_then_validates_against_new_choices(self):
+        choices = ['foo']
+        validator = validators.In(choices)
+        choices.append('bar')
+
+        validator('bar')
+        expect(lambda: validator('baz')).to(raise_error(
+            errors.ValidationError, match("should be in \[u?'foo', u?'bar'\]")))
+
     def setup(self):
         self.validator = validators.In(['foo', 'bar'])
 